@@ -4,23 +4,60 @@ import os
 # Mevcut dizini Python path'ine ekle
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from flask import Flask, jsonify, request
+from flask import Flask, Response, jsonify, request
 from flask_cors import CORS
 import json
+import time
 import uuid
 from datetime import datetime
 
 from config import Config
 from blockchain import Blockchain
-from mining import MiningEngine, DifficultyManager
+from mining import MiningEngine, DifficultyManager, MiningCancelled
+from mining_jobs import MiningScheduler
+from consensus import POA
+from benchmark import MiningBenchmark
+from metrics import mining_metrics
 from iot_oximeter import OximeterManager
 from database import DatabaseManager
+from response_cache import ResponseCache
 from auth import AuthService, token_required, admin_required, doctor_or_admin_required
 from models.patient import Patient
 from models.doctor import Doctor
 from models.admin import Admin
 from models.medical_data import OximeterData, SleepApneaRecord
 
+def _is_int(value):
+    """JSON değeri tam sayı mı (bool ve "3" gibi metinler kabul edilmez)"""
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def _int_list_param(params, name, default, low, high, max_items):
+    """
+    İstek gövdesindeki tam sayı listesini doğrular
+    
+    Args:
+        params (dict): JSON istek gövdesi
+        name (str): Alan adı
+        default (list): Alan yoksa kullanılacak değer
+        low (int): En küçük değer
+        high (int): En büyük değer
+        max_items (int): Listedeki en fazla eleman
+    
+    Returns:
+        list: Doğrulanmış liste
+    
+    Raises:
+        ValueError: Alan boş olmayan, sınırlar içinde tam sayı listesi değilse
+    """
+    values = params.get(name, default)
+    if not isinstance(values, list) or not values or len(values) > max_items:
+        raise ValueError(f"{name} 1-{max_items} elemanlı bir liste olmalı")
+    if not all(_is_int(value) and low <= value <= high for value in values):
+        raise ValueError(f"{name} elemanları {low}-{high} arası tam sayı olmalı")
+    return values
+
+
 class LightMedChainAPI:
     """LightMedChain API Servisi - Makaledeki Flask uygulaması"""
     
@@ -33,10 +70,14 @@ class LightMedChainAPI:
         self.database = DatabaseManager()
         # Sistem bileşenlerini başlat
         self.blockchain = Blockchain(database_manager=self.database)
+        self.mining_scheduler = MiningScheduler(self.blockchain)
         self.oximeter_manager = OximeterManager()
-        self.mining_engine = MiningEngine()
-        self.difficulty_manager = DifficultyManager()
+        self.mining_engine = MiningEngine(hash_algorithm=self.blockchain.hash_algorithm)
+        self.difficulty_manager = DifficultyManager(mining_engine=self.mining_engine)
+        # Süre tahminleri için hash hızı arka planda ölçülür; ilk GET isteği ölçümü beklemez
+        self.difficulty_manager.calibrate_in_background()
         self.auth_service = AuthService()
+        self.response_cache = ResponseCache()
         
         # API route'larını tanımla
         self.setup_routes()
@@ -122,32 +163,226 @@ class LightMedChainAPI:
         # Blockchain routes
         @self.app.route('/api/blockchain/status', methods=['GET'])
         def get_blockchain_status():
-            """Blockchain durumunu getirir"""
-            stats = self.blockchain.get_chain_stats()
-            return jsonify(stats)
+            """Blockchain durumunu getirir (If-None-Match: değişmediyse 304)"""
+            return self.conditional_response(
+                'status', lambda: self.app.json.dumps(self.blockchain.get_chain_stats()).encode())
+        
+        @self.app.route('/api/blockchain/verify', methods=['POST'])
+        @admin_required
+        def verify_blockchain():
+            """Tüm zinciri baştan doğrular (artımlı doğrulama işaretini sıfırlar)
+            
+            Query: mode=parallel|serial (varsayılan parallel), workers (varsayılan VERIFY_WORKERS,
+            en fazla çekirdek sayısı),
+            deep=true (saklanan kanonik byte'lar yerine bellekteki kayıtlar yeniden serileştirilir)
+            """
+            try:
+                mode = request.args.get('mode', 'parallel')
+                if mode not in ('parallel', 'serial'):
+                    return jsonify({"error": "mode parallel veya serial olmalı"}), 400
+                workers = request.args.get('workers', Config.VERIFY_WORKERS, type=int) if mode == 'parallel' else 1
+                if workers < 1:
+                    return jsonify({"error": "workers pozitif olmalı"}), 400
+                # Her süreç zincirin bir kopyasını alır; çekirdekten fazla süreç açılmaz
+                workers = min(workers, os.cpu_count() or 1)
+                deep = request.args.get('deep', 'false').lower() == 'true'
+                report = self.blockchain.verify_chain(full=True, workers=workers, deep=deep)
+                return jsonify(report), 200 if report['valid'] else 409
+            except Exception as e:
+                return jsonify({"error": str(e)}), 500
+        
+        @self.app.route('/api/blockchain/checkpoint', methods=['POST'])
+        @admin_required
+        def create_checkpoint():
+            """Doğrulanmış zincir ucuna kontrol noktası ekler (düğüm anahtarı varsa imzalı)"""
+            checkpoint = self.blockchain.create_checkpoint()
+            if not checkpoint:
+                return jsonify({"error": "Kontrol noktası oluşturulamadı (zincir geçersiz ya da veritabanı yok)"}), 409
+            return jsonify({
+                "message": "Kontrol noktası oluşturuldu",
+                "checkpoint": checkpoint
+            })
         
         @self.app.route('/api/blockchain/chain', methods=['GET'])
         def get_full_chain():
-            """Tam blockchain'i getirir"""
-            chain_data = self.blockchain.to_dict()
-            return jsonify(chain_data)
+            """Blockchain'i getirir - tamamı, sayfalı, NDJSON akışı veya ikili
+            
+            Query: from (başlangıç yüksekliği), limit (1-1000), headers_only=true,
+            format=ndjson|binary (Accept: application/x-ndjson veya application/octet-stream)
+            
+            from/limit/headers_only verilmezse tam zincir eski biçimiyle, parça parça akıtılır.
+            """
+            output = request.args.get('format') or {
+                'application/x-ndjson': 'ndjson',
+                'application/octet-stream': 'binary'
+            }.get(request.accept_mimetypes.best_match(
+                ['application/json', 'application/x-ndjson', 'application/octet-stream']), 'json')
+            # Aynı sorgu farklı Accept başlığıyla farklı biçimde dönebilir
+            variant = f"chain:{output}:{request.query_string.decode()}"
+            
+            start = request.args.get('from', 0, type=int)
+            if start < 0:
+                return jsonify({"error": "from negatif olamaz"}), 400
+            headers_only = request.args.get('headers_only', 'false').lower() == 'true'
+            limit = request.args.get('limit', type=int)
+            if limit is not None and limit < 1:
+                return jsonify({"error": "limit pozitif olmalı"}), 400
+            
+            if output == 'binary':
+                # Bloklar tek tek kodlanıp akıtılır; limit verilmezse zincirin sonuna kadar (headers_only uygulanmaz)
+                stop = start + limit if limit is not None else None
+                response = self.conditional_response(
+                    variant, lambda: self.blockchain.iter_binary(start, stop),
+                    mimetype='application/octet-stream', cache=False)
+                response.headers['X-Hash-Algorithm'] = self.blockchain.hash_algorithm
+                response.headers['X-Difficulty-Bits'] = str(self.blockchain.difficulty_bits)
+                response.headers['X-Chain-Height'] = str(len(self.blockchain.chain))
+                response.vary.add('Accept')
+                return response
+            
+            if output == 'ndjson':
+                # Her satır bir blok; limit verilmezse zincirin sonuna kadar akar
+                stop = start + limit if limit is not None else None
+                response = self.conditional_response(
+                    variant,
+                    lambda: (encoded + b'\n' for encoded in self.blockchain.iter_block_json(start, stop, headers_only)),
+                    mimetype='application/x-ndjson', cache=False)
+                response.headers['X-Chain-Height'] = str(len(self.blockchain.chain))
+                response.vary.add('Accept')
+                return response
+            
+            if any(name in request.args for name in ('from', 'limit', 'headers_only')):
+                limit = Config.CHAIN_PAGE_SIZE if limit is None else limit
+                if limit > Config.CHAIN_PAGE_MAX_SIZE:
+                    return jsonify({"error": f"limit 1-{Config.CHAIN_PAGE_MAX_SIZE} arası olmalı"}), 400
+                response = self.conditional_response(
+                    variant, lambda: self.blockchain.get_chain_page(start, limit, headers_only))
+                response.vary.add('Accept')
+                return response
+            
+            # Blok JSON'ları bir kez üretilip saklanır; yanıt bu parçalardan akıtılır
+            response = self.conditional_response(variant, self.blockchain.iter_json_chunks, cache=False)
+            response.vary.add('Accept')
+            return response
+        
+        @self.app.route('/api/blockchain/block/<block_hash>', methods=['GET'])
+        def get_block_by_hash(block_hash):
+            """Hash değerine göre bloğu indeksten getirir"""
+            block = self.blockchain.get_block_by_hash(block_hash)
+            if not block:
+                return jsonify({"error": "Blok bulunamadı"}), 404
+            return jsonify(block.to_dict())
+        
+        @self.app.route('/api/blockchain/record/<record_id>', methods=['GET'])
+        @token_required
+        def get_record_by_id(record_id):
+            """record_id veya data_id ile zincirdeki kaydı ve bloğunu getirir"""
+            results = self.blockchain.find_record(record_id)
+            if not results:
+                return jsonify({"error": "Kayıt zincirde bulunamadı"}), 404
+            return jsonify({
+                "record_id": record_id,
+                "records": results
+            })
+        
+        @self.app.route('/api/blockchain/record/<record_id>/proof', methods=['GET'])
+        @token_required
+        def get_record_proof(record_id):
+            """Kaydı Merkle dahil olma kanıtı ve başlık zinciriyle getirir (?anchor=<güvenilen blok hash'i>)"""
+            results = self.blockchain.find_record(record_id)
+            if not results:
+                return jsonify({"error": "Kayıt zincirde bulunamadı"}), 404
+            
+            try:
+                proofs = [
+                    self.blockchain.get_record_proof(result['block_index'], result['position'],
+                                                     request.args.get('anchor'))
+                    for result in results
+                ]
+            except ValueError as e:
+                return jsonify({"error": str(e)}), 400
+            
+            return jsonify({
+                "record_id": record_id,
+                "proofs": proofs
+            })
         
         @self.app.route('/api/blockchain/mine', methods=['POST'])
         def mine_block():
-            """Yeni blok madenci"""
+            """Yeni blok madenciliğini arka planda başlatır (?wait=true ile senkron çalışır, PoA'da hep senkron)"""
             try:
-                mined_block = self.blockchain.mine_pending_data()
-                if mined_block:
+                max_seconds = request.args.get('max_seconds', type=float)
+                max_hashes = request.args.get('max_hashes', type=int)
+                
+                # PoA'da nonce araması yok - blok istek içinde milisaniyeler içinde mühürlenir
+                if self.blockchain.consensus == POA:
+                    sealed_block = self.blockchain.mine_pending_data()
+                    if not sealed_block:
+                        return jsonify({"error": "Madencilik için veri yok"}), 400
                     return jsonify({
-                        "message": "Blok başarıyla madenci!",
-                        "block": mined_block.to_dict(),
+                        "message": "Blok yetkili imzasıyla mühürlendi!",
+                        "consensus": POA,
+                        "block": sealed_block.to_dict(),
                         "chain_length": self.blockchain.get_chain_length()
                     })
-                else:
+                
+                if request.args.get('wait', 'false').lower() == 'true':
+                    deadline = time.time() + max_seconds if max_seconds else None
+                    try:
+                        mined_block = self.blockchain.mine_pending_data(deadline=deadline, max_hashes=max_hashes)
+                    except MiningCancelled as e:
+                        return jsonify({"error": str(e), "cancel_reason": e.reason}), 409
+                    if mined_block:
+                        return jsonify({
+                            "message": "Blok başarıyla madenci!",
+                            "block": mined_block.to_dict(),
+                            "chain_length": self.blockchain.get_chain_length()
+                        })
+                    else:
+                        return jsonify({"error": "Madencilik için veri yok"}), 400
+                
+                if not self.blockchain.mempool:
                     return jsonify({"error": "Madencilik için veri yok"}), 400
+                
+                job = self.mining_scheduler.submit(max_seconds=max_seconds, max_hashes=max_hashes)
+                return jsonify({
+                    "message": "Madencilik işi kuyruğa alındı",
+                    "job_id": job.job_id,
+                    "status": job.status,
+                    "status_url": f"/api/blockchain/mine/jobs/{job.job_id}"
+                }), 202
             except Exception as e:
                 return jsonify({"error": str(e)}), 500
         
+        @self.app.route('/api/blockchain/mine/jobs', methods=['GET'])
+        def list_mining_jobs():
+            """Son madencilik işlerini listeler"""
+            return jsonify({"jobs": self.mining_scheduler.list_jobs()})
+        
+        @self.app.route('/api/blockchain/mine/jobs/<job_id>', methods=['GET'])
+        def get_mining_job(job_id):
+            """Madencilik işinin durumunu, ilerlemesini ve sonuç bloğunu getirir"""
+            job = self.mining_scheduler.get_job(job_id)
+            if not job:
+                return jsonify({"error": "Madencilik işi bulunamadı"}), 404
+            
+            job_data = job.to_dict()
+            job_data["chain_length"] = self.blockchain.get_chain_length()
+            return jsonify(job_data)
+        
+        @self.app.route('/api/blockchain/mine/jobs/<job_id>', methods=['DELETE'])
+        @admin_required
+        def cancel_mining_job(job_id):
+            """Kuyruktaki ya da çalışan madencilik işini iptal eder"""
+            job = self.mining_scheduler.cancel_job(job_id)
+            if not job:
+                return jsonify({"error": "Madencilik işi bulunamadı"}), 404
+            
+            return jsonify({
+                "message": "Madencilik işi için iptal istendi",
+                "job": job.to_dict()
+            })
+        
         # Medical Data routes
         @self.app.route('/api/medical-data/record', methods=['POST'])
         @token_required
@@ -208,6 +443,46 @@ class LightMedChainAPI:
             except Exception as e:
                 return jsonify({"error": str(e)}), 500
         
+        @self.app.route('/api/medical-data/range', methods=['GET'])
+        @token_required
+        def get_medical_data_range():
+            """Zincirdeki kayıtları zaman aralığına göre, zaman sırasıyla ve sayfalı getirir
+            
+            Query: start, end (ISO 8601, [start, end)), patient_id, limit (1-1000), cursor
+            """
+            try:
+                start = request.args.get('start')
+                end = request.args.get('end')
+                for value in (start, end):
+                    if value:
+                        datetime.fromisoformat(value)
+            except ValueError:
+                return jsonify({"error": "start ve end ISO 8601 formatında olmalı"}), 400
+            
+            limit = request.args.get('limit', 100, type=int)
+            if limit < 1 or limit > 1000:
+                return jsonify({"error": "limit 1-1000 arası olmalı"}), 400
+            
+            try:
+                page = self.blockchain.query_records_by_time(
+                    start=start,
+                    end=end,
+                    patient_id=request.args.get('patient_id'),
+                    limit=limit,
+                    cursor=request.args.get('cursor')
+                )
+            except ValueError as e:
+                return jsonify({"error": str(e)}), 400
+            
+            return jsonify({
+                "start": start,
+                "end": end,
+                "patient_id": request.args.get('patient_id'),
+                "count": len(page['records']),
+                "records": page['records'],
+                "next_cursor": page['next_cursor']
+            })
+        
         # Oximeter IoT routes
         @self.app.route('/api/oximeter/scan', methods=['GET'])
         @token_required
@@ -248,9 +523,52 @@ class LightMedChainAPI:
         # Mining ve Difficulty routes
         @self.app.route('/api/mining/difficulty', methods=['GET'])
         def get_difficulty_levels():
-            """Tüm zorluk seviyelerini getirir"""
-            levels = self.difficulty_manager.get_all_difficulty_levels()
-            return jsonify(levels)
+            """Tüm zorluk seviyelerini bu makine için süre tahminleriyle getirir
+            
+            Query: target_latency (saniye), payload_size (kayıt)
+            """
+            try:
+                target_latency = request.args.get('target_latency', Config.TARGET_BLOCK_TIME, type=float)
+                payload_size = request.args.get('payload_size', 10, type=int)
+                if self.difficulty_manager.calibration is None:
+                    return self.calibration_pending_response()
+                
+                levels = self.difficulty_manager.get_all_difficulty_levels(payload_size, target_latency)
+                return jsonify(levels)
+            
+            except Exception as e:
+                return jsonify({"error": str(e)}), 500
+        
+        @self.app.route('/api/mining/difficulty/advisor', methods=['GET'])
+        def get_difficulty_advice():
+            """Gecikme bütçesine uyan zorluğu ve bit x veri boyutu tahmin tablosunu getirir
+            
+            Query: target_latency, payload_size, quantile (expected|p50|p95|p99)
+            """
+            try:
+                target_latency = request.args.get('target_latency', Config.TARGET_BLOCK_TIME, type=float)
+                payload_size = request.args.get('payload_size', 10, type=int)
+                quantile = request.args.get('quantile', 'p95')
+                if quantile not in ('expected', 'p50', 'p95', 'p99'):
+                    return jsonify({"error": "quantile expected, p50, p95 veya p99 olmalı"}), 400
+                if self.difficulty_manager.calibration is None:
+                    return self.calibration_pending_response()
+                
+                recommendation = self.difficulty_manager.recommend_difficulty(target_latency, payload_size, quantile)
+                predictions = [
+                    self.difficulty_manager.predict_mining_time(bits, size)
+                    for bits in range(Config.MIN_DIFFICULTY_BITS, Config.MAX_DIFFICULTY_BITS + 1)
+                    for size in sorted({payload_size, *DifficultyManager.CALIBRATION_PAYLOAD_SIZES})
+                ]
+                
+                return jsonify({
+                    "recommendation": recommendation,
+                    "current_difficulty_bits": self.blockchain.difficulty_bits,
+                    "predictions": predictions
+                })
+            
+            except Exception as e:
+                return jsonify({"error": str(e)}), 500
         
         @self.app.route('/api/mining/difficulty/<int:level>', methods=['POST'])
         @admin_required
@@ -262,6 +580,7 @@ class LightMedChainAPI:
                 
                 self.blockchain.difficulty = level
                 self.mining_engine.difficulty = level
+                self.mining_engine.difficulty_bits = None
                 
                 settings = self.difficulty_manager.get_difficulty_settings(level)
                 
@@ -269,32 +588,91 @@ class LightMedChainAPI:
                     "message": f"Zorluk seviyesi {level} olarak ayarlandı",
                     "settings": settings
                 })
+            
+            except Exception as e:
+                return jsonify({"error": str(e)}), 500
+        
+        @self.app.route('/api/mining/difficulty/calibrate', methods=['POST'])
+        @admin_required
+        def recalibrate_difficulty():
+            """Bu makinenin hash hızını yeniden ölçer (süre tahminleri bu ölçüme dayanır)"""
+            try:
+                calibration = self.difficulty_manager.calibrate()
+                return jsonify({
+                    "message": "Zorluk kalibrasyonu yenilendi",
+                    "calibration": calibration
+                })
+            
+            except Exception as e:
+                return jsonify({"error": str(e)}), 500
+        
+        @self.app.route('/api/mining/difficulty/bits/<int:bits>', methods=['POST'])
+        @admin_required
+        def set_difficulty_bits(bits):
+            """Zorluğu leading-zero bit sayısı olarak ayarlar"""
+            try:
+                if bits < Config.MIN_DIFFICULTY_BITS or bits > Config.MAX_DIFFICULTY_BITS:
+                    return jsonify({"error": f"Bit zorluğu {Config.MIN_DIFFICULTY_BITS}-{Config.MAX_DIFFICULTY_BITS} arası olmalı"}), 400
                 
+                self.blockchain.set_difficulty_bits(bits)
+                self.mining_engine.difficulty_bits = bits
+                
+                settings = self.difficulty_manager.get_bit_difficulty_settings(bits)
+                
+                return jsonify({
+                    "message": f"Zorluk {bits} bit olarak ayarlandı",
+                    "settings": settings,
+                    "retarget_enabled": self.blockchain.retarget
+                })
+            
             except Exception as e:
                 return jsonify({"error": str(e)}), 500
         
         @self.app.route('/api/mining/benchmark', methods=['POST'])
         @admin_required
         def run_benchmark():
-            """Performans benchmark testi çalıştırır"""
+            """Tekrarlı denemelerle madencilik benchmark'ı çalıştırır"""
             try:
-                # Test verisi oluştur
-                test_data = {
-                    "test_type": "performance_benchmark",
-                    "timestamp": datetime.now().isoformat(),
-                    "data_points": 10
-                }
+                params = request.get_json(silent=True)
+                if params is None:
+                    params = {}
+                if not isinstance(params, dict):
+                    return jsonify({"error": "İstek gövdesi JSON nesnesi olmalı"}), 400
+                
+                trials = params.get('trials', 5)
+                if not _is_int(trials) or trials < 1 or trials > 100:
+                    return jsonify({"error": "Deneme sayısı 1-100 arası tam sayı olmalı"}), 400
+                max_seconds = params.get('max_seconds', Config.BENCHMARK_MAX_SECONDS)
+                if (not isinstance(max_seconds, (int, float)) or isinstance(max_seconds, bool)
+                        or max_seconds <= 0 or max_seconds > Config.BENCHMARK_MAX_SECONDS):
+                    return jsonify({"error": f"max_seconds 0-{Config.BENCHMARK_MAX_SECONDS:g} saniye arası olmalı"}), 400
                 
-                # Tüm zorluk seviyelerinde test et
-                results = self.mining_engine.benchmark_difficulty_levels(
-                    index=self.blockchain.get_chain_length(),
-                    timestamp=datetime.now().isoformat(),
-                    data=test_data,
-                    previous_hash=self.blockchain.get_latest_block().hash
+                try:
+                    levels = _int_list_param(params, 'levels', [1, 2, 3, 4], 1, 5, 5)
+                    bits = None
+                    if params.get('bits') is not None:
+                        bits = _int_list_param(params, 'bits', None, 1, 24, 24)
+                    payload_sizes = _int_list_param(params, 'payload_sizes', [1, 10, 100], 1,
+                                                    Config.BENCHMARK_MAX_PAYLOAD_SIZE, 10)
+                except ValueError as e:
+                    return jsonify({"error": str(e)}), 400
+                
+                cells = len(set(bits or levels)) * len(set(payload_sizes))
+                if cells > Config.BENCHMARK_MAX_CELLS:
+                    return jsonify({"error": f"En fazla {Config.BENCHMARK_MAX_CELLS} zorluk x veri boyutu hücresi çalıştırılabilir"}), 400
+                
+                # Süre bütçesi dolunca süren deneme durur, kalan hücreler raporda atlanmış görünür
+                benchmark = MiningBenchmark(
+                    trials=trials,
+                    levels=levels,
+                    bits=bits,
+                    payload_sizes=payload_sizes,
+                    workers=self.mining_engine.workers,
+                    max_seconds=max_seconds
                 )
                 
                 return jsonify({
-                    "benchmark_results": results
+                    "benchmark_results": benchmark.run()
                 })
                 
             except Exception as e:
@@ -310,13 +688,79 @@ class LightMedChainAPI:
             performance_data = {
                 "blockchain": chain_stats,
                 "mining_difficulty": self.blockchain.difficulty,
+                "mining_difficulty_bits": self.blockchain.difficulty_bits,
                 "connected_devices": self.oximeter_manager.get_connected_devices(),
-                "pending_transactions": len(self.blockchain.pending_data),
+                "pending_transactions": len(self.blockchain.mempool),
+                "mempool": self.blockchain.mempool.stats(),
+                "mining_metrics": mining_metrics.snapshot(),
+                "response_cache": self.response_cache.stats(),
                 "system_uptime": "active",
                 "timestamp": datetime.now().isoformat()
             }
             
             return jsonify(performance_data)
+        
+        @self.app.route('/metrics', methods=['GET'])
+        def prometheus_metrics():
+            """Madencilik metriklerini Prometheus metin formatında döndürür"""
+            body = mining_metrics.to_prometheus(extra_gauges={
+                'lightmedchain_chain_length': self.blockchain.get_chain_length(),
+                'lightmedchain_pending_records': len(self.blockchain.mempool),
+                'lightmedchain_difficulty_bits': self.blockchain.difficulty_bits
+            })
+            return Response(body, mimetype='text/plain; version=0.0.4')
+    
+    def conditional_response(self, variant, build, mimetype='application/json', cache=True):
+        """
+        Okuma uç noktaları için ETag/If-None-Match destekli yanıt üretir
+        
+        ETag zincir sürüm anahtarından (Blockchain.read_version) hesaplanır; istemcinin
+        ETag'i güncelse gövde hiç üretilmeden 304 döner. cache=True ise üretilen gövde
+        sürüm anahtarı değişene kadar ResponseCache'te saklanır.
+        
+        Args:
+            variant (str): Yanıt biçimi (yol, sorgu, çıktı türü)
+            build (callable): Gövdeyi üreten fonksiyon (bytes veya bytes üreteci)
+            mimetype (str): Yanıt türü
+            cache (bool): Gövde saklansın mı (yalnızca boyutu sınırlı yanıtlar)
+        
+        Returns:
+            Response: 200 veya 304 yanıtı
+        """
+        version = self.blockchain.read_version()
+        etag = ResponseCache.etag(version, variant)
+        
+        if request.if_none_match.contains_weak(etag):
+            self.response_cache.not_modified += 1
+            response = Response(status=304)
+        else:
+            body = self.response_cache.get(version, variant) if cache else None
+            if body is None:
+                body = build()
+                if cache:
+                    self.response_cache.put(version, variant, body)
+            response = Response(body, mimetype=mimetype)
+        
+        # İstemciler her yoklamada ETag ile yeniden doğrular
+        response.set_etag(etag)
+        response.headers['Cache-Control'] = 'no-cache'
+        return response
+    
+    def calibration_pending_response(self):
+        """
+        Zorluk kalibrasyonu henüz bitmediğinde dönülen 503 yanıtı
+        
+        Returns:
+            tuple: (Response, 503)
+        """
+        manager = self.difficulty_manager
+        if manager.is_calibrating():
+            response = jsonify({"error": "Zorluk kalibrasyonu sürüyor, birazdan tekrar deneyin"})
+        else:
+            response = jsonify({"error": "Zorluk kalibrasyonu yapılamadı",
+                                "calibration_error": manager.calibration_error})
+        response.headers['Retry-After'] = '1'
+        return response, 503
     
     def create_test_data(self):
         """Test verileri oluşturur (geliştirme için)"""
@@ -379,19 +823,31 @@ class LightMedChainAPI:
         print("   POST /api/auth/verify         - Token doğrulama")
         print("   BLOCKCHAIN:")
         print("   GET  /api/blockchain/status   - Blockchain durumu")
-        print("   GET  /api/blockchain/chain    - Tam blockchain")
-        print("   POST /api/blockchain/mine     - Yeni blok madenci")
+        print("   GET  /api/blockchain/chain    - Blockchain (?from=&limit=&headers_only=: sayfalı, ?format=ndjson|binary)")
+        print("   POST /api/blockchain/verify   - Tüm zinciri yeniden doğrula (admin)")
+        print("   POST /api/blockchain/checkpoint - Kontrol noktası oluştur (admin)")
+        print("   GET  /api/blockchain/block/<hash> - Hash ile blok")
+        print("   GET  /api/blockchain/record/<id> - record_id/data_id ile kayıt")
+        print("   GET  /api/blockchain/record/<id>/proof - Merkle dahil olma kanıtı")
+        print("   POST /api/blockchain/mine     - Yeni blok madenciliği (arka plan işi)")
+        print("   GET  /api/blockchain/mine/jobs/<id> - Madencilik işi durumu")
+        print("   DELETE /api/blockchain/mine/jobs/<id> - Madencilik işini iptal et")
         print("   MEDICAL DATA:")
         print("   POST /api/medical-data/record - Tıbbi veri kaydet")
         print("   GET  /api/medical-data/patient/<id> - Hasta verileri")
+        print("   GET  /api/medical-data/range  - Zaman aralığındaki kayıtlar (sayfalı)")
         print("   OXIMETER:")
         print("   GET  /api/oximeter/scan       - Cihazları tara")
         print("   POST /api/oximeter/connect    - Cihaza bağlan")
         print("   MINING:")
-        print("   GET  /api/mining/difficulty   - Zorluk seviyeleri")
+        print("   GET  /api/mining/difficulty   - Zorluk seviyeleri ve süre tahminleri")
+        print("   GET  /api/mining/difficulty/advisor - Gecikme bütçesine göre zorluk önerisi")
+        print("   POST /api/mining/difficulty/calibrate - Hash hızını yeniden ölç (admin)")
+        print("   POST /api/mining/difficulty/bits/<n> - Bit cinsinden zorluk")
         print("   POST /api/mining/benchmark    - Performans testi")
         print("   SYSTEM:")
         print("   GET  /api/system/performance  - Sistem performansı")
+        print("   GET  /metrics                 - Prometheus metrikleri")
         
         self.app.run(host=host, port=port, debug=debug)
 
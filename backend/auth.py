@@ -239,17 +239,22 @@ def token_required(f):
     return decorated
 
 
+def _token_checked(*args, **kwargs):
+    """token_required ile sarılan boş fonksiyon - yalnızca token doğrulaması yapılır"""
+    return None
+
+
 def admin_required(f):
     """
     Admin yetkisi gerektiren endpoint'ler için decorator
     """
     @wraps(f)
     def decorated(*args, **kwargs):
-        # Önce token kontrolü
-        token_response = token_required(f)(*args, **kwargs)
+        # Önce token kontrolü - endpoint yetki kontrolünden önce çalıştırılmaz
+        token_response = token_required(_token_checked)(*args, **kwargs)
         
         # Eğer token hatası varsa direkt dön
-        if isinstance(token_response, tuple) and token_response[1] != 200:
+        if token_response is not None:
             return token_response
         
         # Admin kontrolü
@@ -267,11 +272,11 @@ def doctor_or_admin_required(f):
     """
     @wraps(f)
     def decorated(*args, **kwargs):
-        # Önce token kontrolü
-        token_response = token_required(f)(*args, **kwargs)
+        # Önce token kontrolü - endpoint yetki kontrolünden önce çalıştırılmaz
+        token_response = token_required(_token_checked)(*args, **kwargs)
         
         # Eğer token hatası varsa direkt dön
-        if isinstance(token_response, tuple) and token_response[1] != 200:
+        if token_response is not None:
             return token_response
         
         # Doktor veya Admin kontrolü
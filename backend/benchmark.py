@@ -0,0 +1,418 @@
+# Madencilik benchmark aracı - Tekrarlı denemeler, istatistikler ve JSON çıktı
+import argparse
+import hashlib
+import json
+import math
+import platform
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+
+from config import Config
+from block import Block
+from mining import HASH_ALGORITHMS, MiningEngine, block_hash_prefix, difficulty_bits_for_level, get_hash_function
+
+
+def percentile(sorted_values, q):
+    """
+    Sıralı listede doğrusal enterpolasyonla yüzdelik hesaplar
+    
+    Args:
+        sorted_values (list): Küçükten büyüğe sıralı değerler
+        q (float): Yüzdelik (0-100)
+    
+    Returns:
+        float: Yüzdelik değeri
+    """
+    if not sorted_values:
+        return None
+    position = (len(sorted_values) - 1) * q / 100
+    lower = math.floor(position)
+    upper = math.ceil(position)
+    if lower == upper:
+        return sorted_values[lower]
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
+
+
+def summarize(values):
+    """
+    Örnek listesi için özet istatistikler üretir
+    
+    Args:
+        values (list): Ölçüm değerleri
+    
+    Returns:
+        dict: mean, stdev, min, max, p50, p95, p99
+    """
+    ordered = sorted(values)
+    count = len(ordered)
+    mean = sum(ordered) / count
+    variance = sum((v - mean) ** 2 for v in ordered) / (count - 1) if count > 1 else 0.0
+    return {
+        'samples': count,
+        'mean': mean,
+        'stdev': math.sqrt(variance),
+        'min': ordered[0],
+        'max': ordered[-1],
+        'p50': percentile(ordered, 50),
+        'p95': percentile(ordered, 95),
+        'p99': percentile(ordered, 99)
+    }
+
+
+class MiningBenchmark:
+    """Madencilik benchmark'ı - Her zorluk ve veri boyutu için N tekrarlı deneme
+    
+    PoW süresi geometrik dağıldığından tek ölçüm gürültüdür; her hücre için
+    ortalama ve yüzdelikler ile beklenen (2^bits) ve gözlenen deneme sayısı
+    raporlanır.
+    """
+    
+    DEFAULT_LEVELS = (1, 2, 3, 4, 5)
+    DEFAULT_PAYLOAD_SIZES = (1, 10, 100)
+    
+    def __init__(self, trials=10, levels=DEFAULT_LEVELS, bits=None,
+                 payload_sizes=DEFAULT_PAYLOAD_SIZES, workers=1, seed=2024, max_seconds=None):
+        """
+        Benchmark oluşturur
+        
+        Args:
+            trials (int): Her hücre için deneme sayısı
+            levels (iterable): Hex zorluk seviyeleri
+            bits (iterable): Bit zorlukları (verilirse seviyelerin yerine geçer)
+            payload_sizes (iterable): Bloktaki oksimetre kaydı sayıları
+            workers (int): Madencilik süreç sayısı
+            seed (int): Tekrarlanabilirlik için rastgelelik tohumu
+            max_seconds (float): Tüm benchmark için süre bütçesi (opsiyonel); dolunca
+                süren deneme durdurulur ve kalan hücreler atlanır
+        """
+        self.trials = trials
+        if bits:
+            self.difficulty_bits = sorted(set(bits))
+        else:
+            self.difficulty_bits = [difficulty_bits_for_level(level) for level in sorted(set(levels))]
+        self.payload_sizes = sorted(set(payload_sizes))
+        self.workers = workers
+        self.seed = seed
+        self.max_seconds = max_seconds
+    
+    def generate_payload(self, size, rng):
+        """
+        Gerçekçi oksimetre kayıtlarından oluşan blok verisi üretir
+        
+        Args:
+            size (int): Kayıt sayısı
+            rng (random.Random): Rastgelelik kaynağı
+        
+        Returns:
+            list: Oksimetre kayıtları
+        """
+        base_time = datetime(2024, 1, 1, 23, 0, 0)
+        records = []
+        for i in range(size):
+            spo2 = round(rng.uniform(85.0, 99.0), 1)
+            records.append({
+                'data_id': f"ox_data_bench_{i:06d}",
+                'patient_id': f"patient_{rng.randint(1, 50):03d}",
+                'data_type': 'OXIMETER',
+                'value': None,
+                'timestamp': (base_time + timedelta(seconds=i)).isoformat(),
+                'device_id': 'BT_OXIMETER_001',
+                'is_processed': False,
+                'spo2_value': spo2,
+                'bpm_value': round(rng.uniform(55.0, 85.0), 1),
+                'ahi_index': 'Severe' if spo2 < 85 else 'Moderate' if spo2 < 90 else 'Mild' if spo2 < 95 else 'Normal'
+            })
+        return records
+    
+    def run_cell(self, difficulty_bits, payload_size, deadline=None):
+        """
+        Tek bir (zorluk, veri boyutu) hücresi için tekrarlı deneme yapar
+        
+        Her denemede previous_hash farklıdır; böylece denemeler bağımsızdır
+        ama aynı tohumla tekrar üretilebilir.
+        
+        Args:
+            difficulty_bits (int): Bit zorluğu
+            payload_size (int): Bloktaki kayıt sayısı
+            deadline (float): time.time() cinsinden son an (opsiyonel); aşılırsa kalan denemeler yapılmaz
+        
+        Returns:
+            dict: Hücre istatistikleri veya None (hiç deneme tamamlanamadıysa)
+        """
+        rng = random.Random(f"{self.seed}-{difficulty_bits}-{payload_size}")
+        payload = self.generate_payload(payload_size, rng)
+        # Benchmark denemeleri uygulama telemetrisine yazılmaz
+        engine = MiningEngine(workers=self.workers, difficulty_bits=difficulty_bits, metrics=None)
+        
+        mining_times = []
+        attempts = []
+        for trial in range(self.trials):
+            previous_hash = hashlib.sha256(f"{self.seed}-{difficulty_bits}-{payload_size}-{trial}".encode()).hexdigest()
+            result = engine.mine_block(trial + 1, "2024-01-01T23:00:00", payload, previous_hash,
+                                       deadline=deadline)
+            if result['cancelled']:
+                break
+            mining_times.append(result['mining_time'])
+            attempts.append(result['hash_operations'])
+        
+        if not mining_times:
+            return None
+        
+        total_time = sum(mining_times)
+        expected_attempts = 2 ** difficulty_bits
+        latency = summarize(mining_times)
+        observed = summarize(attempts)
+        
+        return {
+            'difficulty_bits': difficulty_bits,
+            'difficulty_level': difficulty_bits / 4,
+            'payload_size': payload_size,
+            'trials': len(mining_times),
+            'truncated': len(mining_times) < self.trials,
+            'hash_rate': sum(attempts) / total_time if total_time else None,
+            'mining_time': latency,
+            'attempts': {
+                'expected': expected_attempts,
+                'observed_mean': observed['mean'],
+                'observed_p50': observed['p50'],
+                'observed_p95': observed['p95'],
+                'observed_to_expected': observed['mean'] / expected_attempts
+            },
+            'network_comparison': engine.compare_with_existing_networks(latency)
+        }
+    
+    def run(self, progress=None):
+        """
+        Tüm hücreleri çalıştırır
+        
+        Args:
+            progress (callable): Her hücreden sonra (hücre sonucu) ile çağrılır (opsiyonel)
+        
+        Returns:
+            dict: Makine tarafından okunabilir benchmark raporu
+        """
+        started = time.time()
+        deadline = started + self.max_seconds if self.max_seconds else None
+        results = []
+        skipped = []
+        for difficulty_bits in self.difficulty_bits:
+            for payload_size in self.payload_sizes:
+                cell = None
+                if deadline is None or time.time() < deadline:
+                    cell = self.run_cell(difficulty_bits, payload_size, deadline)
+                if cell is None:
+                    skipped.append({'difficulty_bits': difficulty_bits, 'payload_size': payload_size})
+                    continue
+                results.append(cell)
+                if progress:
+                    progress(cell)
+        
+        return {
+            'benchmark': 'mining',
+            'created_at': datetime.now().isoformat(),
+            'duration_seconds': time.time() - started,
+            'environment': {
+                'python': platform.python_version(),
+                'implementation': platform.python_implementation(),
+                'machine': platform.machine(),
+                'system': platform.system()
+            },
+            'parameters': {
+                'trials': self.trials,
+                'difficulty_bits': self.difficulty_bits,
+                'payload_sizes': self.payload_sizes,
+                'workers': self.workers,
+                'seed': self.seed,
+                'batch_size': MiningEngine.BATCH_SIZE,
+                'max_seconds': self.max_seconds
+            },
+            'timed_out': bool(skipped) or any(cell['truncated'] for cell in results),
+            'skipped_cells': skipped,
+            'results': results
+        }
+
+
+class HashAlgorithmBenchmark:
+    """Blok hash algoritmalarının madencilik ve doğrulama hızı karşılaştırması
+    
+    Madencilik hızı nonce aramasındaki hash/s ile, doğrulama hızı ise
+    Block.is_valid (kanonik serileştirme + tam blok hash'i) ve yalnızca
+    önceden serileştirilmiş blok baytlarının hash'lenmesi ile ölçülür.
+    """
+    
+    DEFAULT_PAYLOAD_SIZES = (1, 100, 1000)
+    
+    def __init__(self, algorithms=tuple(HASH_ALGORITHMS), payload_sizes=DEFAULT_PAYLOAD_SIZES,
+                 mining_hashes=200000, validation_rounds=200, seed=2024):
+        """
+        Benchmark oluşturur
+        
+        Args:
+            algorithms (iterable): Karşılaştırılacak algoritmalar
+            payload_sizes (iterable): Bloktaki oksimetre kaydı sayıları
+            mining_hashes (int): Madencilik hızı ölçümünde denenecek hash sayısı
+            validation_rounds (int): Her hücrede doğrulanacak blok sayısı
+            seed (int): Tekrarlanabilirlik için rastgelelik tohumu
+        """
+        for algorithm in algorithms:
+            get_hash_function(algorithm)
+        self.algorithms = list(algorithms)
+        self.payload_sizes = sorted(set(payload_sizes))
+        self.mining_hashes = mining_hashes
+        self.validation_rounds = validation_rounds
+        self.seed = seed
+    
+    def run_cell(self, algorithm, payload_size):
+        """
+        Tek bir (algoritma, veri boyutu) hücresini ölçer
+        
+        Returns:
+            dict: Hücre sonuçları
+        """
+        rng = random.Random(f"{self.seed}-{payload_size}")
+        payload = MiningBenchmark(trials=1).generate_payload(payload_size, rng)
+        previous_hash = hashlib.sha256(f"{self.seed}-{payload_size}".encode()).hexdigest()
+        
+        # Madencilik: ulaşılamaz hedefle hash bütçesi kadar nonce denenir
+        engine = MiningEngine(workers=1, difficulty_bits=256, metrics=None, hash_algorithm=algorithm)
+        mining = engine.mine_block(1, "2024-01-01T23:00:00", payload, previous_hash, max_hashes=self.mining_hashes)
+        
+        # Doğrulama: tam blok hash'i yeniden hesaplanır
+        block = Block(1, "2024-01-01T23:00:00", payload, previous_hash, nonce=12345, hash_algorithm=algorithm)
+        start = time.perf_counter()
+        for _ in range(self.validation_rounds):
+            if not block.is_valid():
+                raise RuntimeError(f"{algorithm} bloğu doğrulanamadı")
+        validation_time = time.perf_counter() - start
+        
+        # Yalnızca hash: serileştirme maliyeti hariç
+        block_bytes = block_hash_prefix(1, "2024-01-01T23:00:00", payload, previous_hash) + b'12345'
+        hash_function = get_hash_function(algorithm)
+        start = time.perf_counter()
+        for _ in range(self.validation_rounds):
+            hash_function(block_bytes).digest()
+        hash_time = time.perf_counter() - start
+        
+        return {
+            'hash_algorithm': algorithm,
+            'payload_size': payload_size,
+            'block_bytes': len(block_bytes),
+            'mining_hash_rate': mining['hash_operations'] / mining['mining_time'],
+            'validation_blocks_per_second': self.validation_rounds / validation_time,
+            'hash_only_blocks_per_second': self.validation_rounds / hash_time,
+            'hash_only_megabytes_per_second': self.validation_rounds * len(block_bytes) / hash_time / 1e6
+        }
+    
+    def run(self, progress=None):
+        """
+        Tüm hücreleri çalıştırır; her hücre SHA-256'ya göre oranlarla raporlanır
+        
+        Args:
+            progress (callable): Her hücreden sonra (hücre sonucu) ile çağrılır (opsiyonel)
+        
+        Returns:
+            dict: Makine tarafından okunabilir benchmark raporu
+        """
+        started = time.time()
+        results = []
+        for payload_size in self.payload_sizes:
+            cells = [self.run_cell(algorithm, payload_size) for algorithm in self.algorithms]
+            baseline = next((c for c in cells if c['hash_algorithm'] == 'sha256'), cells[0])
+            for cell in cells:
+                cell['relative_to'] = baseline['hash_algorithm']
+                cell['mining_speedup'] = cell['mining_hash_rate'] / baseline['mining_hash_rate']
+                cell['validation_speedup'] = (cell['validation_blocks_per_second']
+                                              / baseline['validation_blocks_per_second'])
+                cell['hash_only_speedup'] = (cell['hash_only_blocks_per_second']
+                                             / baseline['hash_only_blocks_per_second'])
+                results.append(cell)
+                if progress:
+                    progress(cell)
+        
+        return {
+            'benchmark': 'hash_algorithms',
+            'created_at': datetime.now().isoformat(),
+            'duration_seconds': time.time() - started,
+            'environment': {
+                'python': platform.python_version(),
+                'implementation': platform.python_implementation(),
+                'machine': platform.machine(),
+                'system': platform.system()
+            },
+            'parameters': {
+                'algorithms': self.algorithms,
+                'payload_sizes': self.payload_sizes,
+                'mining_hashes': self.mining_hashes,
+                'validation_rounds': self.validation_rounds,
+                'seed': self.seed
+            },
+            'results': results
+        }
+
+
+def main(argv=None):
+    """Komut satırı girişi"""
+    parser = argparse.ArgumentParser(description="LightMedChain madencilik benchmark'ı")
+    parser.add_argument('--trials', type=int, default=10, help='Her hücre için deneme sayısı')
+    parser.add_argument('--levels', type=int, nargs='+', default=list(MiningBenchmark.DEFAULT_LEVELS),
+                        help='Hex zorluk seviyeleri')
+    parser.add_argument('--bits', type=int, nargs='+', help='Bit zorlukları (seviyelerin yerine)')
+    parser.add_argument('--payload-sizes', type=int, nargs='+', default=list(MiningBenchmark.DEFAULT_PAYLOAD_SIZES),
+                        help='Bloktaki kayıt sayıları')
+    parser.add_argument('--workers', type=int, default=Config.MINING_WORKERS, help='Madencilik süreç sayısı')
+    parser.add_argument('--seed', type=int, default=2024)
+    parser.add_argument('--max-seconds', type=float, help='Toplam süre bütçesi (saniye, opsiyonel)')
+    parser.add_argument('--output', help='JSON çıktı dosyası (verilmezse stdout)')
+    parser.add_argument('--compare-hashes', action='store_true',
+                        help='Zorluk testi yerine hash algoritmalarını karşılaştır')
+    parser.add_argument('--hash-algorithms', nargs='+', default=list(HASH_ALGORITHMS),
+                        choices=list(HASH_ALGORITHMS), help='Karşılaştırılacak hash algoritmaları')
+    args = parser.parse_args(argv)
+    
+    if args.compare_hashes:
+        benchmark = HashAlgorithmBenchmark(
+            algorithms=args.hash_algorithms,
+            payload_sizes=args.payload_sizes,
+            seed=args.seed
+        )
+        
+        def report(cell):
+            print(f"{cell['hash_algorithm']:>8} payload={cell['payload_size']:>4} "
+                  f"mining={cell['mining_hash_rate']:>12,.0f} H/s ({cell['mining_speedup']:.2f}x) "
+                  f"validate={cell['validation_blocks_per_second']:>9,.0f} blok/s ({cell['validation_speedup']:.2f}x) "
+                  f"hash={cell['hash_only_megabytes_per_second']:>7,.1f} MB/s ({cell['hash_only_speedup']:.2f}x)",
+                  file=sys.stderr)
+    else:
+        benchmark = MiningBenchmark(
+            trials=args.trials,
+            levels=args.levels,
+            bits=args.bits,
+            payload_sizes=args.payload_sizes,
+            workers=args.workers,
+            seed=args.seed,
+            max_seconds=args.max_seconds
+        )
+        
+        def report(cell):
+            latency = cell['mining_time']
+            print(f"bits={cell['difficulty_bits']:>2} payload={cell['payload_size']:>4} "
+                  f"rate={cell['hash_rate']:>12,.0f} H/s mean={latency['mean']:.4f}s "
+                  f"p50={latency['p50']:.4f}s p95={latency['p95']:.4f}s p99={latency['p99']:.4f}s "
+                  f"attempts={cell['attempts']['observed_mean']:.0f}/{cell['attempts']['expected']}",
+                  file=sys.stderr)
+    
+    report_data = benchmark.run(progress=report)
+    output = json.dumps(report_data, indent=2, sort_keys=True)
+    
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(output)
+        print(f"💾 Benchmark sonucu kaydedildi: {args.output}", file=sys.stderr)
+    else:
+        print(output)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,14 +1,30 @@
 # Güncellenmiş blok yapısı - Makaleye %100 uyumlu
-import hashlib
 import json
+import time
 from datetime import datetime
 from config import Config
-from mining import MiningEngine
+from merkle import merkle_root
+from record_batch import RecordBatch, plain_records
+from mining import (DEFAULT_HASH_ALGORITHM, MiningEngine, block_hash_prefix, canonical_json, get_hash_function,
+                    leading_zero_bits)
 
 class Block:
     """Güncellenmiş blok sınıfı - Makaleye %100 uyumlu"""
     
-    def __init__(self, index, timestamp, data, previous_hash, nonce=0, hash_value=None):
+    # Blok sürümleri: 1 - veri JSON'u doğrudan hash'lenir (makaledeki format),
+    # 2 - hash'e kayıtların Merkle kökü girer (kayıt bazında dahil olma kanıtı)
+    LEGACY_VERSION = 1
+    MERKLE_VERSION = 2
+    
+    # Büyük zincirlerde blok başına __dict__ tutulmaz
+    __slots__ = ('index', 'timestamp', '_data', '_body_store', '_record_count', '_serialized', 'previous_hash',
+                 'nonce', 'difficulty_bits', 'mining_time', 'hash_algorithm', 'signer', 'signature', 'version',
+                 'merkle_root', 'hash')
+    
+    def __init__(self, index, timestamp, data, previous_hash, nonce=0, hash_value=None,
+                 difficulty_bits=None, mining_time=None, hash_algorithm=DEFAULT_HASH_ALGORITHM,
+                 signer=None, signature=None, version=LEGACY_VERSION, merkle_root=None,
+                 body_store=None, record_count=None):
         """
         Blok nesnesi oluşturur - Makaledeki yapıya uygun
         
@@ -19,48 +35,231 @@ class Block:
             previous_hash (str): Önceki bloğun hash değeri
             nonce (int): Proof-of-Work için sayı
             hash_value (str): Önceden hesaplanmış hash (opsiyonel)
+            difficulty_bits (int): Madencilikte kullanılan bit zorluğu (eski bloklarda None)
+            mining_time (float): Madencilik süresi - saniye (zorluk ayarlaması için)
+            hash_algorithm (str): Zincirin blok hash algoritması (zincir ayarı, bloğa yazılmaz)
+            signer (str): PoA bloklarında imzalayan yetkilinin açık anahtarı (PoW'da None)
+            signature (str): PoA bloklarında blok hash'inin Ed25519 imzası (PoW'da None)
+            version (int): Blok sürümü (LEGACY_VERSION veya MERKLE_VERSION)
+            merkle_root (str): Kayıtlı Merkle kökü (verilmezse sürüm 2'de veriden hesaplanır)
+            body_store (BlockBodyStore): data None ise kayıtların ilk erişimde okunacağı önbellek
+            record_count (int): Başlıkta kayıtlı kayıt sayısı (data yüklenmeden sayaçlar için)
         """
         self.index = index
         self.timestamp = timestamp
-        self.data = data  # Tıbbi veri kayıtları - makaledeki gibi
+        self._data = data  # Tıbbi veri kayıtları - makaledeki gibi
+        self._body_store = body_store
+        self._record_count = record_count
+        self._serialized = None  # Kanonik hash ve API JSON byte'ları (bkz. canonical_data, api_json)
         self.previous_hash = previous_hash
         self.nonce = nonce
+        self.difficulty_bits = difficulty_bits
+        self.mining_time = mining_time
+        self.hash_algorithm = hash_algorithm
+        self.signer = signer
+        self.signature = signature
+        self.version = version
+        if version >= self.MERKLE_VERSION and merkle_root is None:
+            merkle_root = self.calculate_merkle_root()
+        self.merkle_root = merkle_root
         self.hash = hash_value or self.calculate_hash()
     
+    @property
+    def data(self):
+        """Blok kayıtları - yalnızca başlığı yüklenmiş bloklarda önbellekten okunur"""
+        if self._data is None and self._body_store is not None:
+            return self._body_store.get(self.index)
+        return self._data
+    
+    @data.setter
+    def data(self, value):
+        self._data = value
+        self._serialized = None
+    
+    def compact_data(self):
+        """
+        Bellekteki kayıtları RecordBatch'e çevirir - zincire eklenen bloklar için
+        
+        Saklanan kanonik/API byte'ları geçerliliğini korur; kayıtlar aynıdır.
+        """
+        if self._data is not None:
+            self._data = RecordBatch.from_records(self._data)
+    
+    @property
+    def record_count(self):
+        """Bloktaki tıbbi kayıt sayısı (genesis için 0) - kayıtlar yüklenmeden okunabilir"""
+        if self.index == 0:
+            return 0
+        if self._data is None and self._record_count is not None:
+            return self._record_count
+        return len(self.data)
+    
+    def _serialization_cache(self):
+        """Serileştirme byte'larının tutulduğu sözlük - başlığı yüklenmiş bloklarda gövdeyle birlikte önbellektedir"""
+        if self._data is None and self._body_store is not None:
+            return self._body_store.serialized(self.index)
+        if self._serialized is None:
+            self._serialized = {}
+        return self._serialized
+    
+    def clear_serialized(self):
+        """Saklanan kanonik/API byte'larını atar - sonraki doğrulama kayıtları yeniden serileştirir"""
+        self._serialized = None
+        if self._body_store is not None:
+            self._body_store.clear_serialized(self.index)
+    
+    def canonical_data(self):
+        """
+        Verinin hash girdisindeki kanonik byte'larını döndürür - bir kez hesaplanır
+        
+        Madencilikten sonra blok verisi değişmez; doğrulama her seferinde
+        json.dumps çalıştırmak yerine bu byte'ları hash'ler.
+        
+        Returns:
+            tuple | bytes: Sürüm 2'de kayıt başına kanonik JSON (Merkle yaprakları),
+            sürüm 1 ve genesis'te verinin tamamının kanonik JSON'u
+        """
+        cache = self._serialization_cache()
+        canonical = cache.get('canonical')
+        if canonical is None:
+            if self.version >= self.MERKLE_VERSION:
+                canonical = tuple(canonical_json(record) for record in self.data)
+            else:
+                canonical = canonical_json(plain_records(self.data))
+            cache['canonical'] = canonical
+        return canonical
+    
+    def api_json(self):
+        """
+        Bloğun API JSON'unu byte olarak döndürür (sort_keys, boşluksuz) - bir kez hesaplanır
+        
+        Tam zincir yanıtı bu parçaların birleştirilmesiyle oluşturulur.
+        Madencilik ya da mühürleme sonrası saklanan değer atılır.
+        
+        Returns:
+            bytes: to_dict çıktısının JSON'u
+        """
+        cache = self._serialization_cache()
+        encoded = cache.get('api_json')
+        if encoded is None:
+            encoded = json.dumps(self.to_dict(), sort_keys=True, separators=(',', ':')).encode()
+            cache['api_json'] = encoded
+        return encoded
+    
+    def calculate_merkle_root(self):
+        """
+        Blok kayıtlarının Merkle kökünü hesaplar
+        
+        Returns:
+            str: Kök hash veya None (sürüm 1 bloklarda)
+        """
+        if self.version < self.MERKLE_VERSION:
+            return None
+        return merkle_root(self.canonical_data(), self.hash_algorithm)
+    
     def calculate_hash(self):
         """
-        Blok hash'ini hesaplar - Makaledeki SHA256 standardı
+        Blok hash'ini zincirin algoritmasıyla hesaplar - varsayılan Makaledeki SHA256 standardı
+        
+        Sürüm 2 bloklarda hash'e veri yerine kayıtlı Merkle kökü girer; kökün
+        veriyle tutarlılığı is_valid içinde ayrıca kontrol edilir.
         
         Returns:
             str: Hesaplanan hash değeri (64 karakter hex)
         """
-        # Makaledeki hash hesaplama formatına uygun
-        block_string = f"{self.index}{self.timestamp}{json.dumps(self.data, sort_keys=True)}{self.previous_hash}{self.nonce}"
-        return hashlib.sha256(block_string.encode()).hexdigest()
+        # Makaledeki hash hesaplama formatına uygun (madencilik çekirdeği ile ortak prefix)
+        data = None if self.merkle_root is not None else self.canonical_data()
+        block_bytes = block_hash_prefix(self.index, self.timestamp, data, self.previous_hash,
+                                        self.merkle_root) + b'%d' % self.nonce
+        return get_hash_function(self.hash_algorithm)(block_bytes).hexdigest()
     
-    def mine_block(self, difficulty):
+    def mine_block(self, difficulty, progress_callback=None, difficulty_bits=None,
+                   cancel_token=None, deadline=None, max_hashes=None):
         """
         Proof-of-Work madenciliği yapar - Leading-zero bulma
         
+        Madencilik durdurulursa blok değiştirilmez; sonuçta 'cancelled' True olur.
+        
         Args:
             difficulty (int): Zorluk seviyesi (1-5 arası)
+            progress_callback (callable): Denenen hash sayısıyla periyodik çağrılır (opsiyonel)
+            difficulty_bits (int): Bit cinsinden zorluk (verilirse seviyenin yerine geçer)
+            cancel_token (MiningCancelToken): İptal sinyali (opsiyonel)
+            deadline (float): time.time() cinsinden son an (opsiyonel)
+            max_hashes (int): Denenecek en fazla hash sayısı (opsiyonel)
         """
-        mining_engine = MiningEngine(difficulty)
+        mining_engine = MiningEngine(difficulty, difficulty_bits=difficulty_bits, hash_algorithm=self.hash_algorithm)
         
         # Madencilik işlemini başlat
         mining_result = mining_engine.mine_block(
             self.index, 
             self.timestamp, 
-            self.data, 
-            self.previous_hash
+            plain_records(self.data), 
+            self.previous_hash,
+            progress_callback=progress_callback,
+            cancel_token=cancel_token,
+            deadline=deadline,
+            max_hashes=max_hashes,
+            merkle_root=self.merkle_root
         )
         
+        if mining_result['cancelled']:
+            return mining_result
+        
         # Sonuçları bloka kaydet
         self.nonce = mining_result['nonce']
         self.hash = mining_result['hash']
+        self.difficulty_bits = mining_result['difficulty_bits']
+        self.mining_time = mining_result['mining_time']
+        if self._serialized:
+            self._serialized.pop('api_json', None)
         
         return mining_result
     
+    def seal(self, signer):
+        """
+        Bloğu Proof-of-Authority ile mühürler - nonce araması yapılmaz
+        
+        Args:
+            signer (AuthoritySigner): Bu düğümün imzalayıcısı
+        
+        Returns:
+            dict: Mühürleme sonucu
+        """
+        start_time = time.perf_counter()
+        self.nonce = 0
+        self.difficulty_bits = None
+        self.hash = self.calculate_hash()
+        self.signer = signer.signer_id
+        self.signature = signer.sign(self.hash)
+        self.mining_time = time.perf_counter() - start_time
+        if self._serialized:
+            self._serialized.pop('api_json', None)
+        
+        return {
+            'hash': self.hash,
+            'signer': self.signer,
+            'mining_time': self.mining_time
+        }
+    
+    def is_sealed(self):
+        """Blok PoA imzası taşıyor mu"""
+        return self.signature is not None
+    
+    def verify_seal(self, authority_set):
+        """
+        PoA imzasını yetkili anahtar kümesine karşı doğrular
+        
+        Args:
+            authority_set (AuthoritySet): Yetkili anahtarlar
+        
+        Returns:
+            bool: İmza geçerli ve yetkili bir düğüme ait mi
+        """
+        if not self.is_sealed():
+            return False
+        return authority_set.verify(self.signer, self.signature, self.hash)
+    
     def get_leading_zeros_count(self):
         """
         Blok hash'inde kaç tane leading-zero olduğunu sayar
@@ -76,16 +275,33 @@ class Block:
                 break
         return count
     
-    def is_valid(self, difficulty=None):
+    def get_leading_zero_bits(self):
+        """
+        Blok hash'inde kaç bit leading-zero olduğunu sayar
+        
+        Returns:
+            int: Leading-zero bit sayısı
+        """
+        return leading_zero_bits(self.hash)
+    
+    def is_valid(self, difficulty=None, difficulty_bits=None):
         """
         Blok hash'inin geçerli olup olmadığını kontrol eder
         
+        Blokta kayıtlı bir bit zorluğu varsa hash'in onu sağladığı her zaman
+        kontrol edilir.
+        
         Args:
             difficulty (int): Beklenen zorluk seviyesi
+            difficulty_bits (int): Beklenen en az bit zorluğu
         
         Returns:
             bool: Blok geçerli mi
         """
+        # Merkle kökü kayıtlarla uyuşuyor mu? (sürüm 2)
+        if self.merkle_root != self.calculate_merkle_root():
+            return False
+        
         # Hash değeri doğru hesaplanmış mı?
         calculated_hash = self.calculate_hash()
         if self.hash != calculated_hash:
@@ -97,18 +313,55 @@ class Block:
             if not self.hash.startswith(expected_zeros):
                 return False
         
+        # Bit zorluğu kontrolü - beklenen ve blokta kayıtlı olan
+        zero_bits = self.get_leading_zero_bits()
+        if difficulty_bits is not None and zero_bits < difficulty_bits:
+            return False
+        if self.difficulty_bits is not None and zero_bits < self.difficulty_bits:
+            return False
+        
         return True
     
+    def header(self):
+        """
+        Blok başlığını kayıtlar olmadan döndürür - dahil olma kanıtları için
+        
+        Sürüm 2 bloklarda başlık alanlarından hash yeniden hesaplanabilir:
+        hash(f"{index}{timestamp}{merkle_root}{previous_hash}{nonce}")
+        
+        Returns:
+            dict: Başlık alanları
+        """
+        return {
+            "version": self.version,
+            "index": self.index,
+            "timestamp": self.timestamp,
+            "merkle_root": self.merkle_root,
+            "previous_hash": self.previous_hash,
+            "nonce": self.nonce,
+            "hash": self.hash,
+            "difficulty_bits": self.difficulty_bits,
+            "signer": self.signer,
+            "signature": self.signature,
+            "record_count": self.record_count
+        }
+    
     def to_dict(self):
         """Blok nesnesini sözlük formatına dönüştürür - API için"""
         return {
+            "version": self.version,
             "index": self.index,
             "timestamp": self.timestamp,
-            "data": self.data,
+            "data": plain_records(self.data),
             "previous_hash": self.previous_hash,
             "hash": self.hash,
             "nonce": self.nonce,
-            "leading_zeros": self.get_leading_zeros_count()
+            "leading_zeros": self.get_leading_zeros_count(),
+            "difficulty_bits": self.difficulty_bits,
+            "mining_time": self.mining_time,
+            "signer": self.signer,
+            "signature": self.signature,
+            "merkle_root": self.merkle_root
         }
     
     def to_json(self):
@@ -119,9 +372,14 @@ class Block:
 class GenesisBlock(Block):
     """Genesis Blok sınıfı - Makaledeki gibi özel ilk blok"""
     
-    def __init__(self):
+    __slots__ = ()
+    
+    def __init__(self, hash_algorithm=DEFAULT_HASH_ALGORITHM):
         """
         Genesis blok oluşturur - Makaledeki yapıya uygun
+        
+        Args:
+            hash_algorithm (str): Zincirin blok hash algoritması
         """
         # Makaledeki genesis blok yapısına uygun
         genesis_data = {
@@ -137,7 +395,8 @@ class GenesisBlock(Block):
             timestamp=datetime.now().isoformat(),
             data=genesis_data,
             previous_hash="0" * 64,  # 64 karakterlik sıfır - standart
-            nonce=0
+            nonce=0,
+            hash_algorithm=hash_algorithm
         )
         
         # Genesis bloğu önceden mine edilmiş kabul edilir
@@ -0,0 +1,392 @@
+# İkili blok kodlayıcı - Kalıcı kayıt ve zincir aktarımı için sıkıştırılmış blok formatı
+import json
+import math
+import struct
+import sys
+import zlib
+from array import array
+from record_batch import RecordBatch
+
+# Kodlanmış bloğun ilk byte'ları - JSON satırlarından ayırt etmek için
+MAGIC = b'LMB'
+CODEC_VERSION = 1
+
+# Sabit başlık: magic, codec sürümü, bayraklar, blok sürümü, index, nonce, mining_time,
+# difficulty_bits, kayıt sayısı, timestamp uzunluğu. Ardından timestamp, hash, previous_hash
+# ve bayraklara göre merkle_root, signer + signature gelir; kalan byte'lar sıkıştırılmış gövdedir.
+HEADER = struct.Struct('>3sBBBIQdhIH')
+
+# Başlık bayrakları
+HAS_MERKLE_ROOT = 0x01
+HAS_SIGNATURE = 0x02
+HAS_DIFFICULTY_BITS = 0x04
+HAS_MINING_TIME = 0x08
+JSON_BODY = 0x10  # Gövde kayıt listesi değil (genesis) - sıkıştırılmış JSON olarak saklanır
+
+# Gövde sütun türleri (array modülü kodları, little-endian saklanır)
+COLUMN_STRING = 'I'  # String tablosundaki sıra
+COLUMN_FLOAT = 'd'  # IEEE 754 double - JSON'daki değerle birebir aynı
+COLUMN_INT = 'q'  # 64 bit işaretli tamsayı
+INT64_MIN = -2 ** 63
+INT64_MAX = 2 ** 63 - 1
+
+# Chain dışa aktarımı: magic + blok sayısı, ardından uzunluk önekli bloklar
+CHAIN_MAGIC = b'LMCHAIN1'
+LENGTH = struct.Struct('>I')
+
+COMPRESSION_LEVEL = 6
+
+
+def _column_kind(values):
+    """Sütundaki tüm değerler aynı ilkel türdeyse array kodunu, değilse None döndürür"""
+    first = type(values[0])
+    if any(type(value) is not first for value in values):
+        return None
+    if first is str:
+        return COLUMN_STRING
+    if first is float:
+        return COLUMN_FLOAT
+    if first is int and INT64_MIN <= min(values) and max(values) <= INT64_MAX:
+        return COLUMN_INT
+    return None
+
+
+def _array_bytes(kind, values):
+    """Değerleri little-endian dizi byte'larına çevirir"""
+    packed = array(kind, values)
+    if sys.byteorder == 'big':
+        packed.byteswap()
+    return packed.tobytes()
+
+
+def _bytes_array(kind, buf):
+    """_array_bytes çıktısını diziye çevirir"""
+    packed = array(kind)
+    packed.frombytes(buf)
+    if sys.byteorder == 'big':
+        packed.byteswap()
+    return packed
+
+
+def _encode_records(records):
+    """
+    Kayıt listesini sütun düzeninde, string tablosuyla kodlar
+    
+    Aynı anahtar dizisine sahip kayıtlar bir şema altında toplanır ve her
+    anahtar bir sütun olarak yazılır. Tamamı metin, ondalık ya da tamsayı olan
+    sütunlar sabit genişlikli dizilere çevrilir; metinler tabloya bir kez
+    yazılıp sıralarıyla anılır. Karışık türlü sütunlar JSON listesi olarak
+    kalır. Çözme işi değer başına değil sütun başına yapılır.
+    
+    Gövde: 4 byte uzunluk + JSON manifest (string tablosu, şemalar, kayıt
+    sırası), ardından manifest sırasıyla sütun dizileri.
+    """
+    strings = {}
+    groups = {}
+    order = []
+    
+    def intern(text):
+        string_id = strings.get(text)
+        if string_id is None:
+            string_id = strings[text] = len(strings)
+        return string_id
+    
+    for record in records:
+        keys = tuple(record)
+        group = groups.get(keys)
+        if group is None:
+            group = groups[keys] = []
+        group.append(tuple(record.values()))
+        order.append(keys)
+    
+    shapes = []
+    arrays = []
+    for keys, rows in groups.items():
+        columns = []
+        for values in zip(*rows):
+            kind = _column_kind(values)
+            if kind is None:
+                columns.append([values])
+                continue
+            if kind == COLUMN_STRING:
+                values = [intern(value) for value in values]
+            columns.append(kind)
+            arrays.append(_array_bytes(kind, values))
+        shapes.append([[intern(key) for key in keys], len(rows), columns])
+    
+    shape_ids = {keys: shape_id for shape_id, keys in enumerate(groups)}
+    manifest = json.dumps({
+        'strings': list(strings),
+        'shapes': shapes,
+        # Tek şemada kayıt sırası zaten şema sırasıdır
+        'order': [shape_ids[keys] for keys in order] if len(groups) > 1 else None
+    }, separators=(',', ':')).encode()
+    return b''.join([LENGTH.pack(len(manifest)), manifest, *arrays])
+
+
+def _decode_records(buf, compact=False):
+    """
+    _encode_records çıktısını kayıt listesine çevirir
+    
+    compact=True ise tek şemalı gövdeler sözlük üretilmeden RecordBatch'e çevrilir.
+    """
+    (length,) = LENGTH.unpack_from(buf, 0)
+    pos = LENGTH.size + length
+    manifest = json.loads(buf[LENGTH.size:pos].decode())
+    strings = manifest['strings']
+    
+    groups = []
+    for key_ids, count, columns in manifest['shapes']:
+        keys = [strings[key_id] for key_id in key_ids]
+        values = []
+        for column in columns:
+            if isinstance(column, list):
+                values.append(column[0])
+                continue
+            end = pos + count * array(column).itemsize
+            decoded = _bytes_array(column, buf[pos:end])
+            pos = end
+            if column == COLUMN_STRING:
+                decoded = list(map(strings.__getitem__, decoded))
+            values.append(decoded)
+        if compact and len(manifest['shapes']) == 1:
+            return RecordBatch.from_columns(keys, values, count)
+        if values:
+            groups.append([dict(zip(keys, row)) for row in zip(*values)])
+        else:
+            groups.append([{} for _ in range(count)])
+    
+    if manifest['order'] is None:
+        return groups[0] if groups else []
+    pending = [iter(group) for group in groups]
+    return [next(pending[shape_id]) for shape_id in manifest['order']]
+
+
+def _is_record_list(data):
+    """Veri, kayıt kodlamasına uygun sözlük listesi mi"""
+    return isinstance(data, list) and all(
+        isinstance(record, dict) and all(type(key) is str for key in record) for record in data
+    )
+
+
+def _record_count(block):
+    """Başlığa yazılan kayıt sayısı - Block.record_count ile aynı kural (genesis 0, diğerleri len(data))"""
+    data = block['data']
+    if block['index'] == 0 or not hasattr(data, '__len__'):
+        return 0
+    return len(data)
+
+
+def _encode_header(block, flags, record_count):
+    """Sabit başlığı ve hash alanlarını kodlar"""
+    timestamp = block['timestamp'].encode()
+    difficulty_bits = block.get('difficulty_bits')
+    mining_time = block.get('mining_time')
+    if difficulty_bits is not None:
+        flags |= HAS_DIFFICULTY_BITS
+    if mining_time is not None:
+        flags |= HAS_MINING_TIME
+    if block.get('merkle_root') is not None:
+        flags |= HAS_MERKLE_ROOT
+    if block.get('signature') is not None:
+        flags |= HAS_SIGNATURE
+    
+    parts = [
+        HEADER.pack(MAGIC, CODEC_VERSION, flags, block.get('version', 1), block['index'], block['nonce'],
+                    mining_time if mining_time is not None else math.nan,
+                    difficulty_bits if difficulty_bits is not None else -1,
+                    record_count, len(timestamp)),
+        timestamp,
+        bytes.fromhex(block['hash']),
+        bytes.fromhex(block['previous_hash'])
+    ]
+    if flags & HAS_MERKLE_ROOT:
+        parts.append(bytes.fromhex(block['merkle_root']))
+    if flags & HAS_SIGNATURE:
+        parts.append(bytes.fromhex(block['signer']))
+        parts.append(bytes.fromhex(block['signature']))
+    return b''.join(parts)
+
+
+def encode_header(block):
+    """
+    Blok başlığını kayıtlar olmadan kodlar - açılışta yalnızca başlık okumak için
+    
+    Args:
+        block (dict): Block.to_dict çıktısı
+    
+    Returns:
+        bytes: Kodlanmış başlık (decode_header ile okunur)
+    """
+    return _encode_header(block, 0 if _is_record_list(block['data']) else JSON_BODY, _record_count(block))
+
+
+def encode_block(block):
+    """
+    Bloğu ikili formata kodlar
+    
+    Hash alanları ham 32 byte olarak, kayıtlar string tablosuyla kodlanıp
+    zlib ile sıkıştırılarak saklanır. Çözülen kayıtlar kanonik JSON'da
+    birebir aynı olduğundan blok hash'i değişmez.
+    
+    Args:
+        block (dict): Block.to_dict çıktısı
+    
+    Returns:
+        bytes: Kodlanmış blok
+    
+    Raises:
+        ValueError: Hash alanları 64 karakter hex değilse ya da sayılar sınır dışındaysa
+    """
+    data = block['data']
+    try:
+        if _is_record_list(data):
+            header = _encode_header(block, 0, _record_count(block))
+            body = _encode_records(data)
+        else:
+            header = _encode_header(block, JSON_BODY, _record_count(block))
+            body = json.dumps(data, sort_keys=True).encode()
+    except struct.error as e:
+        raise ValueError(f"Blok #{block['index']} kodlanamadı: {e}")
+    return header + zlib.compress(body, COMPRESSION_LEVEL)
+
+
+def _decode_header(buf):
+    """Başlığı çözer; (başlık sözlüğü, bayraklar, gövde başlangıcı) döndürür"""
+    (magic, codec_version, flags, version, index, nonce, mining_time, difficulty_bits,
+     record_count, timestamp_length) = HEADER.unpack_from(buf, 0)
+    if magic != MAGIC or codec_version != CODEC_VERSION:
+        raise ValueError("Tanınmayan blok kodlaması")
+    
+    pos = HEADER.size
+    timestamp = bytes(buf[pos:pos + timestamp_length]).decode()
+    pos += timestamp_length
+    block_hash = buf[pos:pos + 32].hex()
+    previous_hash = buf[pos + 32:pos + 64].hex()
+    pos += 64
+    merkle_root = signer = signature = None
+    if flags & HAS_MERKLE_ROOT:
+        merkle_root = buf[pos:pos + 32].hex()
+        pos += 32
+    if flags & HAS_SIGNATURE:
+        signer = buf[pos:pos + 32].hex()
+        signature = buf[pos + 32:pos + 96].hex()
+        pos += 96
+    
+    header = {
+        'version': version,
+        'index': index,
+        'timestamp': timestamp,
+        'previous_hash': previous_hash,
+        'hash': block_hash,
+        'nonce': nonce,
+        'difficulty_bits': difficulty_bits if flags & HAS_DIFFICULTY_BITS else None,
+        'mining_time': mining_time if flags & HAS_MINING_TIME else None,
+        'signer': signer,
+        'signature': signature,
+        'merkle_root': merkle_root,
+        'record_count': record_count
+    }
+    return header, flags, pos
+
+
+def decode_header(buf):
+    """
+    Kodlanmış blok ya da başlıktan başlık alanlarını okur (gövde açılmaz)
+    
+    Args:
+        buf (bytes): encode_block veya encode_header çıktısı
+    
+    Returns:
+        dict: Başlık alanları ve record_count
+    """
+    return _decode_header(buf)[0]
+
+
+def decode_data(buf, compact=False):
+    """
+    Kodlanmış bloktan yalnızca kayıtları çözer
+    
+    Args:
+        buf (bytes): encode_block çıktısı
+        compact (bool): Kayıtlar RecordBatch olarak döndürülsün mü
+    
+    Returns:
+        list | RecordBatch: Blok verisi (genesis için sözlük)
+    """
+    _, flags, pos = _decode_header(buf)
+    body = zlib.decompress(buf[pos:])
+    if flags & JSON_BODY:
+        return json.loads(body)
+    return _decode_records(body, compact)
+
+
+def decode_block(buf):
+    """
+    encode_block çıktısını Block.to_dict biçimine çevirir
+    
+    Args:
+        buf (bytes): Kodlanmış blok
+    
+    Returns:
+        dict: Blok sözlüğü (leading_zeros hariç)
+    """
+    block, flags, pos = _decode_header(buf)
+    del block['record_count']
+    body = zlib.decompress(buf[pos:])
+    block['data'] = json.loads(body) if flags & JSON_BODY else _decode_records(body)
+    return block
+
+
+def iter_encode_chain(blocks, count):
+    """
+    encode_chain çıktısını blok blok üretir - dışa aktarım bellekte biriktirilmeden akıtılır
+    
+    Args:
+        blocks (iterable): Block.to_dict sözlükleri
+        count (int): Blok sayısı (akışın başına yazılır; blocks tam bu kadar blok üretmelidir)
+    
+    Yields:
+        bytes: Önce CHAIN_MAGIC ve blok sayısı, sonra blok başına uzunluk önekli kodlanmış blok
+    """
+    yield CHAIN_MAGIC + LENGTH.pack(count)
+    for block in blocks:
+        encoded = encode_block(block)
+        yield LENGTH.pack(len(encoded)) + encoded
+
+
+def encode_chain(blocks):
+    """
+    Blokları tek bir ikili akışa dönüştürür - application/octet-stream dışa aktarımı
+    
+    Args:
+        blocks (list): Block.to_dict sözlükleri
+    
+    Returns:
+        bytes: CHAIN_MAGIC, blok sayısı ve uzunluk önekli kodlanmış bloklar
+    """
+    return b''.join(iter_encode_chain(blocks, len(blocks)))
+
+
+def decode_chain(buf):
+    """
+    encode_chain çıktısını blok sözlüklerine çevirir
+    
+    Args:
+        buf (bytes): Dışa aktarılmış zincir
+    
+    Returns:
+        list: Blok sözlükleri
+    """
+    if buf[:len(CHAIN_MAGIC)] != CHAIN_MAGIC:
+        raise ValueError("Tanınmayan zincir dışa aktarım formatı")
+    pos = len(CHAIN_MAGIC)
+    (count,) = LENGTH.unpack_from(buf, pos)
+    pos += LENGTH.size
+    blocks = []
+    for _ in range(count):
+        (length,) = LENGTH.unpack_from(buf, pos)
+        pos += LENGTH.size
+        blocks.append(decode_block(buf[pos:pos + length]))
+        pos += length
+    return blocks
@@ -0,0 +1,125 @@
+# Blok gövdesi önbelleği - Açılışta yüklenmeyen kayıtları ihtiyaç oldukça veritabanından okur
+import threading
+from collections import OrderedDict
+from config import Config
+from record_batch import RecordBatch
+
+
+class BlockBodyStore:
+    """Blok kayıtları için LRU önbellek
+    
+    Zincir açılışta yalnızca başlıklarla yüklenir; bir bloğun kayıtlarına ilk
+    erişildiğinde o blok ve ardından gelen BLOCK_PREFETCH blok tek sorguda
+    okunur. Böylece zincir boyunca sıralı taramalar (doğrulama, indeks kurma)
+    blok başına sorgu yapmaz. Önbellek en fazla `capacity` blok tutar.
+    
+    Kayıtlar RecordBatch olarak sütun düzeninde tutulur. Her gövdenin
+    yanında bloğun kanonik hash ve API JSON byte'ları saklanır (bkz.
+    Block.canonical_data); gövdeyle birlikte önbellekten çıkarılırlar.
+    """
+    
+    def __init__(self, database, capacity=Config.BLOCK_CACHE_SIZE, prefetch=Config.BLOCK_PREFETCH):
+        """
+        Args:
+            database (DatabaseManager): Blok satırlarının okunacağı veritabanı
+            capacity (int): Önbellekteki en fazla blok gövdesi
+            prefetch (int): Eksik blokla birlikte okunan blok sayısı
+        """
+        self.database = database
+        self.capacity = max(1, capacity)
+        self.prefetch = max(1, prefetch)
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+    
+    def __getstate__(self):
+        """Süreçler arası kopyada önbellek ve kilit taşınmaz (işçi kendi okur)"""
+        state = self.__dict__.copy()
+        state['_cache'] = OrderedDict()
+        del state['_lock']
+        return state
+    
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+    
+    def get(self, index):
+        """
+        Bloğun kayıtlarını döndürür
+        
+        Args:
+            index (int): Blok index'i
+        
+        Returns:
+            list: Blok verisi
+        
+        Raises:
+            KeyError: Blok veritabanında yoksa
+        """
+        return self._entry(index)[0]
+    
+    def serialized(self, index):
+        """
+        Bloğun serileştirme önbelleğini döndürür (gövde önbellekte değilse okunur)
+        
+        Args:
+            index (int): Blok index'i
+        
+        Returns:
+            dict: Block'un kanonik/API byte'larını yazdığı sözlük
+        """
+        return self._entry(index)[1]
+    
+    def _entry(self, index):
+        """Bloğun (veri, serileştirme sözlüğü) girdisini döndürür"""
+        with self._lock:
+            entry = self._cache.get(index)
+            if entry is not None:
+                self._cache.move_to_end(index)
+                self.hits += 1
+                return entry
+            self.misses += 1
+        
+        # Veritabanı okuması kilit dışında yapılır
+        bodies = self.database.load_block_bodies(index, index + self.prefetch)
+        if index not in bodies:
+            raise KeyError(f"Blok #{index} verisi veritabanında bulunamadı")
+        
+        with self._lock:
+            for height, body in bodies.items():
+                # Bu arada başka bir iş parçacığının okuduğu girdi korunur
+                if height not in self._cache:
+                    self._cache[height] = (RecordBatch.from_records(body), {})
+                self._cache.move_to_end(height)
+            entry = self._cache[index]
+            while len(self._cache) > self.capacity:
+                self._cache.popitem(last=False)
+        return entry
+    
+    def clear(self):
+        """Önbelleği boşaltır"""
+        with self._lock:
+            self._cache.clear()
+    
+    def clear_serialized(self, index=None):
+        """
+        Kayıtları tutup saklanan kanonik/API byte'larını atar
+        
+        Args:
+            index (int): Yalnızca bu bloğunkiler (verilmezse tümü)
+        """
+        with self._lock:
+            entries = self._cache.values() if index is None else [self._cache.get(index, (None, {}))]
+            for _, serialized in entries:
+                serialized.clear()
+    
+    def stats(self):
+        """Önbellek durumunu döndürür"""
+        with self._lock:
+            return {
+                'cached_blocks': len(self._cache),
+                'capacity': self.capacity,
+                'hits': self.hits,
+                'misses': self.misses
+            }
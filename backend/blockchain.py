@@ -1,67 +1,157 @@
 # Blockchain yönetimi - Zincir işlemleri ve doğrulama
 import json
+import os
+import threading
+import time
 from datetime import datetime
+import block_codec
 from block import Block, GenesisBlock
+from block_store import BlockBodyStore
 from config import Config
+from chain_index import ChainIndex
+from chain_verifier import ParallelChainVerifier, check_block, check_difficulty_schedule
+from checkpoints import (BOOT_CHECKPOINT, BOOT_FULL, BOOT_NONE, BOOT_VERIFICATION_MODES, create_checkpoint,
+                         verify_checkpoint)
+from consensus import CONSENSUS_MODES, POA, AuthoritySet, AuthoritySigner
+from mempool import Mempool
+from merkle import merkle_proof
+from mining import (DEFAULT_HASH_ALGORITHM, MiningCancelled, MiningCancelToken, difficulty_bits_for_level, get_hash_function,
+                    retarget_bits)
 
 class Blockchain:
     """Blockchain sınıfı - Tüm zincir işlemlerini yönetir"""
     
-    def __init__(self, difficulty=Config.BLOCKCHAIN_DIFFICULTY,  database_manager=None ):
+    def __init__(self, difficulty=Config.BLOCKCHAIN_DIFFICULTY,  database_manager=None, retarget=Config.DIFFICULTY_RETARGET,
+                 hash_algorithm=Config.BLOCK_HASH_ALGORITHM, consensus=Config.CONSENSUS_MODE, signer=None,
+                 boot_verification=Config.BOOT_VERIFICATION):
         """
         Blockchain nesnesi oluşturur
         
         Args:
             difficulty (int): Madencilik zorluk seviyesi
+            retarget (bool): Zorluk son madencilik sürelerine göre otomatik ayarlansın mı
+            hash_algorithm (str): Yeni zincirin blok hash algoritması (kayıtlı zincir kendi algoritmasını kullanır)
+            consensus (str): 'pow' (nonce araması) veya 'poa' (yetkili imzası)
+            signer (AuthoritySigner): PoA imzalayıcısı (verilmezse POA_PRIVATE_KEY_PATH'ten yüklenir)
+            boot_verification (str): Yüklenen zincirin açılış doğrulaması - 'full', 'checkpoint' veya 'none'
         """
+        if consensus not in CONSENSUS_MODES:
+            raise ValueError(f"Desteklenmeyen konsensüs modu: {consensus}")
+        if boot_verification not in BOOT_VERIFICATION_MODES:
+            raise ValueError(f"Desteklenmeyen açılış doğrulama modu: {boot_verification}")
+        self.consensus = consensus
+        
+        # PoA'da anahtar gerekir; PoW'da varsa yalnızca eski imzalı blokları doğrulamak için yüklenir
+        if signer is None and (consensus == POA or os.path.exists(Config.POA_PRIVATE_KEY_PATH)):
+            signer = AuthoritySigner.load_or_create(Config.POA_PRIVATE_KEY_PATH)
+        self.signer = signer
+        self.authority_set = AuthoritySet.from_config(signer)
+        
         # ⭐ DATABASE MANAGER'ı kaydedelim
         self.database = database_manager
+        self.block_store = BlockBodyStore(database_manager) if database_manager else None  # Kayıtlar ihtiyaç oldukça okunur
+        self.retarget = retarget
+        self.restart_on_new_data = Config.MINING_RESTART_ON_NEW_DATA
+        self._mining_token = None  # Devam eden madenciliğin iptal sinyali
+        self._mining_preemptible = False
 
                 # ⭐ DATABASE'DEN YÜKLEME YAPALIM
         saved_state = self.load_from_database()
         if saved_state:
             print("✅ Önceki blockchain veritabanından yüklendi!")
             self.chain = saved_state['chain']
-            self.difficulty = saved_state['difficulty']
+            self.difficulty_bits = saved_state['difficulty_bits']
+            self.hash_algorithm = saved_state['hash_algorithm']
         else:
             print("🌱 Yeni genesis bloğu oluşturuldu!")
+            get_hash_function(hash_algorithm)  # Geçersiz algoritma ile zincir başlatılmaz
+            self.hash_algorithm = hash_algorithm
             self.chain = [self.create_genesis_block()]
-            self.difficulty = difficulty
-        self.pending_data = []  # Blok oluşturulmayı bekleyen veriler
+            self.difficulty_bits = difficulty_bits_for_level(difficulty)
+        self._persisted_height = len(self.chain) - 1 if saved_state else -1  # Veritabanındaki son blok
+        self.mempool = Mempool()  # Blok oluşturulmayı bekleyen veriler (eşzamanlı eklemeye dayanıklı)
         self.mining_reward = Config.BLOCKCHAIN_REWARD
+        # Blok ekleme, havuzdan düşme ve kayıt tek seferde yapılır (eşzamanlı madencilik işleri)
+        self._chain_lock = threading.Lock()
+        
+        # Okuma yanıtlarının sürüm anahtarı (bkz. read_version): zincir ucu ve bekleyen
+        # havuz dışındaki okunur durum (zorluk, doğrulama raporu, kontrol noktası) değiştikçe artar
+        self.state_version = 0
         
+        # Durum sorguları O(1) olsun diye tutulan sayaç ve doğrulama işareti:
+        # validated_height'e kadarki bloklar validated_hash ucuyla birlikte doğrulandı
+        self.total_transactions = sum(block.record_count for block in self.chain)
+        self.chain_index = self._build_chain_index()  # hash, kayıt ve hasta ID'si ile O(1) erişim
+        self.validated_height = 0
+        self.validated_hash = self.chain[0].hash
+        self.last_verification = None
+        self.last_full_verification = None  # Son tam (yönetici) doğrulamanın raporu
+        
+        # Açılış doğrulaması - kontrol noktası modunda yalnızca son kontrol noktasından sonraki bloklar
+        self.last_checkpoint = None
+        self.boot_verification = self._verify_on_boot(boot_verification)
+    
         
     def load_from_database(self):
-        """Blockchain'i veritabanından yükler"""
+        """
+        Blockchain'i veritabanından yükler
+        
+        Yalnızca blok başlıkları okunur; kayıtlar ilk erişimde block_store
+        üzerinden yüklenir. Açılış süresi kayıt hacmine değil blok sayısına bağlıdır.
+        """
         if not self.database:
             print("⚠️  Database manager bulunamadı - yeni zincir başlatılıyor")
             return None
         
         try:
-            saved_state = self.database.get_blockchain_state()
-            if not saved_state:
+            # Eski tek satırlık zincir kaydı varsa bir kez blok satırlarına taşınır
+            self.database.migrate_blockchain_state()
+            
+            headers = self.database.load_block_headers()
+            if not headers:
                 print("ℹ️  Kayıtlı blockchain bulunamadı - yeni başlatılıyor")
                 return None
+            chain_meta = self.database.get_chain_meta()
             
-            # JSON verisini parse et
-            chain_data = json.loads(saved_state['chain_data'])
+            # Algoritma kaydı olmayan eski zincirler SHA-256 ile hash'lenmiştir
+            hash_algorithm = chain_meta.get('hash_algorithm', DEFAULT_HASH_ALGORITHM)
+            get_hash_function(hash_algorithm)
             
-            # Dict'leri Block nesnelerine dönüştür
+            # Başlıkları Block nesnelerine dönüştür (data ilk erişimde okunur)
             chain_objects = []
-            for block_dict in chain_data['chain']:
+            for header in headers:
+                # Önceki bloğun hash metni paylaşılır (blok başına ayrı kopya tutulmaz)
+                previous_hash = header['previous_hash']
+                if chain_objects and chain_objects[-1].hash == previous_hash:
+                    previous_hash = chain_objects[-1].hash
                 block = Block(
-                    index=block_dict['index'],
-                    timestamp=block_dict['timestamp'],
-                    data=block_dict['data'],
-                    previous_hash=block_dict['previous_hash'],
-                    nonce=block_dict['nonce'],
-                    hash_value=block_dict['hash']  # Önceden hesaplanmış hash
+                    index=header['index'],
+                    timestamp=header['timestamp'],
+                    data=None,
+                    previous_hash=previous_hash,
+                    nonce=header['nonce'],
+                    hash_value=header['hash'],  # Önceden hesaplanmış hash
+                    difficulty_bits=header.get('difficulty_bits'),
+                    mining_time=header.get('mining_time'),
+                    hash_algorithm=hash_algorithm,
+                    signer=header.get('signer'),
+                    signature=header.get('signature'),
+                    version=header.get('version', Block.LEGACY_VERSION),
+                    merkle_root=header.get('merkle_root'),
+                    body_store=self.block_store,
+                    record_count=header['record_count']
                 )
                 chain_objects.append(block)
             
+            # Bit zorluğu olmayan eski kayıtlar için seviyeden türet
+            difficulty_bits = chain_meta.get('difficulty_bits')
+            if difficulty_bits is None:
+                difficulty_bits = difficulty_bits_for_level(chain_meta.get('difficulty', Config.BLOCKCHAIN_DIFFICULTY))
+            
             return {
                 'chain': chain_objects,
-                'difficulty': chain_data['difficulty']
+                'difficulty_bits': difficulty_bits,
+                'hash_algorithm': hash_algorithm
             }
             
         except Exception as e:
@@ -69,28 +159,32 @@ class Blockchain:
             return None
 
     def save_to_database(self):
-        """Blockchain'i veritabanına kaydeder"""
+        """
+        Blockchain'i veritabanına kaydeder
+        
+        Yalnızca henüz kaydedilmemiş bloklar kendi satırlarına eklenir; kayıt
+        maliyeti zincir uzunluğuna değil yeni blok sayısına bağlıdır.
+        """
         if not self.database:
             print("⚠️  Database manager bulunamadı - kayıt yapılamadı")
             return False
         
         try:
-            # Blockchain verisini hazırla
-            chain_data = {
-                'chain': [block.to_dict() for block in self.chain],
-                'difficulty': self.difficulty
+            # Kaydedilmemiş bloklar ve güncel zincir ayarları
+            new_blocks = [block.to_dict() for block in self.chain[self._persisted_height + 1:]]
+            chain_meta = {
+                'difficulty': self.difficulty,
+                'difficulty_bits': self.difficulty_bits,
+                'hash_algorithm': self.hash_algorithm
             }
             
-            # JSON'a dönüştür
-            chain_json = json.dumps(chain_data, indent=2)
-            
             # Veritabanına kaydet
-            success = self.database.save_blockchain_state(
-                chain_data=chain_json,
-                difficulty=self.difficulty
-            )
+            success = self.database.append_blocks(new_blocks, chain_meta)
             
             if success:
+                self._persisted_height = len(self.chain) - 1
+                self._persist_patient_postings()
+                self._maybe_create_checkpoint()
                 print(f"💾 Blockchain kaydedildi! Blok sayısı: {len(self.chain)}")
             else:
                 print("❌ Blockchain kaydedilemedi!")
@@ -101,9 +195,115 @@ class Blockchain:
             print(f"❌ Blockchain kaydetme hatası: {e}")
             return False
     
+    @property
+    def difficulty(self):
+        """Hex leading-zero seviyesi (bit zorluğunun 4'e bölümü, aşağı yuvarlanır)"""
+        return self.difficulty_bits // 4
+    
+    @difficulty.setter
+    def difficulty(self, level):
+        """Hex seviyesini bit zorluğu olarak ayarlar"""
+        self.set_difficulty_bits(difficulty_bits_for_level(level))
+    
+    def set_difficulty_bits(self, bits):
+        """
+        Bit cinsinden zorluğu ayarlar
+        
+        Devam eden bir madencilik varsa yeni zorlukla yeniden başlatılır.
+        Retarget açıkken takvimin altına inilemez (bkz. scheduled_difficulty_bits).
+        
+        Args:
+            bits (int): Leading-zero bit sayısı
+        
+        Returns:
+            int: Ayarlanan bit zorluğu
+        """
+        bits = max(Config.MIN_DIFFICULTY_BITS, min(Config.MAX_DIFFICULTY_BITS, int(bits)))
+        # Retarget açıkken takvimin altındaki zorlukla kazılan blok doğrulamadan geçmez
+        scheduled = self.scheduled_difficulty_bits()
+        if scheduled is not None:
+            bits = max(bits, scheduled)
+        changed = bits != self.difficulty_bits
+        self.difficulty_bits = bits
+        if changed:
+            self.state_version += 1
+            self.preempt_mining(MiningCancelToken.DIFFICULTY_CHANGED)
+        return self.difficulty_bits
+    
+    def preempt_mining(self, reason):
+        """
+        Devam eden madenciliği güncel durumla yeniden başlatmak için keser
+        
+        Args:
+            reason (str): Kesme nedeni
+        
+        Returns:
+            bool: Devam eden bir madencilik kesildi mi
+        """
+        token = self._mining_token
+        if token is None or not self._mining_preemptible:
+            return False
+        token.cancel(reason)
+        return True
+    
+    def cancel_mining(self, reason=MiningCancelToken.CANCELLED):
+        """
+        Devam eden madenciliği tamamen durdurur
+        
+        Args:
+            reason (str): Durdurma nedeni
+        
+        Returns:
+            bool: Devam eden bir madencilik durduruldu mu
+        """
+        token = self._mining_token
+        if token is None:
+            return False
+        token.cancel(reason)
+        return True
+    
+    def retarget_difficulty(self):
+        """
+        Son blokların madencilik sürelerine göre bit zorluğunu ayarlar
+        
+        Hesap mining.retarget_bits'tedir; doğrulama aynı takvimle bloklardaki
+        kayıtlı zorluğun takvimin altında olmadığını kontrol eder.
+        
+        Returns:
+            int: Yeni bit zorluğu
+        """
+        bits = retarget_bits(self.chain, self.difficulty_bits)
+        if bits is not None and bits != self.difficulty_bits:
+            old_bits = self.difficulty_bits
+            self.set_difficulty_bits(bits)
+            print(f"🎯 Zorluk ayarlandı: {old_bits} → {self.difficulty_bits} bit")
+        
+        return self.difficulty_bits
+    
+    def scheduled_difficulty_bits(self):
+        """
+        Retarget açıkken sonraki bloğun zorluğu için takvimin alt sınırı
+        
+        Returns:
+            int: Takvimdeki bit zorluğu veya None (retarget kapalı ya da pencere eksik)
+        """
+        if not self.retarget:
+            return None
+        return retarget_bits(self.chain, self.chain[-1].difficulty_bits)
+    
     def create_genesis_block(self):
         """Genesis bloğu oluşturur ve döndürür"""
-        return GenesisBlock()
+        return GenesisBlock(hash_algorithm=self.hash_algorithm)
+    
+    @property
+    def pending_data(self):
+        """Bekleyen kayıtların geliş sırasıyla kopyası (madencilikte ayrılmış olanlar dahil)"""
+        return self.mempool.records()
+    
+    @property
+    def pending_version(self):
+        """Bekleyen havuz her değiştiğinde artan sayaç"""
+        return self.mempool.version
     
     def get_latest_block(self):
         """Zincirdeki son bloğu döndürür"""
@@ -120,85 +320,453 @@ class Blockchain:
             bool: Ekleme başarılı mı
         """
         try:
-            self.pending_data.append(medical_data)
+            self.mempool.add(medical_data)
             print(f"📥 Bekleyen veri eklendi: {medical_data.get('record_id', 'Unknown')}")
+            
+            # Yeni veri eski nonce aramasının arkasında beklemesin
+            if self.restart_on_new_data:
+                self.preempt_mining(MiningCancelToken.PENDING_DATA_CHANGED)
             return True
         except Exception as e:
             print(f"❌ Veri eklenirken hata: {e}")
             return False
     
-    def mine_pending_data(self, miner_address="medical_system"):
+    def mine_pending_data(self, miner_address="medical_system", progress_callback=None,
+                          cancel_token=None, deadline=None, max_hashes=None):
         """
         Bekleyen verileri içeren yeni blok oluşturur ve madenciliği yapar
         
+        Madencilik sırasında zorluk değişirse ya da (restart_on_new_data açıksa)
+        yeni veri gelirse arama güncel bekleyen verilerle yeniden başlatılır.
+        Üst üste en fazla MINING_MAX_RESTARTS kez yeniden başlatılır; sonrasında
+        mevcut blok kesintisiz tamamlanır.
+        
+        Bloğun kayıtları havuzdan atomik olarak ayrılır (Mempool.take); madencilik
+        sürerken gelen kayıtlar havuzda bekler. Blok eklenemezse (iptal, hata ya da
+        bu arada zincire başka blok eklendiyse) ayrılan kayıtlar havuza geri döner.
+        
         Args:
             miner_address (str): Madencinin adresi (sistem tarafından yapıldığı için sabit)
+            progress_callback (callable): Denenen hash sayısıyla periyodik çağrılır (opsiyonel)
+            cancel_token (MiningCancelToken): Dışarıdan iptal sinyali (opsiyonel)
+            deadline (float): time.time() cinsinden son an (opsiyonel)
+            max_hashes (int): Denenecek en fazla hash sayısı (opsiyonel)
         
         Returns:
             Block: Oluşturulan blok veya None
+        
+        Raises:
+            MiningCancelled: Madencilik blok bulunamadan durdurulduysa
         """
-        if not self.pending_data:
+        if not self.mempool:
             print("⚠️  Madencilik için bekleyen veri yok!")
             return None
         
-        print(f"⛏️  {len(self.pending_data)} veri kaydı için madencilik başlıyor...")
+        if self.consensus == POA:
+            return self.seal_pending_data()
         
-        # Yeni blok oluştur
-        latest_block = self.get_latest_block()
-        new_block = Block(
-            index=len(self.chain),
-            timestamp=datetime.now().isoformat(),
-            data=self.pending_data.copy(),  # Bekleyen tüm verileri al
-            previous_hash=latest_block.hash
-        )
+        token = cancel_token or MiningCancelToken()
+        restarts = 0
+        batch = None
         
-        # Bloku mine et (leading-zero bulma)
-        start_time = datetime.now()
-        new_block.mine_block(self.difficulty)
-        end_time = datetime.now()
+        try:
+            while True:
+                # Önceki denemenin kayıtları geri verilir; yeni ayırma o arada gelenleri de içerir
+                if batch is not None:
+                    self.mempool.release(batch)
+                batch = self.mempool.take()
+                if batch is None:
+                    print("⚠️  Madencilik için bekleyen veri yok!")
+                    return None
+                
+                print(f"⛏️  {len(batch)} veri kaydı için madencilik başlıyor...")
+                self._mining_token = token
+                self._mining_preemptible = restarts < Config.MINING_MAX_RESTARTS
+                
+                # Yeni blok oluştur
+                latest_block = self.get_latest_block()
+                new_block = Block(
+                    index=len(self.chain),
+                    timestamp=datetime.now().isoformat(),
+                    data=batch.records,  # Ayrılan bekleyen veriler
+                    previous_hash=latest_block.hash,
+                    hash_algorithm=self.hash_algorithm,
+                    version=Block.MERKLE_VERSION
+                )
+                
+                # Bloku mine et (leading-zero bulma)
+                start_time = datetime.now()
+                mining_result = new_block.mine_block(
+                    self.difficulty,
+                    progress_callback=progress_callback,
+                    difficulty_bits=self.difficulty_bits,
+                    cancel_token=token,
+                    deadline=deadline,
+                    max_hashes=max_hashes
+                )
+                end_time = datetime.now()
+                
+                if mining_result['cancelled']:
+                    reason = mining_result['cancel_reason']
+                    if reason in (MiningCancelToken.DIFFICULTY_CHANGED, MiningCancelToken.PENDING_DATA_CHANGED):
+                        restarts += 1
+                        token.reset()
+                        print(f"🔁 Madencilik yeniden başlatılıyor ({reason})")
+                        continue
+                    
+                    raise MiningCancelled(reason, mining_result)
+                
+                # Bloğu zincire ekle ve içindeki verileri havuzdan düş (madencilik sırasında gelenler bekler)
+                with self._chain_lock:
+                    if self.get_latest_block() is latest_block:
+                        self._append_block(new_block)
+                        self.mempool.commit(batch)
+                        batch = None
+                        break
+                print("🔁 Zincire başka blok eklendi, madencilik yeni uçta yeniden başlatılıyor")
+        finally:
+            if batch is not None:
+                self.mempool.release(batch)
+            self._mining_token = None
+            self._mining_preemptible = False
         
         # Madencilik süresini hesapla
         mining_time = (end_time - start_time).total_seconds()
         print(f"⏱️  Madencilik süresi: {mining_time:.6f} saniye")
         
-        # Bloğu zincire ekle
-        self.chain.append(new_block)
+        with self._chain_lock:
+            # Hedef gecikmeye göre zorluğu ayarla
+            if self.retarget:
+                self.retarget_difficulty()
+            
+            # ⭐ YENİ: OTOMATİK DATABASE'E KAYDET
+            self.save_to_database()
+
+        print(f"✅ Blok #{new_block.index} zincire eklendi!")
+        print(f"📊 Zincir uzunluğu: {len(self.chain)}")
         
-        # Bekleyen verileri temizle
-        self.pending_data = []
+        return new_block
+    
+    def seal_pending_data(self):
+        """
+        Bekleyen verileri Proof-of-Authority ile mühürlenmiş bloğa ekler
+        
+        Nonce araması yapılmaz; blok hash'i bu düğümün Ed25519 anahtarıyla
+        imzalanır. Mühürleme anlık olduğundan iptal/yeniden başlatma gerekmez.
+        
+        Returns:
+            Block: Oluşturulan blok veya None
+        """
+        batch = self.mempool.take()
+        if batch is None:
+            print("⚠️  Mühürleme için bekleyen veri yok!")
+            return None
+        
+        try:
+            # Mühürleme anlık olduğundan zincir ucu kilit altında okunur
+            with self._chain_lock:
+                latest_block = self.get_latest_block()
+                new_block = Block(
+                    index=len(self.chain),
+                    timestamp=datetime.now().isoformat(),
+                    data=batch.records,
+                    previous_hash=latest_block.hash,
+                    hash_algorithm=self.hash_algorithm,
+                    version=Block.MERKLE_VERSION
+                )
+                seal_result = new_block.seal(self.signer)
+                print(f"🔏 Blok #{new_block.index} mühürlendi: {seal_result['mining_time'] * 1000:.3f} ms")
+                
+                self._append_block(new_block)
+                self.mempool.commit(batch)
+                batch = None
+                self.save_to_database()
+        finally:
+            if batch is not None:
+                self.mempool.release(batch)
         
-        # ⭐ YENİ: OTOMATİK DATABASE'E KAYDET
-        self.save_to_database()
-
         print(f"✅ Blok #{new_block.index} zincire eklendi!")
         print(f"📊 Zincir uzunluğu: {len(self.chain)}")
         
         return new_block
     
-    def is_chain_valid(self):
+    def _build_chain_index(self):
+        """
+        Zincir indeksini kurar; hasta indeksini veritabanındaki kopyadan yükler
+        
+        Kalıcı hasta indeksi yalnızca kaydedildiği yükseklikteki blok hâlâ
+        aynı hash'e sahipse kullanılır; aksi halde silinip zincirden yeniden
+        oluşturulur.
+        
+        Returns:
+            ChainIndex: Zincir indeksi
+        """
+        self._postings_persisted_height = 0
+        if not self.database:
+            return ChainIndex(self.chain)
+        
+        state = self.database.get_index_state('patient_postings')
+        if state and state['height'] < len(self.chain) and self.chain[state['height']].hash == state['tip_hash']:
+            # Kalıcı kopya ilk hasta sorgusunda yüklenir
+            self._postings_persisted_height = state['height']
+            chain_index = ChainIndex(self.chain, self.database.load_patient_postings, state['height'])
+        else:
+            self.database.clear_patient_postings()
+            chain_index = ChainIndex(self.chain)
+        
+        self._persist_patient_postings(chain_index)
+        return chain_index
+    
+    def _persist_patient_postings(self, chain_index=None):
+        """Kalıcı hasta indeksine henüz yazılmamış blokların kayıtlarını ekler"""
+        chain_index = chain_index or self.chain_index
+        tip_height = len(self.chain) - 1
+        if not self.database or self._postings_persisted_height >= tip_height:
+            return
+        
+        new_blocks = self.chain[self._postings_persisted_height + 1:]
+        rows = chain_index.patient_postings_for_blocks(new_blocks)
+        if self.database.append_patient_postings(rows, tip_height, self.chain[tip_height].hash):
+            self._postings_persisted_height = tip_height
+            chain_index.mark_postings_persisted(tip_height)
+    
+    def _append_block(self, block):
+        """Bloğu zincire ekler, O(1) sayaçları ve indeksleri günceller"""
+        # Zincirdeki kayıtlar değişmez; sözlükler yerine sütun düzeninde tutulur
+        block.compact_data()
+        self.chain.append(block)
+        self.total_transactions += block.record_count
+        self.chain_index.add_block(block)
+    
+    def _validate_block(self, current_block, previous_block):
+        """
+        Tek bir bloğu önceki bloğa göre doğrular
+        
+        Args:
+            current_block (Block): Doğrulanacak blok
+            previous_block (Block): Zincirde bir önceki blok
+        
+        Returns:
+            str: Hata açıklaması veya None (geçerliyse)
+        """
+        error = check_block(current_block, self.authority_set)
+        if error:
+            return error
+        
+        if self.retarget:
+            error = check_difficulty_schedule(self.chain, current_block.index)
+            if error:
+                return error
+        
+        # Önceki bloğun hash'i mevcut blokta doğru gösteriliyor mu?
+        if current_block.previous_hash != previous_block.hash:
+            return "önceki hash uyuşmuyor"
+        
+        return None
+    
+    def verify_chain(self, full=False, workers=1, deep=False):
+        """
+        Zinciri doğrular ve doğrulama işaretini ilerletir
+        
+        Artımlı modda yalnızca validated_height'ten sonraki bloklar kontrol
+        edilir; işaretteki blok artık aynı hash'e sahip değilse (zincir
+        değiştirildiyse) doğrulama baştan yapılır. full=True işareti sıfırlayıp
+        tüm blokları yeniden hash'ler. Bloklar saklanan kanonik byte'larıyla
+        hash'lenir; deep=True bu byte'ları atıp kayıtları yeniden serileştirir -
+        bellekteki kayıtların sonradan değiştirilmediğini görmenin tek yolu budur.
+        
+        Args:
+            full (bool): Tüm zinciri baştan doğrula
+            workers (int): Tam doğrulamada >1 ise hash'ler süreç havuzunda kontrol edilir
+            deep (bool): Saklanan kanonik byte'ları kullanma (full ile)
+        
+        Returns:
+            dict: Doğrulama raporu
+        """
+        if full and deep:
+            for block in self.chain:
+                block.clear_serialized()
+        
+        if full and workers > 1:
+            return self._verify_chain_parallel(workers)
+        
+        start_time = time.perf_counter()
+        height = self.validated_height
+        if full or height >= len(self.chain) or self.chain[height].hash != self.validated_hash:
+            self.validated_height = 0
+            self.validated_hash = self.chain[0].hash
+        
+        first_height = self.validated_height + 1
+        first_invalid_index = None
+        error = None
+        records = 0
+        for i in range(first_height, len(self.chain)):
+            error = self._validate_block(self.chain[i], self.chain[i - 1])
+            if error:
+                first_invalid_index = i
+                print(f"❌ Blok #{i} {error}!")
+                break
+            self.validated_height = i
+            self.validated_hash = self.chain[i].hash
+            records += self.chain[i].record_count
+        
+        checked_blocks = self.validated_height - first_height + 1 + (1 if error else 0)
+        duration = time.perf_counter() - start_time
+        self.last_verification = {
+            'valid': error is None,
+            'mode': 'serial',
+            'full': full,
+            'checked_blocks': checked_blocks,
+            'validated_height': self.validated_height,
+            'validated_hash': self.validated_hash,
+            'first_invalid_index': first_invalid_index,
+            'error': error,
+            'verified_records': records,
+            'duration_seconds': duration,
+            'blocks_per_second': (self.validated_height - first_height + 1) / duration if duration else None,
+            'records_per_second': records / duration if duration else None,
+            'verified_at': datetime.now().isoformat()
+        }
+        if full:
+            self.last_full_verification = self.last_verification
+            self.state_version += 1
+        
+        if error is None and (full or checked_blocks):
+            print(f"✅ Blockchain geçerli! ({checked_blocks} blok doğrulandı)")
+        return self.last_verification
+    
+    def _verify_chain_parallel(self, workers):
+        """
+        Tüm zinciri ParallelChainVerifier ile doğrular ve işareti günceller
+        
+        Args:
+            workers (int): Doğrulama süreç sayısı
+        
+        Returns:
+            dict: Doğrulama raporu
+        """
+        report = ParallelChainVerifier(workers).verify(self.chain, self.authority_set, retarget=self.retarget)
+        
+        if report['valid']:
+            self.validated_height = len(self.chain) - 1
+            print(f"✅ Blockchain geçerli! ({report['verified_blocks']} blok, "
+                  f"{report['blocks_per_second']:,.0f} blok/s, {report['workers']} süreç)")
+        else:
+            self.validated_height = report['first_invalid_index'] - 1
+            print(f"❌ Blok #{report['first_invalid_index']} {report['error']}!")
+        self.validated_hash = self.chain[self.validated_height].hash
+        
+        report.update({
+            'full': True,
+            'checked_blocks': report['blocks'],
+            'validated_height': self.validated_height,
+            'validated_hash': self.validated_hash
+        })
+        self.last_verification = report
+        self.last_full_verification = report
+        self.state_version += 1
+        return report
+    
+    def is_chain_valid(self, full=False):
         """
         Blockchain'in geçerliliğini kontrol eder
         
+        Daha önce doğrulanmış bloklar tekrar hash'lenmez; yalnızca yeni
+        bloklar kontrol edilir (bkz. verify_chain).
+        
+        Args:
+            full (bool): Tüm zinciri baştan doğrula
+        
         Returns:
             bool: Zincir geçerli mi
         """
-        # Tüm blokları kontrol et (genesis bloğundan başlayarak)
-        for i in range(1, len(self.chain)):
-            current_block = self.chain[i]
-            previous_block = self.chain[i - 1]
-            
-            # Mevcut bloğun hash'i doğru mu?
-            if not current_block.is_valid():
-                print(f"❌ Blok #{current_block.index} geçersiz hash!")
-                return False
-            
-            # Önceki bloğun hash'i mevcut blokta doğru gösteriliyor mu?
-            if current_block.previous_hash != previous_block.hash:
-                print(f"❌ Blok #{current_block.index} önceki hash uyuşmuyor!")
-                return False
+        return self.verify_chain(full)['valid']
+    
+    def _verify_on_boot(self, mode):
+        """
+        Yüklenen zinciri seçilen modda doğrular ve doğrulama işaretini ayarlar
         
-        print("✅ Blockchain geçerli!")
-        return True
+        Args:
+            mode (str): 'full', 'checkpoint' veya 'none'
+        
+        Returns:
+            dict: Açılış doğrulama raporu (durum endpoint'inde gösterilir)
+        """
+        start_time = time.perf_counter()
+        checkpoint = self._latest_valid_checkpoint() if self.database else None
+        
+        if mode == BOOT_NONE:
+            # Kayıtlı bloklara doğrulamadan güvenilir
+            self.validated_height = len(self.chain) - 1
+            self.validated_hash = self.chain[-1].hash
+            report = {'valid': None, 'checked_blocks': 0}
+        elif mode == BOOT_FULL:
+            report = self.verify_chain(full=True, workers=Config.VERIFY_WORKERS)
+        else:
+            if checkpoint:
+                self.validated_height = checkpoint['height']
+                self.validated_hash = checkpoint['tip_hash']
+                print(f"📍 Kontrol noktası #{checkpoint['height']} kullanılıyor - sonraki bloklar doğrulanacak")
+            report = self.verify_chain()
+        
+        boot_report = {
+            'mode': mode,
+            'checkpoint_height': checkpoint['height'] if checkpoint and mode == BOOT_CHECKPOINT else None,
+            'valid': report['valid'],
+            'checked_blocks': report['checked_blocks'],
+            'validated_height': self.validated_height,
+            'duration_seconds': time.perf_counter() - start_time,
+            'verified_at': datetime.now().isoformat()
+        }
+        
+        # Doğrulanan geçmiş bir sonraki açılışta tekrar hash'lenmesin
+        if report['valid']:
+            self._maybe_create_checkpoint()
+        return boot_report
+    
+    def _latest_valid_checkpoint(self):
+        """
+        Zincirle uyuşan en yeni kontrol noktasını bulur
+        
+        Returns:
+            dict: Kontrol noktası veya None
+        """
+        for checkpoint in self.database.get_checkpoints():
+            error = verify_checkpoint(checkpoint, self.chain, self.hash_algorithm, self.authority_set,
+                                      Config.CHECKPOINT_REQUIRE_SIGNATURE)
+            if error is None:
+                self.last_checkpoint = checkpoint
+                return checkpoint
+            print(f"⚠️  Kontrol noktası #{checkpoint['height']} kullanılmadı: {error}")
+        return None
+    
+    def create_checkpoint(self):
+        """
+        Doğrulanmış zincir ucuna kontrol noktası ekler (düğüm anahtarı varsa imzalanır)
+        
+        Returns:
+            dict: Kontrol noktası veya None (zincir geçersizse ya da kayıt yapılamadıysa)
+        """
+        if not self.database or not self.is_chain_valid():
+            return None
+        
+        checkpoint = create_checkpoint(self.chain, self.validated_height, self.hash_algorithm,
+                                       self.signer, self.last_checkpoint)
+        if not self.database.save_checkpoint(checkpoint):
+            return None
+        
+        self.last_checkpoint = checkpoint
+        self.state_version += 1
+        print(f"📍 Kontrol noktası oluşturuldu: blok #{checkpoint['height']}")
+        return checkpoint
+    
+    def _maybe_create_checkpoint(self):
+        """Son kontrol noktasından bu yana CHECKPOINT_INTERVAL kadar blok eklendiyse yenisini oluşturur"""
+        if not Config.CHECKPOINT_INTERVAL or not self.database:
+            return
+        last_height = self.last_checkpoint['height'] if self.last_checkpoint else 0
+        if len(self.chain) - 1 - last_height >= Config.CHECKPOINT_INTERVAL:
+            self.create_checkpoint()
     
     def get_chain_length(self):
         """Zincir uzunluğunu döndürür"""
@@ -228,10 +796,72 @@ class Blockchain:
         Returns:
             Block: Bulunan blok veya None
         """
-        for block in self.chain:
-            if block.hash == block_hash:
-                return block
-        return None
+        height = self.chain_index.height_for_hash(block_hash)
+        if height is None:
+            return None
+        return self.chain[height]
+    
+    def _record_result(self, height, position):
+        """İndeksteki konumdan arama sonucu üretir"""
+        block = self.chain[height]
+        return {
+            'block_index': block.index,
+            'block_hash': block.hash,
+            'block_timestamp': block.timestamp,
+            'position': position,
+            'medical_data': block.data[position]
+        }
+    
+    def find_record(self, record_id):
+        """
+        record_id veya data_id ile kayıtları indeksten bulur
+        
+        Args:
+            record_id (str): Kayıt ya da veri ID'si
+        
+        Returns:
+            list: Bulunan kayıtlar (blok bilgisi ve blok içindeki sırasıyla)
+        """
+        locations = self.chain_index.locate_record(record_id) + self.chain_index.locate_data(record_id)
+        return [self._record_result(height, position) for height, position in sorted(set(locations))]
+    
+    def get_record_proof(self, height, position, anchor_hash=None):
+        """
+        Kaydın Merkle dahil olma kanıtını ve doğrulama için başlık zincirini üretir
+        
+        İstemci kaydın yaprak hash'inden kanıtla kökü, başlıktan blok hash'ini
+        hesaplar; ardından headers listesinde her başlığın previous_hash'inin
+        bir öncekinin hash'i olduğunu kontrol ederek güvendiği bloğa ulaşır.
+        
+        Args:
+            height (int): Kaydın blok index'i
+            position (int): Kaydın blok içindeki sırası
+            anchor_hash (str): İstemcinin güvendiği sonraki blok (varsayılan: zincir ucu)
+        
+        Returns:
+            dict: Kayıt, kanıt, blok başlığı ve sonraki başlıklar
+        
+        Raises:
+            ValueError: Blok Merkle kökü taşımıyorsa ya da anchor geçersizse
+        """
+        block = self.chain[height]
+        if block.merkle_root is None:
+            raise ValueError(f"Blok #{height} Merkle kökü içermiyor (sürüm {block.version})")
+        
+        anchor_height = len(self.chain) - 1
+        if anchor_hash:
+            anchor_height = self.chain_index.height_for_hash(anchor_hash)
+            if anchor_height is None or anchor_height < height:
+                raise ValueError(f"Geçersiz anchor: {anchor_hash}")
+        
+        return {
+            'hash_algorithm': self.hash_algorithm,
+            'medical_data': block.data[position],
+            'position': position,
+            'proof': merkle_proof(block.canonical_data(), position, self.hash_algorithm),
+            'block_header': block.header(),
+            'headers': [self.chain[i].header() for i in range(height + 1, anchor_height + 1)]
+        }
     
     def search_medical_data(self, patient_id=None, record_id=None):
         """
@@ -244,6 +874,24 @@ class Blockchain:
         Returns:
             list: Bulunan veriler listesi
         """
+        # record_id verildiyse tarama yerine indeks kullanılır
+        if record_id:
+            return [
+                result for result in (
+                    self._record_result(height, position)
+                    for height, position in self.chain_index.locate_record(record_id)
+                )
+                if not patient_id or result['medical_data'].get('patient_id') == patient_id
+            ]
+        
+        # Hasta araması yalnızca o hastanın kayıt sayısı kadar iş yapar
+        if patient_id:
+            return [
+                self._record_result(height, position)
+                for height, position in self.chain_index.locate_patient(patient_id)
+            ]
+        
+        # Filtre yoksa tüm kayıtlar döner
         results = []
         
         for block in self.chain:
@@ -251,37 +899,84 @@ class Blockchain:
             if block.index == 0:
                 continue
             
-            # Bloktaki tüm verileri kontrol et
             for medical_data in block.data:
-                match = True
-                
-                if patient_id and medical_data.get('patient_id') != patient_id:
-                    match = False
-                
-                if record_id and medical_data.get('record_id') != record_id:
-                    match = False
-                
-                if match:
-                    results.append({
-                        'block_index': block.index,
-                        'block_hash': block.hash,
-                        'block_timestamp': block.timestamp,
-                        'medical_data': medical_data
-                    })
+                results.append({
+                    'block_index': block.index,
+                    'block_hash': block.hash,
+                    'block_timestamp': block.timestamp,
+                    'medical_data': medical_data
+                })
         
         return results
     
+    def query_records_by_time(self, start=None, end=None, patient_id=None, limit=100, cursor=None):
+        """
+        Zaman aralığındaki kayıtları zaman sırasıyla, sayfalı olarak getirir
+        
+        Args:
+            start (str): En erken zaman - ISO 8601, dahil (opsiyonel)
+            end (str): En geç zaman - ISO 8601, hariç (opsiyonel)
+            patient_id (str): Yalnızca bu hastanın kayıtları (opsiyonel)
+            limit (int): Sayfa boyutu
+            cursor (str): Önceki sayfanın next_cursor değeri (opsiyonel)
+        
+        Returns:
+            dict: records ve bir sonraki sayfa için next_cursor (son sayfada None)
+        
+        Raises:
+            ValueError: Geçersiz cursor
+        """
+        after = None
+        if cursor:
+            try:
+                height, position, timestamp = cursor.split(':', 2)
+                after = (timestamp, int(height), int(position))
+            except ValueError:
+                raise ValueError(f"Geçersiz cursor: {cursor}")
+        
+        keys, next_key = self.chain_index.time_range(start, end, patient_id, after, limit)
+        return {
+            'records': [self._record_result(height, position) for _, height, position in keys],
+            'next_cursor': f"{next_key[1]}:{next_key[2]}:{next_key[0]}" if next_key else None
+        }
+    
+    def read_version(self):
+        """
+        Okuma yanıtlarının (durum, zincir) değişip değişmediğini gösteren anahtar
+        
+        Zincir ucu, bekleyen havuz veya okunur durum değişmedikçe aynı kalır;
+        yanıt üretmeden O(1) hesaplanır. ETag ve yanıt önbelleği bu anahtarla çalışır.
+        İndeks istatistikleri de anahtara girer: gecikmeli kurulan indeksler
+        zincir ucu değişmeden durum yanıtını değiştirir.
+        
+        Returns:
+            tuple: (yükseklik, uç hash'i, pending_version, state_version, zorluk seviyesi, indeks boyutları)
+        """
+        return (len(self.chain) - 1, self.chain[-1].hash, self.pending_version, self.state_version, self.difficulty,
+                tuple(self.chain_index.stats().values()))
+    
     def get_chain_stats(self):
         """Blockchain istatistiklerini döndürür"""
-        total_blocks = len(self.chain)
-        total_transactions = sum(len(block.data) for block in self.chain if block.index > 0)
-        
         return {
-            'total_blocks': total_blocks,
-            'total_transactions': total_transactions,
+            'total_blocks': len(self.chain),
+            'total_transactions': self.total_transactions,
             'difficulty': self.difficulty,
-            'pending_transactions': len(self.pending_data),
-            'is_valid': self.is_chain_valid()
+            'difficulty_bits': self.difficulty_bits,
+            'hash_algorithm': self.hash_algorithm,
+            'consensus': self.consensus,
+            'authority': self.signer.signer_id if self.signer else None,
+            'retarget_enabled': self.retarget,
+            'pending_transactions': len(self.mempool),
+            'is_valid': self.is_chain_valid(),
+            'validated_height': self.validated_height,
+            'index': self.chain_index.stats(),
+            'last_full_verification': self.last_full_verification,
+            'boot_verification': self.boot_verification,
+            'last_checkpoint': {
+                'height': self.last_checkpoint['height'],
+                'tip_hash': self.last_checkpoint['tip_hash'],
+                'signer': self.last_checkpoint['signer']
+            } if self.last_checkpoint else None
         }
     
     def to_dict(self):
@@ -289,10 +984,146 @@ class Blockchain:
         return {
             "chain": [block.to_dict() for block in self.chain],
             "difficulty": self.difficulty,
+            "difficulty_bits": self.difficulty_bits,
+            "hash_algorithm": self.hash_algorithm,
             "pending_data": self.pending_data,
             "mining_reward": self.mining_reward
         }
     
     def to_json(self):
         """Blockchain nesnesini JSON formatına dönüştürür"""
-        return json.dumps(self.to_dict(), indent=2)
\ No newline at end of file
+        return json.dumps(self.to_dict(), indent=2)
+    
+    def to_json_bytes(self):
+        """
+        to_dict çıktısının JSON'unu (sort_keys, boşluksuz) byte olarak üretir
+        
+        Bloklar her seferinde yeniden serileştirilmez; saklanan API JSON
+        parçaları (Block.api_json) birleştirilir. Yalnızca bekleyen veriler
+        ve zincir ayarları her istekte kodlanır.
+        
+        Returns:
+            bytes: Tam zincir JSON'u
+        """
+        return b''.join(self.iter_json_chunks())
+    
+    def iter_json_chunks(self, chunk_size=Config.CHAIN_STREAM_CHUNK_SIZE):
+        """
+        to_json_bytes çıktısını parça parça üretir - akışlı tam zincir yanıtı için
+        
+        Yanıtın tamamı bellekte birleştirilmez; aynı anda yalnızca yaklaşık
+        chunk_size byte'lık blok JSON'u tutulur. Zincir boyu ve bekleyen
+        veriler ilk parçada sabitlenir, sonradan eklenen bloklar yanıta girmez.
+        
+        Args:
+            chunk_size (int): Bir parçada biriktirilecek yaklaşık byte sayısı
+        
+        Yields:
+            bytes: JSON parçaları
+        """
+        stop = len(self.chain)
+        settings = json.dumps({
+            "difficulty": self.difficulty,
+            "difficulty_bits": self.difficulty_bits,
+            "hash_algorithm": self.hash_algorithm,
+            "pending_data": self.pending_data,
+            "mining_reward": self.mining_reward
+        }, sort_keys=True, separators=(',', ':')).encode()
+        
+        # "chain" sıralı anahtarların ilkidir
+        buffer = [b'{"chain":[']
+        size = 0
+        for position, encoded in enumerate(self.iter_block_json(0, stop)):
+            if position:
+                buffer.append(b',')
+            buffer.append(encoded)
+            size += len(encoded)
+            if size >= chunk_size:
+                yield b''.join(buffer)
+                buffer = []
+                size = 0
+        buffer.append(b'],')
+        buffer.append(settings[1:])
+        yield b''.join(buffer)
+    
+    def iter_block_json(self, start=0, stop=None, headers_only=False):
+        """
+        Yükseklik aralığındaki blokların JSON'unu sırayla üretir
+        
+        Bloklar tek tek serileştirilir; başlığı yüklenmiş bloklarda
+        headers_only ile kayıt gövdeleri veritabanından hiç okunmaz.
+        
+        Args:
+            start (int): İlk blok yüksekliği (dahil)
+            stop (int): Son blok yüksekliği (hariç, None: zincir sonu)
+            headers_only (bool): True ise Block.header() alanları, değilse Block.to_dict()
+        
+        Yields:
+            bytes: Blok başına JSON (sort_keys, boşluksuz)
+        """
+        stop = len(self.chain) if stop is None else min(stop, len(self.chain))
+        for height in range(max(start, 0), stop):
+            block = self.chain[height]
+            if headers_only:
+                yield json.dumps(block.header(), sort_keys=True, separators=(',', ':')).encode()
+            else:
+                yield block.api_json()
+    
+    def get_chain_page(self, start=0, limit=Config.CHAIN_PAGE_SIZE, headers_only=False):
+        """
+        Zincirin bir yükseklik aralığını sayfa olarak JSON byte'larına dönüştürür
+        
+        Yanıt boyutu zincir uzunluğundan bağımsızdır; bekleyen verilerin
+        kendisi yerine yalnızca sayısı döner.
+        
+        Args:
+            start (int): İlk blok yüksekliği
+            limit (int): Sayfadaki en fazla blok sayısı
+            headers_only (bool): True ise kayıtlar olmadan yalnızca başlıklar
+        
+        Returns:
+            bytes: chain, count, next_from (son sayfada None), total_blocks ve
+            zincir ayarlarını içeren JSON
+        """
+        total_blocks = len(self.chain)
+        stop = min(start + limit, total_blocks)
+        blocks = list(self.iter_block_json(start, stop, headers_only))
+        page = json.dumps({
+            "from": start,
+            "limit": limit,
+            "count": len(blocks),
+            "next_from": stop if stop < total_blocks else None,
+            "total_blocks": total_blocks,
+            "headers_only": headers_only,
+            "difficulty": self.difficulty,
+            "difficulty_bits": self.difficulty_bits,
+            "hash_algorithm": self.hash_algorithm,
+            "pending_count": len(self.mempool)
+        }, sort_keys=True, separators=(',', ':')).encode()
+        # "chain" sıralı anahtarların ilkidir
+        return b'{"chain":[' + b','.join(blocks) + b'],' + page[1:]
+    
+    def iter_binary(self, start=0, stop=None):
+        """
+        Yükseklik aralığını block_codec ikili formatında blok blok üretir (application/octet-stream dışa aktarımı)
+        
+        Args:
+            start (int): İlk blok yüksekliği (dahil)
+            stop (int): Son blok yüksekliği (hariç, None: zincir sonu)
+        
+        Yields:
+            bytes: block_codec.iter_encode_chain parçaları - birleşimi decode_chain ile okunur
+        """
+        stop = len(self.chain) if stop is None else min(stop, len(self.chain))
+        start = min(max(start, 0), stop)
+        blocks = (self.chain[height].to_dict() for height in range(start, stop))
+        return block_codec.iter_encode_chain(blocks, stop - start)
+    
+    def to_binary(self):
+        """
+        Zinciri block_codec ikili formatına dönüştürür
+        
+        Returns:
+            bytes: block_codec.encode_chain çıktısı
+        """
+        return b''.join(self.iter_binary())
\ No newline at end of file
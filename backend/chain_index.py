@@ -0,0 +1,283 @@
+# Zincir indeksleri - Hash, kayıt/hasta ID'si ve zaman aralığına göre blok/kayıt erişimi
+import threading
+from bisect import bisect_left, bisect_right, insort
+from record_batch import record_column
+
+
+class ChainIndex:
+    """Bellek içi zincir indeksi
+    
+    Blok eklendikçe güncellenir, zincir yüklenirken baştan kurulur:
+    - blok hash'i -> blok index'i
+    - record_id / data_id -> [(blok index'i, blok içindeki sıra), ...]
+    - patient_id -> [(blok index'i, blok içindeki sıra), ...] (zincir sırasıyla)
+    - (timestamp, blok index'i, sıra) sıralı listeleri - genel ve hasta bazında;
+      zaman aralığı sorguları ikili arama ile çözülür
+    
+    Açılışta yalnızca hash indeksi kurulur (blok başlıkları yeterlidir).
+    Hasta indeksi veritabanında da tutulur ve ilk hasta sorgusunda yüklenir;
+    kalıcı kopyanın güncel olduğu yüksekliğe kadar olan bloklar yeniden
+    taranmaz. Kayıt ID'si ve zaman indeksleri blok kayıtlarını
+    gerektirdiğinden ilk kullanımda zincirden kurulur.
+    """
+    
+    def __init__(self, chain=(), patient_postings=None, postings_height=0):
+        """
+        Args:
+            chain (iterable): İndekslenecek bloklar (opsiyonel)
+            patient_postings (callable): Kalıcı hasta indeksini yükleyen fonksiyon (opsiyonel)
+            postings_height (int): patient_postings'in güncel olduğu son blok
+        """
+        self.rebuild(chain, patient_postings, postings_height)
+    
+    def rebuild(self, chain, patient_postings=None, postings_height=0):
+        """
+        İndeksi verilen zincirden baştan kurar
+        
+        Args:
+            chain (list): Block listesi - kayıt indeksleri ilk kullanımda bu listeden kurulur
+            patient_postings (callable): Hazır hasta indeksini döndüren fonksiyon - ilk hasta
+                sorgusunda postings_height ile çağrılır ve yalnızca o bloğa kadarki kayıtları
+                döndürür (None dönerse zincir taranır)
+            postings_height (int): patient_postings'in güncel olduğu son blok
+        """
+        self.chain = chain if isinstance(chain, list) else list(chain)
+        self.hash_to_height = {block.hash: block.index for block in self.chain}
+        self._lock = threading.Lock()
+        
+        # Tembel kurulan indekslerin güncel olduğu son blok (kurulmadıysa None)
+        self._postings_loader = patient_postings
+        self._postings_height = postings_height
+        self._patients_height = None
+        self._records_height = None
+        self.patient_postings = {}
+        self.record_locations = {}
+        self.data_locations = {}
+        self.time_index = []
+        self.patient_time_index = {}
+    
+    def _ensure_patient_postings(self):
+        """Hasta indeksini ilk kullanımda kalıcı kopyadan yükler, eksik blokları zincirden ekler"""
+        if self._patients_height is not None:
+            return
+        with self._lock:
+            if self._patients_height is not None:
+                return
+            # Kalıcı kopyaya sonradan yazılan bloklar zincirden ekleneceği için yüklenmez
+            postings = self._postings_loader(self._postings_height) if self._postings_loader else None
+            start = self._postings_height + 1
+            if postings is None:
+                postings, start = {}, 0
+            self.patient_postings = postings
+            blocks = list(self.chain)
+            for block in blocks[start:]:
+                self._add_patient_postings(block)
+            self._postings_loader = None
+            self._patients_height = blocks[-1].index if blocks else -1
+    
+    def mark_postings_persisted(self, height):
+        """
+        Kalıcı hasta indeksinin ilerlediğini bildirir
+        
+        Hasta indeksi henüz yüklenmediyse bu yüksekliğe kadarki bloklar ilk
+        sorguda zincir yerine kalıcı kopyadan okunur.
+        
+        Args:
+            height (int): Kalıcı kopyanın güncel olduğu son blok
+        """
+        with self._lock:
+            if self._patients_height is None and self._postings_loader and height > self._postings_height:
+                self._postings_height = height
+    
+    def _ensure_record_indexes(self):
+        """Kayıt ID'si ve zaman indekslerini ilk kullanımda zincirin tamamından kurar"""
+        if self._records_height is not None:
+            return
+        with self._lock:
+            if self._records_height is not None:
+                return
+            blocks = list(self.chain)
+            for block in blocks:
+                self._add_record_ids(block)
+                # Zaman anahtarları toplanıp sonda tek seferde sıralanır (blok blok insort yerine)
+                for patient_id, key in self._time_keys(block):
+                    self.time_index.append(key)
+                    if patient_id is not None:
+                        self.patient_time_index.setdefault(patient_id, []).append(key)
+            self.time_index.sort()
+            for keys in self.patient_time_index.values():
+                keys.sort()
+            self._records_height = blocks[-1].index if blocks else -1
+    
+    @staticmethod
+    def _time_keys(block):
+        """
+        Bloktaki kayıtların zaman anahtarlarını üretir (zaman damgası olmayanlar atlanır)
+        
+        Yields:
+            tuple: (patient_id, (timestamp, blok index'i, sıra))
+        """
+        if block.index == 0:
+            return
+        data = block.data
+        patient_ids = record_column(data, 'patient_id')
+        for position, timestamp in enumerate(record_column(data, 'timestamp')):
+            if timestamp:
+                yield patient_ids[position], (timestamp, block.index, position)
+    
+    def _add_patient_postings(self, block):
+        """Bloğun kayıtlarını hasta indeksine ekler"""
+        # Genesis bloğunun verisi tıbbi kayıt listesi değildir
+        if block.index == 0:
+            return
+        for position, patient_id in enumerate(record_column(block.data, 'patient_id')):
+            if patient_id is not None:
+                self.patient_postings.setdefault(patient_id, []).append((block.index, position))
+    
+    def _add_record_ids(self, block):
+        """Bloğun kayıtlarını record_id / data_id indekslerine ekler"""
+        if block.index == 0:
+            return
+        data = block.data
+        record_ids = record_column(data, 'record_id')
+        for position, data_id in enumerate(record_column(data, 'data_id')):
+            location = (block.index, position)
+            record_id = record_ids[position]
+            if record_id is not None:
+                self.record_locations.setdefault(record_id, []).append(location)
+            if data_id is not None:
+                self.data_locations.setdefault(data_id, []).append(location)
+    
+    def add_block(self, block):
+        """
+        Zincire eklenen bloğu indekse ekler
+        
+        Args:
+            block (Block): Eklenen blok (zincir listesine eklendikten sonra)
+        """
+        self.hash_to_height[block.hash] = block.index
+        
+        with self._lock:
+            # Henüz kurulmamış ya da kurulumda bloğu zaten taramış indeksler atlanır
+            if self._patients_height is not None and block.index > self._patients_height:
+                self._add_patient_postings(block)
+                self._patients_height = block.index
+            if self._records_height is None or block.index <= self._records_height:
+                return
+            self._add_record_ids(block)
+            # Kayıtlar çoğunlukla zaman sırasıyla geldiğinden insort listenin sonuna ekler
+            for patient_id, key in self._time_keys(block):
+                insort(self.time_index, key)
+                if patient_id is not None:
+                    insort(self.patient_time_index.setdefault(patient_id, []), key)
+            self._records_height = block.index
+    
+    def height_for_hash(self, block_hash):
+        """
+        Hash'e karşılık gelen blok index'ini döndürür
+        
+        Args:
+            block_hash (str): Blok hash'i
+        
+        Returns:
+            int: Blok index'i veya None
+        """
+        return self.hash_to_height.get(block_hash)
+    
+    def locate_record(self, record_id):
+        """
+        record_id alanına göre kayıtların konumlarını döndürür
+        
+        Args:
+            record_id (str): Kayıt ID'si
+        
+        Returns:
+            list: (blok index'i, sıra) çiftleri
+        """
+        self._ensure_record_indexes()
+        return self.record_locations.get(record_id, [])
+    
+    def locate_data(self, data_id):
+        """
+        data_id alanına göre kayıtların konumlarını döndürür
+        
+        Args:
+            data_id (str): Veri ID'si
+        
+        Returns:
+            list: (blok index'i, sıra) çiftleri
+        """
+        self._ensure_record_indexes()
+        return self.data_locations.get(data_id, [])
+    
+    def locate_patient(self, patient_id):
+        """
+        Hastanın zincirdeki tüm kayıtlarının konumlarını döndürür
+        
+        Args:
+            patient_id (str): Hasta ID'si
+        
+        Returns:
+            list: (blok index'i, sıra) çiftleri, zincir sırasıyla
+        """
+        self._ensure_patient_postings()
+        return self.patient_postings.get(patient_id, [])
+    
+    def time_range(self, start=None, end=None, patient_id=None, after=None, limit=100):
+        """
+        Zaman aralığındaki kayıtların konumlarını zaman sırasıyla döndürür
+        
+        Aralık [start, end) şeklindedir; sınırlar ISO 8601 metinleridir ve
+        kayıt zaman damgalarıyla metin olarak karşılaştırılır. Başlangıç
+        ikili arama ile bulunur; yalnızca döndürülen kayıtlar kadar iş yapılır.
+        
+        Args:
+            start (str): En erken zaman (dahil, opsiyonel)
+            end (str): En geç zaman (hariç, opsiyonel)
+            patient_id (str): Yalnızca bu hastanın kayıtları (opsiyonel)
+            after (tuple): Önceki sayfanın son anahtarı (timestamp, blok, sıra) - sayfalama için
+            limit (int): En fazla sonuç sayısı
+        
+        Returns:
+            tuple: ([(timestamp, blok index'i, sıra), ...], sonraki sayfa anahtarı veya None)
+        """
+        self._ensure_record_indexes()
+        keys = self.time_index if patient_id is None else self.patient_time_index.get(patient_id, [])
+        
+        lo = bisect_left(keys, (start,)) if start else 0
+        if after is not None:
+            lo = max(lo, bisect_right(keys, after))
+        hi = bisect_left(keys, (end,)) if end else len(keys)
+        
+        page = keys[lo:min(hi, lo + limit)]
+        next_key = page[-1] if page and lo + limit < hi else None
+        return page, next_key
+    
+    def patient_postings_for_blocks(self, blocks):
+        """
+        Verilen blokların hasta indeksi satırlarını üretir - kalıcı kayıt için
+        
+        Args:
+            blocks (iterable): Block listesi
+        
+        Returns:
+            list: (patient_id, blok index'i, sıra) satırları
+        """
+        return [
+            (patient_id, block.index, position)
+            for block in blocks if block.index > 0
+            for position, patient_id in enumerate(record_column(block.data, 'patient_id'))
+            if patient_id is not None
+        ]
+    
+    def stats(self):
+        """İndeks boyutlarını döndürür"""
+        return {
+            'indexed_blocks': len(self.hash_to_height),
+            'patient_index_ready': self._patients_height is not None,
+            'record_indexes_ready': self._records_height is not None,
+            'indexed_record_ids': len(self.record_locations),
+            'indexed_data_ids': len(self.data_locations),
+            'indexed_patients': len(self.patient_postings),
+            'indexed_timestamps': len(self.time_index)
+        }
@@ -0,0 +1,241 @@
+# Paralel zincir doğrulama - Tam denetim için blok hash'lerini süreç havuzunda kontrol eder
+import argparse
+import json
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from checkpoints import BOOT_NONE
+from config import Config
+from consensus import AuthoritySet
+from mining import retarget_bits
+
+
+def check_block(block, authority_set):
+    """
+    Bloğu tek başına doğrular (önceki blokla bağlantı hariç)
+    
+    Kurallar konsensüs modundan bağımsızdır: imzalı bloklar imzayla, imzasız
+    bloklar madencilik kanıtıyla doğrulanır.
+    
+    Args:
+        block (Block): Doğrulanacak blok
+        authority_set (AuthoritySet): PoA yetkili anahtarları
+    
+    Returns:
+        str: Hata açıklaması veya None (geçerliyse)
+    """
+    # Bloğun hash'i doğru mu? (kayıtlı bit zorluğu da kontrol edilir)
+    if not block.is_valid():
+        return "geçersiz hash"
+    
+    # PoA bloğu yetkili bir anahtarla imzalanmış olmalı
+    if block.is_sealed():
+        if not block.verify_seal(authority_set):
+            return "geçersiz ya da yetkisiz imza"
+    elif block.index > 0 and block.get_leading_zero_bits() < Config.MIN_DIFFICULTY_BITS:
+        # İmzasız bloklar her modda madencilik kanıtı taşımalı - kayıtlı zorluk
+        # None olsa da (eski seviye 1-5 blokları en az 4 bit sıfırla başlar)
+        return "imzasız ve PoW kanıtı yok"
+    
+    # Kayıtlı zorluk kabul edilen alt sınırın altında olamaz
+    if block.difficulty_bits is not None and block.difficulty_bits < Config.MIN_DIFFICULTY_BITS:
+        return "zorluğu çok düşük"
+    
+    return None
+
+
+def check_difficulty_schedule(chain, height):
+    """
+    Kazılmış bloğun kayıtlı zorluğunun retarget takviminin altında olmadığını kontrol eder
+    
+    Takvim değeri bloktan önceki başlıklardan mining.retarget_bits ile
+    hesaplanır; pencere eksikse ya da blok imzalıysa kontrol yapılmaz.
+    
+    Args:
+        chain (list): Block listesi
+        height (int): Kontrol edilecek blok yüksekliği
+    
+    Returns:
+        str: Hata açıklaması veya None (geçerliyse)
+    """
+    block = chain[height]
+    if height < 2 or block.is_sealed():
+        return None
+    
+    window_start = max(0, height - Config.RETARGET_WINDOW)
+    scheduled = retarget_bits(chain[window_start:height], chain[height - 1].difficulty_bits)
+    if scheduled is not None and (block.difficulty_bits is None or block.difficulty_bits < scheduled):
+        return f"zorluğu retarget takviminin altında ({block.difficulty_bits} < {scheduled} bit)"
+    return None
+
+
+# İşçi süreçlerinin paylaşılan durumu (initializer ile atanır; fork'ta kopyalanmaz)
+_worker_chain = None
+_worker_authority_set = None
+_worker_retarget = False
+
+
+def _init_verifier_worker(chain, authority_keys, retarget=False):
+    """İşçi sürecine zinciri ve doğrulama ayarlarını bağlar"""
+    global _worker_chain, _worker_authority_set, _worker_retarget
+    _worker_chain = chain
+    _worker_authority_set = AuthoritySet(authority_keys)
+    _worker_retarget = retarget
+
+
+def _verify_range(start, stop):
+    """
+    [start, stop) aralığındaki blokların hash ve imzalarını kontrol eder
+    
+    Returns:
+        tuple: (ilk geçersiz index veya None, hata, kayıt sayısı)
+    """
+    records = 0
+    for i in range(start, stop):
+        block = _worker_chain[i]
+        error = check_block(block, _worker_authority_set)
+        if not error and _worker_retarget:
+            error = check_difficulty_schedule(_worker_chain, i)
+        if error:
+            return i, error, records
+        records += block.record_count
+    return None, None, records
+
+
+class ParallelChainVerifier:
+    """Paralel tam zincir doğrulayıcı
+    
+    Blok hash kontrolleri birbirinden bağımsızdır: zincir aralıklara bölünüp
+    süreç havuzunda hash'lenir, previous_hash bağlantıları ise sonrasında ana
+    süreçte (hash yeniden hesaplanmadan) sırayla kontrol edilir.
+    """
+    
+    # İşçi başına aralık sayısı - yavaş aralıklar tek işçiyi bekletmesin
+    RANGES_PER_WORKER = 4
+    
+    def __init__(self, workers=Config.VERIFY_WORKERS):
+        """
+        Args:
+            workers (int): Doğrulama süreç sayısı (1 ile çekirdek sayısı arasına sınırlanır)
+        """
+        self.workers = max(1, min(int(workers), os.cpu_count() or 1))
+    
+    def split_ranges(self, length):
+        """
+        1..length aralığını (genesis hariç) yaklaşık eşit parçalara böler
+        
+        Args:
+            length (int): Zincir uzunluğu
+        
+        Returns:
+            list: (start, stop) çiftleri
+        """
+        count = length - 1
+        if count <= 0:
+            return []
+        range_count = min(count, self.workers * self.RANGES_PER_WORKER)
+        size = -(-count // range_count)
+        return [(start, min(start + size, length)) for start in range(1, length, size)]
+    
+    def verify(self, chain, authority_set, retarget=False):
+        """
+        Zinciri paralel olarak doğrular
+        
+        Args:
+            chain (list): Block listesi
+            authority_set (AuthoritySet): PoA yetkili anahtarları
+            retarget (bool): Kayıtlı zorluklar retarget takvimine göre de kontrol edilsin mi
+        
+        Returns:
+            dict: Doğrulama raporu (ilk geçersiz blok ve blok/s, kayıt/s)
+        """
+        start_time = time.perf_counter()
+        ranges = self.split_ranges(len(chain))
+        authority_keys = authority_set.to_list()
+        
+        if self.workers == 1 or len(ranges) <= 1:
+            _init_verifier_worker(chain, authority_keys, retarget)
+            try:
+                range_results = [_verify_range(start, stop) for start, stop in ranges]
+            finally:
+                _init_verifier_worker(None, ())
+        else:
+            context = multiprocessing.get_context()
+            with ProcessPoolExecutor(max_workers=self.workers, mp_context=context,
+                                     initializer=_init_verifier_worker,
+                                     initargs=(chain, authority_keys, retarget)) as pool:
+                range_results = list(pool.map(_verify_range, *zip(*ranges)))
+        hash_time = time.perf_counter() - start_time
+        
+        # İlk geçersiz blok: aralıklardaki hash/imza hataları ve bağlantı hataları arasında en küçük index
+        first_invalid_index = None
+        error = None
+        records = 0
+        for index, range_error, range_records in range_results:
+            records += range_records
+            if index is not None and first_invalid_index is None:
+                first_invalid_index, error = index, range_error
+        
+        link_limit = first_invalid_index if first_invalid_index is not None else len(chain)
+        for i in range(1, link_limit):
+            if chain[i].previous_hash != chain[i - 1].hash:
+                first_invalid_index, error = i, "önceki hash uyuşmuyor"
+                break
+        
+        duration = time.perf_counter() - start_time
+        verified_blocks = (first_invalid_index if first_invalid_index is not None else len(chain)) - 1
+        if first_invalid_index is not None:
+            # Geçersiz bloktan önceki geçerli kayıtlar
+            records = sum(block.record_count for block in chain[1:first_invalid_index])
+        
+        return {
+            'valid': first_invalid_index is None,
+            'mode': 'parallel',
+            'workers': self.workers,
+            'ranges': len(ranges),
+            'blocks': len(chain) - 1,
+            'verified_blocks': verified_blocks,
+            'verified_records': records,
+            'first_invalid_index': first_invalid_index,
+            'error': error,
+            'hash_seconds': hash_time,
+            'duration_seconds': duration,
+            'blocks_per_second': verified_blocks / duration if duration else None,
+            'records_per_second': records / duration if duration else None,
+            'verified_at': datetime.now().isoformat()
+        }
+
+
+def main(argv=None):
+    """Komut satırı girişi - kayıtlı zinciri veritabanından yükleyip doğrular"""
+    parser = argparse.ArgumentParser(description='LightMedChain paralel zincir doğrulama')
+    parser.add_argument('--workers', type=int, default=Config.VERIFY_WORKERS, help='Doğrulama süreç sayısı')
+    parser.add_argument('--database', default=Config.DATABASE_URI, help='Veritabanı URI')
+    parser.add_argument('--serial', action='store_true', help='Karşılaştırma için seri doğrulamayı da çalıştır')
+    args = parser.parse_args(argv)
+    
+    from blockchain import Blockchain
+    from database import DatabaseManager
+    
+    # Yükleme çıktısı rapordan ayrı tutulur
+    stdout = sys.stdout
+    sys.stdout = sys.stderr
+    try:
+        # Açılış doğrulaması atlanır - zincir aşağıda zaten baştan doğrulanıyor
+        blockchain = Blockchain(database_manager=DatabaseManager(args.database), retarget=False,
+                                boot_verification=BOOT_NONE)
+        report = {'parallel': blockchain.verify_chain(full=True, workers=args.workers)}
+        if args.serial:
+            report['serial'] = blockchain.verify_chain(full=True, workers=1)
+    finally:
+        sys.stdout = stdout
+    
+    print(json.dumps(report, indent=2))
+    return 0 if report['parallel']['valid'] else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,134 @@
+# Zincir kontrol noktaları - Açılışta doğrulanmış geçmişi yeniden hash'lememek için
+from datetime import datetime
+from mining import get_hash_function
+
+# Açılış doğrulama modları
+BOOT_FULL = 'full'  # Tüm bloklar yeniden hash'lenir
+BOOT_CHECKPOINT = 'checkpoint'  # Son geçerli kontrol noktasından sonraki bloklar doğrulanır
+BOOT_NONE = 'none'  # Kayıtlı zincire doğrulamadan güvenilir
+BOOT_VERIFICATION_MODES = (BOOT_FULL, BOOT_CHECKPOINT, BOOT_NONE)
+
+# İmzalanan mesajın alan ayırıcısı - blok imzalarıyla karışmaz
+CHECKPOINT_DOMAIN = b'lightmedchain-checkpoint-v1:'
+
+# Genesis'ten önceki kümülatif özet
+EMPTY_DIGEST = '0' * 64
+
+
+def extend_digest(digest, block_hash, hash_algorithm):
+    """
+    Kümülatif özeti bir blok hash'iyle ilerletir: D_h = H(D_{h-1} || hash_h)
+    
+    Args:
+        digest (str): Önceki özet (hex)
+        block_hash (str): Eklenen bloğun hash'i (hex)
+        hash_algorithm (str): Zincirin hash algoritması
+    
+    Returns:
+        str: Yeni özet (hex)
+    """
+    return get_hash_function(hash_algorithm)(bytes.fromhex(digest) + bytes.fromhex(block_hash)).hexdigest()
+
+
+def chain_digest(chain, height, hash_algorithm, start_height=0, start_digest=EMPTY_DIGEST):
+    """
+    Zincirin verilen yüksekliğe kadarki kümülatif özetini hesaplar
+    
+    Yalnızca blok başlıklarındaki hash'ler kullanılır; kayıtlar okunmaz.
+    
+    Args:
+        chain (list): Block listesi
+        height (int): Özetin biteceği blok (dahil)
+        hash_algorithm (str): Zincirin hash algoritması
+        start_height (int): start_digest'in kapsamadığı ilk blok
+        start_digest (str): start_height'ten önceki blokların özeti
+    
+    Returns:
+        str: Kümülatif özet (hex)
+    """
+    digest = start_digest
+    for i in range(start_height, height + 1):
+        digest = extend_digest(digest, chain[i].hash, hash_algorithm)
+    return digest
+
+
+def checkpoint_message(height, tip_hash, digest):
+    """
+    Kontrol noktası için imzalanacak mesajı üretir
+    
+    Returns:
+        bytes: İmzalanacak mesaj
+    """
+    return CHECKPOINT_DOMAIN + f"{height}:{tip_hash}:{digest}".encode()
+
+
+def create_checkpoint(chain, height, hash_algorithm, signer=None, previous=None):
+    """
+    Verilen yükseklik için kontrol noktası üretir
+    
+    Önceki kontrol noktası hâlâ zincirle uyuşuyorsa özet oradan devam
+    ettirilir; aksi halde genesis'ten hesaplanır.
+    
+    Args:
+        chain (list): Doğrulanmış Block listesi
+        height (int): Kontrol noktasının yüksekliği
+        hash_algorithm (str): Zincirin hash algoritması
+        signer (AuthoritySigner): Düğüm anahtarı (verilirse kontrol noktası imzalanır)
+        previous (dict): Önceki kontrol noktası (opsiyonel)
+    
+    Returns:
+        dict: height, tip_hash, digest, signer, signature, created_at
+    """
+    start_height, start_digest = 0, EMPTY_DIGEST
+    if previous and previous['height'] <= height and chain[previous['height']].hash == previous['tip_hash']:
+        start_height, start_digest = previous['height'] + 1, previous['digest']
+    
+    tip_hash = chain[height].hash
+    digest = chain_digest(chain, height, hash_algorithm, start_height, start_digest)
+    return {
+        'height': height,
+        'tip_hash': tip_hash,
+        'digest': digest,
+        'signer': signer.signer_id if signer else None,
+        'signature': signer.sign_message(checkpoint_message(height, tip_hash, digest)) if signer else None,
+        'created_at': datetime.now().isoformat()
+    }
+
+
+def verify_checkpoint(checkpoint, chain, hash_algorithm, authority_set, require_signature=False):
+    """
+    Kontrol noktasının yüklenen zincirle uyuştuğunu kontrol eder
+    
+    Kontrol noktasına kadarki başlıkların previous_hash bağlantıları ve
+    kümülatif özet yeniden hesaplanır (kayıtlar hash'lenmez). İmzalı kontrol
+    noktalarında imza yetkili anahtar kümesine karşı doğrulanır.
+    
+    Args:
+        checkpoint (dict): Kayıtlı kontrol noktası
+        chain (list): Yüklenen Block listesi
+        hash_algorithm (str): Zincirin hash algoritması
+        authority_set (AuthoritySet): İmzayı doğrulayacak yetkili anahtarlar
+        require_signature (bool): İmzasız kontrol noktaları reddedilsin mi
+    
+    Returns:
+        str: Hata açıklaması veya None (geçerliyse)
+    """
+    height = checkpoint['height']
+    if height >= len(chain) or chain[height].hash != checkpoint['tip_hash']:
+        return "uç hash'i zincirle uyuşmuyor"
+    
+    if checkpoint['signature'] is None:
+        if require_signature:
+            return "imzasız"
+    elif not authority_set.verify_message(checkpoint['signer'], checkpoint['signature'],
+                                          checkpoint_message(height, checkpoint['tip_hash'], checkpoint['digest'])):
+        return "geçersiz ya da yetkisiz imza"
+    
+    for i in range(1, height + 1):
+        if chain[i].previous_hash != chain[i - 1].hash:
+            return f"blok #{i} önceki hash uyuşmuyor"
+    
+    if chain_digest(chain, height, hash_algorithm) != checkpoint['digest']:
+        return "kümülatif özet uyuşmuyor"
+    
+    return None
@@ -16,13 +16,57 @@ class Config:
     # Blockchain ayarları
     BLOCKCHAIN_DIFFICULTY = 2  # Makalede belirtilen optimal zorluk seviyesi
     BLOCKCHAIN_REWARD = 0  # Madencilik ödülü (sağlık uygulamasında gerek yok)
+    MINING_WORKERS = int(os.environ.get('MINING_WORKERS', 1))  # >1 ise nonce uzayı süreçlere bölünür
+    # Yeni zincirlerin blok hash algoritması (sha256, blake2b, sha3_256); mevcut zincir kendi kaydını kullanır
+    BLOCK_HASH_ALGORITHM = os.environ.get('BLOCK_HASH_ALGORITHM', 'sha256')
+    
+    # Bit cinsinden zorluk sınırları ve hedef gecikmeye göre otomatik ayarlama
+    MIN_DIFFICULTY_BITS = 4  # Doğrulamada kabul edilen en düşük zorluk
+    MAX_DIFFICULTY_BITS = 32
+    DIFFICULTY_RETARGET = os.environ.get('DIFFICULTY_RETARGET', 'false').lower() == 'true'
+    TARGET_BLOCK_TIME = float(os.environ.get('TARGET_BLOCK_TIME', 1.0))  # Hedef madencilik süresi (saniye)
+    RETARGET_WINDOW = 5  # Ayarlamada kullanılan son blok sayısı
+    RETARGET_MAX_STEP_BITS = 2  # Tek ayarlamada en fazla değişim
+    
+    # Konsensüs modu: 'pow' (nonce araması) veya 'poa' (yetkili düğüm Ed25519 imzası, madencilik yok)
+    CONSENSUS_MODE = os.environ.get('CONSENSUS_MODE', 'pow').lower()
+    POA_PRIVATE_KEY_PATH = os.environ.get('POA_PRIVATE_KEY_PATH') or 'poa_authority_key.pem'
+    # Diğer yetkili düğümlerin hex kodlu Ed25519 açık anahtarları (virgülle ayrılmış)
+    POA_AUTHORITY_KEYS = [key.strip() for key in os.environ.get('POA_AUTHORITY_KEYS', '').split(',') if key.strip()]
+    
+    # Tam zincir doğrulamasında kullanılan süreç sayısı (paralel doğrulama)
+    VERIFY_WORKERS = int(os.environ.get('VERIFY_WORKERS', os.cpu_count() or 1))
+    
+    # Açılış doğrulaması: 'full' (tüm zincir), 'checkpoint' (son kontrol noktasından sonrası), 'none'
+    BOOT_VERIFICATION = os.environ.get('BOOT_VERIFICATION', 'checkpoint').lower()
+    CHECKPOINT_INTERVAL = int(os.environ.get('CHECKPOINT_INTERVAL', 1000))  # Kaç blokta bir kontrol noktası (0: kapalı)
+    # True ise imzasız ya da yetkisiz anahtarla imzalı kontrol noktaları açılışta kullanılmaz
+    CHECKPOINT_REQUIRE_SIGNATURE = os.environ.get('CHECKPOINT_REQUIRE_SIGNATURE', 'false').lower() == 'true'
+    
+    # Madencilik sırasında yeni veri gelirse arama güncel verilerle yeniden başlatılır
+    MINING_RESTART_ON_NEW_DATA = os.environ.get('MINING_RESTART_ON_NEW_DATA', 'false').lower() == 'true'
+    MINING_MAX_RESTARTS = 3  # Bir blok için en fazla yeniden başlatma
+    MEMPOOL_SHARDS = int(os.environ.get('MEMPOOL_SHARDS', 8))  # Bekleyen veri havuzunun kilit parçası sayısı
     
     # Veritabanı ayarları
     DATABASE_URI = os.environ.get('DATABASE_URI') or 'sqlite:///lightmedchain.db'
     
+    # Açılışta yalnızca blok başlıkları yüklenir; kayıtlar ihtiyaç oldukça okunup önbelleğe alınır
+    BLOCK_CACHE_SIZE = int(os.environ.get('BLOCK_CACHE_SIZE', 4096))  # Önbellekteki en fazla blok gövdesi
+    BLOCK_PREFETCH = 256  # Önbellekte olmayan blokla birlikte okunan sonraki blok sayısı
+    
     # API ayarları
     API_VERSION = 'v1'
     MAX_CONTENT_LENGTH = 16 * 1024 * 1024  # 16MB max file size
+    # /api/blockchain/chain sayfalama ve akış ayarları
+    CHAIN_PAGE_SIZE = 100  # limit verilmezse sayfadaki blok sayısı
+    CHAIN_PAGE_MAX_SIZE = 1000
+    CHAIN_STREAM_CHUNK_SIZE = 64 * 1024  # Akışlı yanıtta bir parçada biriktirilen byte
+    RESPONSE_CACHE_SIZE = 64  # Zincir ucu değişene kadar saklanan okuma yanıtı sayısı (durum, sayfalar)
+    # POST /api/mining/benchmark sınırları - istek süresi bu bütçeyi aşmaz
+    BENCHMARK_MAX_SECONDS = float(os.environ.get('BENCHMARK_MAX_SECONDS', 30))
+    BENCHMARK_MAX_PAYLOAD_SIZE = 1000  # Bir bloktaki en fazla kayıt sayısı
+    BENCHMARK_MAX_CELLS = 50  # Zorluk x veri boyutu hücre sayısı üst sınırı
     
     # Bluetooth/IoT ayarları
     OXIMETER_DATA_TYPES = ['SpO2', 'BPM']  # Desteklenen veri türleri
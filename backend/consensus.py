@@ -0,0 +1,178 @@
+# Konsensüs modları - Proof-of-Work ve Ed25519 imzalı Proof-of-Authority
+import os
+from cryptography.exceptions import InvalidSignature
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey, Ed25519PublicKey
+from config import Config
+
+# Konsensüs modları
+POW = 'pow'  # Leading-zero nonce araması (makaledeki varsayılan)
+POA = 'poa'  # Yetkili düğümlerin blok başlığını imzalaması, nonce araması yok
+CONSENSUS_MODES = (POW, POA)
+
+# İmzalanan mesajın alan ayırıcısı - imza başka bir bağlamda tekrar kullanılamaz
+SIGNING_DOMAIN = b'lightmedchain-poa-v1:'
+
+
+def signing_message(block_hash):
+    """
+    Blok başlığı için imzalanacak mesajı üretir
+    
+    Blok hash'i index, timestamp, veri ve previous_hash'i kapsadığından
+    hash'in imzalanması başlığın tamamını imzalamakla eşdeğerdir.
+    
+    Args:
+        block_hash (str): Blok hash'i (hex)
+    
+    Returns:
+        bytes: İmzalanacak mesaj
+    """
+    return SIGNING_DOMAIN + block_hash.encode()
+
+
+class AuthoritySigner:
+    """Bu düğümün Ed25519 imzalama anahtarı"""
+    
+    def __init__(self, private_key):
+        """
+        Args:
+            private_key (Ed25519PrivateKey): İmzalama anahtarı
+        """
+        self.private_key = private_key
+        self.signer_id = private_key.public_key().public_bytes(
+            serialization.Encoding.Raw, serialization.PublicFormat.Raw
+        ).hex()
+    
+    @classmethod
+    def load_or_create(cls, path=Config.POA_PRIVATE_KEY_PATH):
+        """
+        Anahtarı PEM dosyasından yükler, yoksa üretip kaydeder
+        
+        Args:
+            path (str): PEM dosya yolu
+        
+        Returns:
+            AuthoritySigner: İmzalayıcı
+        """
+        if os.path.exists(path):
+            with open(path, 'rb') as f:
+                private_key = serialization.load_pem_private_key(f.read(), password=None)
+            if not isinstance(private_key, Ed25519PrivateKey):
+                raise ValueError(f"{path} bir Ed25519 anahtarı değil")
+            return cls(private_key)
+        
+        private_key = Ed25519PrivateKey.generate()
+        pem = private_key.private_bytes(
+            serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()
+        )
+        # Anahtar yalnızca sahibi tarafından okunabilir
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        with os.fdopen(fd, 'wb') as f:
+            f.write(pem)
+        print(f"🔑 Yeni PoA anahtarı oluşturuldu: {path}")
+        return cls(private_key)
+    
+    def sign(self, block_hash):
+        """
+        Blok başlığını imzalar
+        
+        Args:
+            block_hash (str): Blok hash'i
+        
+        Returns:
+            str: Hex imza (128 karakter)
+        """
+        return self.sign_message(signing_message(block_hash))
+    
+    def sign_message(self, message):
+        """
+        Alan ayırıcısı eklenmiş mesajı imzalar (ör. kontrol noktaları)
+        
+        Args:
+            message (bytes): İmzalanacak mesaj
+        
+        Returns:
+            str: Hex imza (128 karakter)
+        """
+        return self.private_key.sign(message).hex()
+
+
+class AuthoritySet:
+    """Blok imzalamaya yetkili açık anahtar kümesi"""
+    
+    def __init__(self, public_keys=()):
+        """
+        Args:
+            public_keys (iterable): Hex kodlu ham Ed25519 açık anahtarları
+        """
+        self.keys = {}
+        for key in public_keys:
+            self.add(key)
+    
+    @classmethod
+    def from_config(cls, signer=None):
+        """
+        Config.POA_AUTHORITY_KEYS ve (verilirse) yerel imzalayıcıdan küme oluşturur
+        
+        Args:
+            signer (AuthoritySigner): Bu düğümün imzalayıcısı (opsiyonel)
+        
+        Returns:
+            AuthoritySet: Yetkili anahtarlar
+        """
+        authorities = cls(Config.POA_AUTHORITY_KEYS)
+        if signer is not None:
+            authorities.add(signer.signer_id)
+        return authorities
+    
+    def add(self, signer_id):
+        """
+        Yetkili anahtar ekler
+        
+        Args:
+            signer_id (str): Hex kodlu ham açık anahtar
+        """
+        self.keys[signer_id] = Ed25519PublicKey.from_public_bytes(bytes.fromhex(signer_id))
+    
+    def is_authorized(self, signer_id):
+        """Anahtar yetkili kümede mi"""
+        return signer_id in self.keys
+    
+    def verify(self, signer_id, signature, block_hash):
+        """
+        Blok imzasını doğrular
+        
+        Args:
+            signer_id (str): İmzalayan açık anahtar
+            signature (str): Hex imza
+            block_hash (str): İmzalanan blok hash'i
+        
+        Returns:
+            bool: İmza yetkili bir anahtardan ve geçerli mi
+        """
+        return self.verify_message(signer_id, signature, signing_message(block_hash))
+    
+    def verify_message(self, signer_id, signature, message):
+        """
+        Alan ayırıcısı eklenmiş mesajın imzasını doğrular
+        
+        Args:
+            signer_id (str): İmzalayan açık anahtar
+            signature (str): Hex imza
+            message (bytes): İmzalanan mesaj
+        
+        Returns:
+            bool: İmza yetkili bir anahtardan ve geçerli mi
+        """
+        public_key = self.keys.get(signer_id)
+        if public_key is None:
+            return False
+        try:
+            public_key.verify(bytes.fromhex(signature), message)
+            return True
+        except (InvalidSignature, ValueError):
+            return False
+    
+    def to_list(self):
+        """Yetkili anahtarları listeler - API için"""
+        return sorted(self.keys)
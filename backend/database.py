@@ -3,10 +3,46 @@ import json
 import sqlite3
 from pathlib import Path
 from config import Config
+import block_codec
+from record_batch import RecordBatch
 # datetime import'u ekleyelim
 from datetime import datetime
 
 
+def _block_row(block):
+    """
+    Blok satırına yazılacak ikili blok ve başlık değerlerini üretir
+    
+    Args:
+        block (dict): Block.to_dict çıktısı
+    
+    Returns:
+        tuple: (block_data, header_data) - block_codec ile kodlanmış byte'lar
+    """
+    return block_codec.encode_block(block), block_codec.encode_header(block)
+
+
+def _row_header(value):
+    """header_data değerini çözer - eski satırlar JSON metni, yeniler ikili"""
+    if isinstance(value, bytes):
+        return block_codec.decode_header(value)
+    return json.loads(value)
+
+
+def _row_data(value):
+    """block_data değerinden blok kayıtlarını sütun düzeninde çözer - eski satırlar JSON metni, yeniler ikili"""
+    if isinstance(value, bytes):
+        return block_codec.decode_data(value, compact=True)
+    return RecordBatch.from_records(json.loads(value)['data'])
+
+
+def _row_block(value):
+    """block_data değerini blok sözlüğüne çevirir"""
+    if isinstance(value, bytes):
+        return block_codec.decode_block(value)
+    return json.loads(value)
+
+
 class DatabaseManager:
     """Veritabanı yöneticisi - Tüm veritabanı işlemlerini yönetir"""
     
@@ -103,6 +139,60 @@ class DatabaseManager:
                     )
                 ''')
                 
+                # Bloklar - her blok bir kez, kendi satırına eklenir (zincir yeniden yazılmaz)
+                # block_data/header_data block_codec ile ikili saklanır; eski satırlar JSON metni kalır
+                cursor.execute('''
+                    CREATE TABLE IF NOT EXISTS blocks (
+                        block_index INTEGER PRIMARY KEY,
+                        block_hash TEXT NOT NULL UNIQUE,
+                        previous_hash TEXT NOT NULL,
+                        block_data BLOB NOT NULL,
+                        header_data BLOB,
+                        saved_at TEXT NOT NULL
+                    )
+                ''')
+                self._add_block_headers(cursor)
+                
+                # Zincir ayarları (zorluk, hash algoritması) - JSON değerli anahtarlar
+                cursor.execute('''
+                    CREATE TABLE IF NOT EXISTS chain_meta (
+                        name TEXT PRIMARY KEY,
+                        value TEXT NOT NULL
+                    )
+                ''')
+                
+                # Zincir kontrol noktaları - açılışta bu yüksekliğe kadar yeniden doğrulama yapılmaz
+                cursor.execute('''
+                    CREATE TABLE IF NOT EXISTS checkpoints (
+                        height INTEGER PRIMARY KEY,
+                        tip_hash TEXT NOT NULL,
+                        digest TEXT NOT NULL,
+                        signer TEXT,
+                        signature TEXT,
+                        created_at TEXT NOT NULL
+                    )
+                ''')
+                
+                # Hasta -> (blok, sıra) kayıt indeksi (açılışta zinciri taramamak için)
+                cursor.execute('''
+                    CREATE TABLE IF NOT EXISTS patient_postings (
+                        patient_id TEXT NOT NULL,
+                        block_index INTEGER NOT NULL,
+                        position INTEGER NOT NULL,
+                        PRIMARY KEY (patient_id, block_index, position)
+                    )
+                ''')
+                
+                # Kalıcı indekslerin hangi bloğa kadar güncel olduğu
+                cursor.execute('''
+                    CREATE TABLE IF NOT EXISTS index_state (
+                        name TEXT PRIMARY KEY,
+                        height INTEGER NOT NULL,
+                        tip_hash TEXT NOT NULL,
+                        last_updated TEXT NOT NULL
+                    )
+                ''')
+                
                 conn.commit()
                 print("✅ Veritabanı tabloları başarıyla oluşturuldu!")
                 
@@ -368,4 +458,306 @@ class DatabaseManager:
         except sqlite3.Error as e:
             print(f"❌ Blockchain durumu getirme hatası: {e}")
             return None
-
+    
+    def _add_block_headers(self, cursor):
+        """Başlık sütunu olmayan blok tablosuna sütunu ekler ve mevcut satırları doldurur"""
+        columns = [row['name'] for row in cursor.execute('PRAGMA table_info(blocks)')]
+        if 'header_data' not in columns:
+            cursor.execute('ALTER TABLE blocks ADD COLUMN header_data BLOB')
+        
+        cursor.execute('SELECT block_index, block_data FROM blocks WHERE header_data IS NULL')
+        rows = cursor.fetchall()
+        cursor.executemany('UPDATE blocks SET header_data = ? WHERE block_index = ?', [
+            (block_codec.encode_header(_row_block(row['block_data'])), row['block_index'])
+            for row in rows
+        ])
+    
+    def append_blocks(self, blocks, chain_meta):
+        """
+        Yeni blokları satır olarak ekler ve zincir ayarlarını günceller
+        
+        Bloklar ve ayarlar aynı işlemde yazılır; yarım kalan bir yazma geri
+        alınır ve önceden kaydedilmiş bloklara dokunulmaz. Aynı index'e ikinci
+        kez blok eklenemez.
+        
+        Args:
+            blocks (list): Eklenecek blokların sözlükleri (Block.to_dict)
+            chain_meta (dict): Zincir ayarları {isim: değer}
+        
+        Returns:
+            bool: Kayıt başarılı mı
+        """
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                saved_at = datetime.now().isoformat()
+                cursor.executemany('''
+                    INSERT INTO blocks (block_index, block_hash, previous_hash, block_data, header_data, saved_at)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                ''', [
+                    (block['index'], block['hash'], block['previous_hash'], *_block_row(block), saved_at)
+                    for block in blocks
+                ])
+                cursor.executemany('''
+                    INSERT OR REPLACE INTO chain_meta (name, value) VALUES (?, ?)
+                ''', [(name, json.dumps(value)) for name, value in chain_meta.items()])
+                
+                conn.commit()
+                return True
+                
+        except (sqlite3.Error, ValueError) as e:
+            print(f"❌ Blok kaydetme hatası: {e}")
+            return False
+    
+    def load_block_headers(self):
+        """
+        Kayıtlı blokların yalnızca başlıklarını index sırasıyla yükler
+        
+        Returns:
+            list: Başlık sözlükleri (kayıtlar hariç, record_count ile; hatada None)
+        """
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute('SELECT header_data FROM blocks ORDER BY block_index')
+                return [_row_header(row['header_data']) for row in cursor.fetchall()]
+                
+        except sqlite3.Error as e:
+            print(f"❌ Blok başlıkları yükleme hatası: {e}")
+            return None
+    
+    def load_block_bodies(self, start, stop):
+        """
+        [start, stop) aralığındaki blokların kayıtlarını yükler
+        
+        Args:
+            start (int): İlk blok index'i
+            stop (int): Son blok index'i (dahil değil)
+        
+        Returns:
+            dict: blok index'i -> blok verisi (kayıt listeleri RecordBatch olarak)
+        """
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute('''
+                    SELECT block_index, block_data FROM blocks
+                    WHERE block_index >= ? AND block_index < ?
+                ''', (start, stop))
+                return {row['block_index']: _row_data(row['block_data']) for row in cursor.fetchall()}
+                
+        except sqlite3.Error as e:
+            print(f"❌ Blok verisi yükleme hatası: {e}")
+            return {}
+    
+    def get_chain_meta(self):
+        """
+        Zincir ayarlarını getirir
+        
+        Returns:
+            dict: {isim: değer}
+        """
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute('SELECT name, value FROM chain_meta')
+                return {row['name']: json.loads(row['value']) for row in cursor.fetchall()}
+                
+        except sqlite3.Error as e:
+            print(f"❌ Zincir ayarları getirme hatası: {e}")
+            return {}
+    
+    def migrate_blockchain_state(self):
+        """
+        Eski tek satırlık blockchain_state kaydını blok satırlarına taşır (bir kez)
+        
+        Blok tablosu boşsa ve eski kayıt varsa tüm bloklar ve ayarlar tek
+        işlemde eklenir, ardından eski kayıt silinir.
+        
+        Returns:
+            int: Taşınan blok sayısı (taşınacak kayıt yoksa 0)
+        """
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute('SELECT COUNT(*) FROM blocks')
+                if cursor.fetchone()[0]:
+                    return 0
+                cursor.execute('SELECT chain_data FROM blockchain_state ORDER BY id DESC LIMIT 1')
+                state = cursor.fetchone()
+                if not state:
+                    return 0
+                
+                chain_data = json.loads(state['chain_data'])
+                saved_at = datetime.now().isoformat()
+                cursor.executemany('''
+                    INSERT INTO blocks (block_index, block_hash, previous_hash, block_data, header_data, saved_at)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                ''', [
+                    (block['index'], block['hash'], block['previous_hash'], *_block_row(block), saved_at)
+                    for block in chain_data['chain']
+                ])
+                chain_meta = {name: value for name, value in chain_data.items() if name != 'chain'}
+                cursor.executemany('''
+                    INSERT OR REPLACE INTO chain_meta (name, value) VALUES (?, ?)
+                ''', [(name, json.dumps(value)) for name, value in chain_meta.items()])
+                cursor.execute('DELETE FROM blockchain_state')
+                
+                conn.commit()
+                print(f"📦 Eski blockchain kaydı {len(chain_data['chain'])} blok satırına taşındı")
+                return len(chain_data['chain'])
+                
+        except (sqlite3.Error, ValueError, KeyError) as e:
+            print(f"❌ Blockchain taşıma hatası: {e}")
+            return 0
+    
+    def save_checkpoint(self, checkpoint):
+        """
+        Zincir kontrol noktasını kaydeder
+        
+        Args:
+            checkpoint (dict): height, tip_hash, digest, signer, signature, created_at
+        
+        Returns:
+            bool: Kayıt başarılı mı
+        """
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute('''
+                    INSERT OR REPLACE INTO checkpoints (height, tip_hash, digest, signer, signature, created_at)
+                    VALUES (:height, :tip_hash, :digest, :signer, :signature, :created_at)
+                ''', checkpoint)
+                
+                conn.commit()
+                return True
+                
+        except sqlite3.Error as e:
+            print(f"❌ Kontrol noktası kaydetme hatası: {e}")
+            return False
+    
+    def get_checkpoints(self, limit=10):
+        """
+        Kontrol noktalarını en yeniden eskiye getirir
+        
+        Args:
+            limit (int): En fazla kontrol noktası sayısı
+        
+        Returns:
+            list: Kontrol noktası sözlükleri
+        """
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute('SELECT * FROM checkpoints ORDER BY height DESC LIMIT ?', (limit,))
+                return [dict(row) for row in cursor.fetchall()]
+                
+        except sqlite3.Error as e:
+            print(f"❌ Kontrol noktası getirme hatası: {e}")
+            return []
+    
+    def get_index_state(self, name):
+        """
+        Kalıcı indeksin güncel olduğu blok yüksekliğini getirir
+        
+        Args:
+            name (str): İndeks adı
+        
+        Returns:
+            dict: height ve tip_hash veya None
+        """
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute('SELECT * FROM index_state WHERE name = ?', (name,))
+                state = cursor.fetchone()
+                
+                if state:
+                    return dict(state)
+                return None
+                
+        except sqlite3.Error as e:
+            print(f"❌ İndeks durumu getirme hatası: {e}")
+            return None
+    
+    def load_patient_postings(self, max_height=None):
+        """
+        Hasta kayıt indeksini yükler
+        
+        Args:
+            max_height (int): Yalnızca bu bloğa kadarki kayıtlar (None ise tümü)
+        
+        Returns:
+            dict: patient_id -> [(blok index'i, sıra), ...] (zincir sırasıyla)
+        """
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute('''
+                    SELECT patient_id, block_index, position FROM patient_postings
+                    WHERE ? IS NULL OR block_index <= ?
+                    ORDER BY block_index, position
+                ''', (max_height, max_height))
+                
+                postings = {}
+                for patient_id, block_index, position in cursor.fetchall():
+                    postings.setdefault(patient_id, []).append((block_index, position))
+                return postings
+                
+        except sqlite3.Error as e:
+            print(f"❌ Hasta indeksi yükleme hatası: {e}")
+            return None
+    
+    def append_patient_postings(self, postings, height, tip_hash):
+        """
+        Yeni blokların hasta indeksi kayıtlarını ekler
+        
+        Kayıtlar ve indeks yüksekliği aynı işlemde yazılır; yarım kalan bir
+        yazma bir sonraki açılışta yeniden oluşturmaya yol açar.
+        
+        Args:
+            postings (list): (patient_id, blok index'i, sıra) satırları
+            height (int): İndeksin güncel olduğu son blok
+            tip_hash (str): O bloğun hash'i
+        
+        Returns:
+            bool: Kayıt başarılı mı
+        """
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.executemany('''
+                    INSERT OR IGNORE INTO patient_postings (patient_id, block_index, position)
+                    VALUES (?, ?, ?)
+                ''', postings)
+                cursor.execute('''
+                    INSERT OR REPLACE INTO index_state (name, height, tip_hash, last_updated)
+                    VALUES ('patient_postings', ?, ?, ?)
+                ''', (height, tip_hash, datetime.now().isoformat()))
+                
+                conn.commit()
+                return True
+                
+        except sqlite3.Error as e:
+            print(f"❌ Hasta indeksi kaydetme hatası: {e}")
+            return False
+    
+    def clear_patient_postings(self):
+        """
+        Hasta indeksini siler (zincir değiştiğinde yeniden oluşturmak için)
+        
+        Returns:
+            bool: Silme başarılı mı
+        """
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute('DELETE FROM patient_postings')
+                cursor.execute("DELETE FROM index_state WHERE name = 'patient_postings'")
+                
+                conn.commit()
+                return True
+                
+        except sqlite3.Error as e:
+            print(f"❌ Hasta indeksi silme hatası: {e}")
+            return False
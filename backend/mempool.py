@@ -0,0 +1,219 @@
+# Bekleyen veri havuzu - Eşzamanlı kayıt eklemeleri için parçalı, iş parçacığı güvenli mempool
+import itertools
+import threading
+from operator import itemgetter
+from config import Config
+
+
+class MempoolBatch:
+    """Bloğa alınmak üzere havuzdan ayrılmış kayıtlar
+    
+    Mempool.take ile oluşturulur; blok zincire eklenince Mempool.commit ile
+    kalıcı olarak düşülür, madencilik iptal edilirse Mempool.release ile
+    havuza sırası korunarak geri döner.
+    """
+    
+    __slots__ = ('batch_id', 'entries')
+    
+    def __init__(self, batch_id, entries):
+        """
+        Args:
+            batch_id (int): Havuzdaki ayırma numarası
+            entries (list): (sıra numarası, kayıt) çiftleri - sıra numarasına göre sıralı
+        """
+        self.batch_id = batch_id
+        self.entries = entries
+    
+    @property
+    def records(self):
+        """Kayıtları geliş sırasıyla döndürür (yeni liste)"""
+        return [record for _, record in self.entries]
+    
+    def __len__(self):
+        return len(self.entries)
+
+
+class _Shard:
+    """Kendi kilidi olan havuz parçası"""
+    
+    __slots__ = ('lock', 'entries', 'version')
+    
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.entries = []
+        self.version = 0
+
+
+class Mempool:
+    """Blok bekleyen kayıtların iş parçacığı güvenli havuzu
+    
+    Eklemeler parçalara (shard) dağıtılır: her iş parçacığı ilk eklemesinde
+    bir parçaya atanır ve yalnızca o parçanın kilidini alır; böylece çok
+    iş parçacıklı WSGI sunucusunda eşzamanlı eklemeler birbirini az bekler.
+    Her kayıt, parça kilidi altında genel bir sıra numarası alır; bloklar
+    kayıtları bu numaraya göre, geliş sırasıyla içerir.
+    
+    take() tüm parçaları kısa süreliğine kilitleyip bekleyen kayıtları tek
+    seferde ayırır. Ayrılan kayıtlar commit() ile düşülene ya da release()
+    ile geri verilene kadar havuzda "ayrılmış" sayılır; len() ve records()
+    bunları da içerir. Bir kayıt aynı anda en fazla bir ayırmada bulunur,
+    bu yüzden eşzamanlı madencilikte de her kayıt tek bir bloğa girer.
+    """
+    
+    def __init__(self, shards=Config.MEMPOOL_SHARDS):
+        """
+        Args:
+            shards (int): Parça sayısı
+        """
+        self._shards = [_Shard() for _ in range(max(1, shards))]
+        self._sequence = itertools.count()
+        self._shard_numbers = itertools.count()
+        self._local = threading.local()
+        # Ayrılmış kayıtlar ve ayırma sayaçları bu kilitle korunur
+        self._lock = threading.Lock()
+        self._batches = {}
+        self._batch_ids = itertools.count(1)
+        self._reserved = 0
+        self._version = 0
+    
+    def _shard(self):
+        """Çağıran iş parçacığının parçasını döndürür (ilk çağrıda sırayla atanır)"""
+        shard = getattr(self._local, 'shard', None)
+        if shard is None:
+            shard = self._shards[next(self._shard_numbers) % len(self._shards)]
+            self._local.shard = shard
+        return shard
+    
+    def add(self, record):
+        """
+        Havuza kayıt ekler
+        
+        Args:
+            record (dict): Bekleyen kayıt
+        
+        Returns:
+            int: Kaydın sıra numarası
+        """
+        shard = self._shard()
+        with shard.lock:
+            sequence = next(self._sequence)
+            shard.entries.append((sequence, record))
+            shard.version += 1
+        return sequence
+    
+    def _drain(self):
+        """Tüm parçaların kayıtlarını tek seferde alır - çağıran self._lock'u tutmalıdır"""
+        for shard in self._shards:
+            shard.lock.acquire()
+        try:
+            taken = []
+            for shard in self._shards:
+                if shard.entries:
+                    taken.extend(shard.entries)
+                    shard.entries = []
+                    shard.version += 1
+        finally:
+            for shard in self._shards:
+                shard.lock.release()
+        # Her parça kendi içinde sıralıdır; geri verilen kayıtlar da sıra numarasıyla yerleşir
+        taken.sort(key=itemgetter(0))
+        return taken
+    
+    def take(self, limit=None):
+        """
+        Bekleyen kayıtları bloğa alınmak üzere atomik olarak ayırır
+        
+        Args:
+            limit (int): En fazla kayıt sayısı (None: tümü); fazlası havuzda kalır
+        
+        Returns:
+            MempoolBatch: Ayrılan kayıtlar veya None (bekleyen kayıt yoksa)
+        """
+        with self._lock:
+            entries = self._drain()
+            if limit is not None and len(entries) > limit:
+                self._shards[0].lock.acquire()
+                try:
+                    self._shards[0].entries.extend(entries[limit:])
+                finally:
+                    self._shards[0].lock.release()
+                entries = entries[:limit]
+            if not entries:
+                return None
+            batch = MempoolBatch(next(self._batch_ids), entries)
+            self._batches[batch.batch_id] = batch
+            self._reserved += len(entries)
+            self._version += 1
+            return batch
+    
+    def commit(self, batch):
+        """
+        Zincire eklenen bloğun kayıtlarını havuzdan kalıcı olarak düşer
+        
+        Args:
+            batch (MempoolBatch): take() ile ayrılmış kayıtlar
+        
+        Raises:
+            KeyError: Ayırma zaten düşülmüş ya da geri verilmişse
+        """
+        with self._lock:
+            del self._batches[batch.batch_id]
+            self._reserved -= len(batch.entries)
+            self._version += 1
+    
+    def release(self, batch):
+        """
+        Ayrılmış kayıtları havuza geri verir (madencilik iptali, zincir ucu değişimi)
+        
+        Kayıtlar sıra numaralarını korur; sonraki take() onları yeni gelenlerin önüne koyar.
+        
+        Args:
+            batch (MempoolBatch): take() ile ayrılmış kayıtlar
+        
+        Raises:
+            KeyError: Ayırma zaten düşülmüş ya da geri verilmişse
+        """
+        with self._lock:
+            del self._batches[batch.batch_id]
+            shard = self._shards[0]
+            with shard.lock:
+                shard.entries.extend(batch.entries)
+                shard.version += 1
+            self._reserved -= len(batch.entries)
+            self._version += 1
+    
+    def records(self):
+        """
+        Ayrılmış olanlar dahil bekleyen tüm kayıtları geliş sırasıyla döndürür
+        
+        Returns:
+            list: Kayıtların kopya listesi
+        """
+        with self._lock:
+            entries = [entry for batch in self._batches.values() for entry in batch.entries]
+            for shard in self._shards:
+                with shard.lock:
+                    entries.extend(shard.entries)
+        entries.sort(key=itemgetter(0))
+        return [record for _, record in entries]
+    
+    @property
+    def version(self):
+        """Havuz her değiştiğinde artan sayaç - okuma yanıtlarının sürüm anahtarında kullanılır"""
+        return self._version + sum(shard.version for shard in self._shards)
+    
+    def __len__(self):
+        return self._reserved + sum(len(shard.entries) for shard in self._shards)
+    
+    def __bool__(self):
+        return len(self) > 0
+    
+    def stats(self):
+        """Havuz doluluğunu döndürür"""
+        return {
+            'pending': len(self),
+            'reserved': self._reserved,
+            'reserved_batches': len(self._batches),
+            'shards': len(self._shards),
+            'shard_sizes': [len(shard.entries) for shard in self._shards]
+        }
@@ -0,0 +1,131 @@
+# Merkle ağacı - Blok kayıtları için kök hesaplama ve kayıt bazında dahil olma kanıtı
+from mining import DEFAULT_HASH_ALGORITHM, canonical_json, get_hash_function
+
+# Yaprak ve iç düğüm hash'leri ayrı önekle hesaplanır (RFC 6962) - bir iç düğüm
+# yaprak gibi gösterilerek sahte kanıt üretilemez
+LEAF_PREFIX = b'\x00'
+NODE_PREFIX = b'\x01'
+
+# Kanıt adımında kardeş düğümün konumu
+LEFT = 'left'
+RIGHT = 'right'
+
+
+def leaf_hash(record, hash_algorithm=DEFAULT_HASH_ALGORITHM):
+    """
+    Kaydın yaprak hash'ini hesaplar
+    
+    Kayıt, blok hash'indeki ile aynı kanonik JSON biçimiyle (sort_keys) serileştirilir.
+    
+    Args:
+        record (dict): Tıbbi kayıt ya da canonical_json ile üretilmiş byte'ları
+        hash_algorithm (str): Zincirin hash algoritması
+    
+    Returns:
+        bytes: Yaprak hash'i
+    """
+    return get_hash_function(hash_algorithm)(LEAF_PREFIX + canonical_json(record)).digest()
+
+
+def _node_hash(left, right, hash_function):
+    """İki çocuk düğümden iç düğüm hash'i üretir"""
+    return hash_function(NODE_PREFIX + left + right).digest()
+
+
+def _next_level(level, hash_function):
+    """
+    Bir üst seviyeyi hesaplar
+    
+    Tek sayıda düğüm varsa sonuncusu kopyalanmadan bir üst seviyeye taşınır;
+    böylece farklı kayıt listeleri aynı köke sahip olamaz.
+    """
+    parents = [_node_hash(level[i], level[i + 1], hash_function) for i in range(0, len(level) - 1, 2)]
+    if len(level) % 2:
+        parents.append(level[-1])
+    return parents
+
+
+def merkle_root(records, hash_algorithm=DEFAULT_HASH_ALGORITHM):
+    """
+    Kayıt listesinin Merkle kökünü hesaplar
+    
+    Args:
+        records (list): Bloktaki tıbbi kayıtlar (ya da kanonik byte'ları - bkz. Block.canonical_data)
+        hash_algorithm (str): Zincirin hash algoritması
+    
+    Returns:
+        str: Kök hash (64 karakter hex); boş listede boş girdinin hash'i
+    """
+    hash_function = get_hash_function(hash_algorithm)
+    level = [leaf_hash(record, hash_algorithm) for record in records]
+    if not level:
+        return hash_function(b'').hexdigest()
+    while len(level) > 1:
+        level = _next_level(level, hash_function)
+    return level[0].hex()
+
+
+def merkle_proof(records, position, hash_algorithm=DEFAULT_HASH_ALGORITHM):
+    """
+    Kaydın köke dahil olduğunu gösteren kanıtı üretir
+    
+    Kanıt, yapraktan köke kadar her seviyedeki kardeş düğümlerden oluşur;
+    uzunluğu en fazla ceil(log2(n)) adımdır.
+    
+    Args:
+        records (list): Bloktaki tıbbi kayıtlar (ya da kanonik byte'ları - bkz. Block.canonical_data)
+        position (int): Kaydın blok içindeki sırası
+        hash_algorithm (str): Zincirin hash algoritması
+    
+    Returns:
+        list: [{'side': 'left'|'right', 'hash': hex}, ...] yapraktan köke sırayla
+    
+    Raises:
+        IndexError: Geçersiz sıra
+    """
+    if not 0 <= position < len(records):
+        raise IndexError(f"Geçersiz kayıt sırası: {position}")
+    
+    hash_function = get_hash_function(hash_algorithm)
+    level = [leaf_hash(record, hash_algorithm) for record in records]
+    proof = []
+    while len(level) > 1:
+        sibling = position ^ 1
+        # Tek kalan son düğümün kardeşi yoktur; o seviyede adım eklenmez
+        if sibling < len(level):
+            proof.append({
+                'side': LEFT if sibling < position else RIGHT,
+                'hash': level[sibling].hex()
+            })
+        level = _next_level(level, hash_function)
+        position //= 2
+    return proof
+
+
+def verify_merkle_proof(record, proof, root, hash_algorithm=DEFAULT_HASH_ALGORITHM):
+    """
+    Dahil olma kanıtını doğrular - istemcilerin uyguladığı kontrolün referansı
+    
+    Args:
+        record (dict): Tıbbi kayıt
+        proof (list): merkle_proof çıktısı
+        root (str): Blok başlığındaki Merkle kökü
+        hash_algorithm (str): Zincirin hash algoritması
+    
+    Returns:
+        bool: Kayıt bu köke dahil mi
+    """
+    hash_function = get_hash_function(hash_algorithm)
+    node = leaf_hash(record, hash_algorithm)
+    try:
+        for step in proof:
+            sibling = bytes.fromhex(step['hash'])
+            if step['side'] == LEFT:
+                node = _node_hash(sibling, node, hash_function)
+            elif step['side'] == RIGHT:
+                node = _node_hash(node, sibling, hash_function)
+            else:
+                return False
+    except (KeyError, TypeError, ValueError):
+        return False
+    return node.hex() == root
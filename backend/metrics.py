@@ -0,0 +1,190 @@
+# Madencilik telemetrisi - Hash hızı, blok sayıları ve gecikme histogramı
+import threading
+import time
+from collections import deque
+
+
+class MiningMetrics:
+    """Süreç içi madencilik metrikleri
+    
+    Madencilik döngüsü her nonce parçasından sonra tek bir çağrı yapar; deneme
+    başına ek maliyet yoktur. Değerler /api/system/performance ve Prometheus
+    formatındaki /metrics endpoint'inden okunur.
+    """
+    
+    # Madencilik süresi histogram sınırları (saniye)
+    LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+    
+    def __init__(self, window_seconds=60):
+        """
+        Metrik deposu oluşturur
+        
+        Args:
+            window_seconds (int): Kayan hash hızı penceresi (saniye)
+        """
+        self.window_seconds = window_seconds
+        self._lock = threading.Lock()
+        self.reset()
+    
+    def reset(self):
+        """Tüm sayaçları sıfırlar"""
+        with self._lock:
+            self._hash_samples = deque()  # (zaman, hash sayısı)
+            self._window_hashes = 0
+            self.hashes_total = 0
+            self.blocks_mined = 0
+            self.blocks_cancelled = 0
+            self.attempts_total = 0
+            self.last_block_attempts = None
+            self.last_block_difficulty_bits = None
+            self.latency_sum = 0.0
+            self.latency_buckets = [0] * (len(self.LATENCY_BUCKETS) + 1)  # son eleman +Inf
+            self.cancel_reasons = {}
+    
+    def _prune(self, now):
+        """Pencere dışında kalan hash örneklerini atar (kilit altında çağrılır)"""
+        cutoff = now - self.window_seconds
+        samples = self._hash_samples
+        while samples and samples[0][0] < cutoff:
+            self._window_hashes -= samples.popleft()[1]
+    
+    def record_hashes(self, count):
+        """
+        Denenen hash sayısını kaydeder - nonce parçası başına bir kez çağrılır
+        
+        Args:
+            count (int): Son kayıttan bu yana denenen hash sayısı
+        """
+        if count <= 0:
+            return
+        now = time.time()
+        with self._lock:
+            self._hash_samples.append((now, count))
+            self._window_hashes += count
+            self.hashes_total += count
+            self._prune(now)
+    
+    def record_block(self, mining_time, attempts, difficulty_bits):
+        """
+        Başarıyla madenciliği yapılan bloğu kaydeder
+        
+        Args:
+            mining_time (float): Madencilik süresi (saniye)
+            attempts (int): Bulunana kadar denenen hash sayısı
+            difficulty_bits (int): Kullanılan bit zorluğu
+        """
+        with self._lock:
+            self.blocks_mined += 1
+            self.attempts_total += attempts
+            self.last_block_attempts = attempts
+            self.last_block_difficulty_bits = difficulty_bits
+            self.latency_sum += mining_time
+            for i, bound in enumerate(self.LATENCY_BUCKETS):
+                if mining_time <= bound:
+                    self.latency_buckets[i] += 1
+                    break
+            else:
+                self.latency_buckets[-1] += 1
+    
+    def record_cancelled(self, reason):
+        """
+        Durdurulan madenciliği kaydeder
+        
+        Args:
+            reason (str): Durdurma nedeni
+        """
+        with self._lock:
+            self.blocks_cancelled += 1
+            self.cancel_reasons[reason] = self.cancel_reasons.get(reason, 0) + 1
+    
+    def hash_rate(self):
+        """
+        Kayan penceredeki hash hızını döndürür
+        
+        Returns:
+            float: Saniyede hash
+        """
+        now = time.time()
+        with self._lock:
+            self._prune(now)
+            if not self._hash_samples:
+                return 0.0
+            # Pencere henüz dolmadıysa ilk örnekten bu yana geçen süre kullanılır
+            span = min(self.window_seconds, max(now - self._hash_samples[0][0], 1e-3))
+            return self._window_hashes / span
+    
+    def snapshot(self):
+        """Metriklerin JSON uyumlu anlık görüntüsünü döndürür"""
+        hash_rate = self.hash_rate()
+        with self._lock:
+            cumulative = 0
+            histogram = {}
+            for bound, count in zip(self.LATENCY_BUCKETS + (float('inf'),), self.latency_buckets):
+                cumulative += count
+                histogram['+Inf' if bound == float('inf') else str(bound)] = cumulative
+            
+            return {
+                'hash_rate': hash_rate,
+                'hash_rate_window_seconds': self.window_seconds,
+                'hashes_total': self.hashes_total,
+                'blocks_mined': self.blocks_mined,
+                'blocks_cancelled': self.blocks_cancelled,
+                'cancel_reasons': dict(self.cancel_reasons),
+                'attempts_per_block': self.attempts_total / self.blocks_mined if self.blocks_mined else None,
+                'last_block_attempts': self.last_block_attempts,
+                'last_block_difficulty_bits': self.last_block_difficulty_bits,
+                'mining_latency': {
+                    'count': self.blocks_mined,
+                    'sum': self.latency_sum,
+                    'mean': self.latency_sum / self.blocks_mined if self.blocks_mined else None,
+                    'buckets': histogram
+                }
+            }
+    
+    def to_prometheus(self, extra_gauges=None):
+        """
+        Metrikleri Prometheus metin formatında üretir
+        
+        Args:
+            extra_gauges (dict): Eklenecek ek gauge değerleri {isim: değer}
+        
+        Returns:
+            str: text/plain; version=0.0.4 içeriği
+        """
+        snap = self.snapshot()
+        lines = [
+            '# HELP lightmedchain_mining_hash_rate Rolling mining hash rate (hashes/second)',
+            '# TYPE lightmedchain_mining_hash_rate gauge',
+            f"lightmedchain_mining_hash_rate {snap['hash_rate']}",
+            '# HELP lightmedchain_mining_hashes_total Hashes tried by the mining loop',
+            '# TYPE lightmedchain_mining_hashes_total counter',
+            f"lightmedchain_mining_hashes_total {snap['hashes_total']}",
+            '# HELP lightmedchain_blocks_mined_total Blocks mined successfully',
+            '# TYPE lightmedchain_blocks_mined_total counter',
+            f"lightmedchain_blocks_mined_total {snap['blocks_mined']}",
+            '# HELP lightmedchain_mining_cancelled_total Mining runs stopped before a block was found',
+            '# TYPE lightmedchain_mining_cancelled_total counter',
+        ]
+        for reason, count in sorted(snap['cancel_reasons'].items()):
+            lines.append(f'lightmedchain_mining_cancelled_total{{reason="{reason}"}} {count}')
+        lines += [
+            '# HELP lightmedchain_mining_attempts_per_block Mean hashes tried per mined block',
+            '# TYPE lightmedchain_mining_attempts_per_block gauge',
+            f"lightmedchain_mining_attempts_per_block {snap['attempts_per_block'] or 0}",
+            '# HELP lightmedchain_mining_latency_seconds Time to mine a block',
+            '# TYPE lightmedchain_mining_latency_seconds histogram',
+        ]
+        for bound, count in snap['mining_latency']['buckets'].items():
+            lines.append(f'lightmedchain_mining_latency_seconds_bucket{{le="{bound}"}} {count}')
+        lines.append(f"lightmedchain_mining_latency_seconds_sum {snap['mining_latency']['sum']}")
+        lines.append(f"lightmedchain_mining_latency_seconds_count {snap['mining_latency']['count']}")
+        
+        for name, value in (extra_gauges or {}).items():
+            lines.append(f'# TYPE {name} gauge')
+            lines.append(f'{name} {value}')
+        
+        return '\n'.join(lines) + '\n'
+
+
+# Uygulama genelinde paylaşılan metrik deposu
+mining_metrics = MiningMetrics()
@@ -1,23 +1,377 @@
 # Madencilik işlemleri - Makaledeki leading-zero algoritmasına uygun
 import hashlib
+import json
+import math
+import multiprocessing
+import random
+import threading
 import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime
 from config import Config
+from metrics import mining_metrics
+
+
+# Desteklenen blok hash algoritmaları - hepsi 32 byte (64 hex karakter) digest üretir
+HASH_ALGORITHMS = {
+    'sha256': hashlib.sha256,
+    'blake2b': lambda data=b'': hashlib.blake2b(data, digest_size=32),
+    'sha3_256': hashlib.sha3_256
+}
+
+# Hash algoritması kaydı olmayan (eski) zincirler SHA-256 kullanır
+DEFAULT_HASH_ALGORITHM = 'sha256'
+
+
+def get_hash_function(algorithm):
+    """
+    Algoritma adından hash nesnesi üreten fonksiyonu döndürür
+    
+    Args:
+        algorithm (str): 'sha256', 'blake2b' veya 'sha3_256'
+    
+    Returns:
+        callable: hashlib uyumlu kurucu (bytes -> hash nesnesi)
+    
+    Raises:
+        ValueError: Desteklenmeyen algoritma
+    """
+    try:
+        return HASH_ALGORITHMS[algorithm]
+    except KeyError:
+        raise ValueError(f"Desteklenmeyen hash algoritması: {algorithm} "
+                         f"(desteklenenler: {', '.join(HASH_ALGORITHMS)})")
+
+
+def canonical_json(value):
+    """
+    Değerin hash girdisindeki kanonik JSON byte'larını üretir (sort_keys)
+    
+    Args:
+        value: JSON'a dönüştürülebilir değer ya da önceden üretilmiş byte'lar
+    
+    Returns:
+        bytes: Kanonik JSON (byte verilirse aynen döner)
+    """
+    if isinstance(value, bytes):
+        return value
+    return json.dumps(value, sort_keys=True).encode()
+
+
+def block_hash_prefix(index, timestamp, data, previous_hash, merkle_root=None):
+    """
+    Blok hash girdisinin nonce'tan önceki kısmını üretir
+    
+    Block.calculate_hash ile aynı formattadır:
+    f"{index}{timestamp}{json.dumps(data, sort_keys=True)}{previous_hash}{nonce}"
+    
+    Merkle köklü bloklarda veri yerine kök hash'i kullanılır; başlık
+    kayıtlar olmadan doğrulanabilir:
+    f"{index}{timestamp}{merkle_root}{previous_hash}{nonce}"
+    
+    Args:
+        data: Blok verisi ya da canonical_json ile üretilmiş byte'ları
+        merkle_root (str): Kayıtların Merkle kökü (eski bloklarda None)
+    
+    Returns:
+        bytes: Nonce hariç kanonik blok girdisi
+    """
+    if merkle_root is not None:
+        return f"{index}{timestamp}{merkle_root}{previous_hash}".encode()
+    return f"{index}{timestamp}".encode() + canonical_json(data) + previous_hash.encode()
+
+
+def difficulty_target(bits):
+    """
+    Leading-zero bit zorluğunu ham digest için üst sınıra dönüştürür
+    
+    Digest'in ilk `bits` bitinin sıfır olması, digest < 2^(256-bits) demektir.
+    Big-endian byte karşılaştırması sayısal karşılaştırma ile aynı olduğundan
+    `digest < target` kontrolü yeterlidir. Hex seviyesi d, 4*d bite karşılık gelir.
+    
+    Args:
+        bits (int): Leading-zero bit sayısı
+    
+    Returns:
+        bytes: 32 byte'lık hedef değer
+    """
+    if bits <= 0:
+        return b'\xff' * 33  # Her digest bundan küçüktür
+    if bits >= 256:
+        return b'\x00' * 32
+    return (1 << (256 - bits)).to_bytes(32, 'big')
+
+
+def leading_zero_bits(hash_string):
+    """
+    Hex hash değerindeki leading-zero bit sayısını hesaplar
+    
+    Args:
+        hash_string (str): Hex hash değeri
+    
+    Returns:
+        int: Baştaki sıfır bit sayısı
+    """
+    return len(hash_string) * 4 - int(hash_string, 16).bit_length()
+
+
+def difficulty_bits_for_level(level):
+    """Hex leading-zero seviyesini bit zorluğuna çevirir"""
+    return level * 4
+
+
+def retarget_bits(blocks, current_bits):
+    """
+    Hedef gecikmeye göre sonraki bloğun bit zorluğunu hesaplar (retarget takvimi)
+    
+    Pencere içindeki blokların beklenen işi (2^bits) toplam süreye bölünerek
+    hash hızı tahmin edilir; hedef süreye uyan bit sayısına en fazla
+    RETARGET_MAX_STEP_BITS adımla yaklaşılır. Yalnızca blok başlıklarındaki
+    alanları kullanır; madencilik ve doğrulama aynı değeri hesaplar.
+    
+    Args:
+        blocks (list): Zincirin sonraki bloktan önceki blokları (son RETARGET_WINDOW kullanılır)
+        current_bits (int): Son bloğun bit zorluğu
+    
+    Returns:
+        int: Yeni bit zorluğu veya None (pencerede yeterli kazılmış blok yoksa)
+    """
+    recent = [
+        block for block in blocks[-Config.RETARGET_WINDOW:]
+        if block.index > 0 and block.mining_time and block.difficulty_bits is not None
+    ]
+    if current_bits is None or len(recent) < Config.RETARGET_WINDOW:
+        return None
+    
+    total_time = sum(block.mining_time for block in recent)
+    expected_work = sum(2 ** block.difficulty_bits for block in recent)
+    hash_rate = expected_work / total_time
+    
+    desired_bits = int(math.log2(max(hash_rate * Config.TARGET_BLOCK_TIME, 1)))
+    step = max(-Config.RETARGET_MAX_STEP_BITS, min(Config.RETARGET_MAX_STEP_BITS, desired_bits - current_bits))
+    return max(Config.MIN_DIFFICULTY_BITS, min(Config.MAX_DIFFICULTY_BITS, current_bits + step))
+
+
+class MidstateKernel:
+    """Midstate önbellekli nonce arama çekirdeği
+    
+    Blok prefix'i (index, timestamp, kanonik veri, previous_hash) bir kez
+    serileştirilip hash nesnesine beslenir; her denemede yalnızca bu nesnenin
+    kopyasına nonce eklenir. Desteklenen tüm algoritmalar copy() sağlar.
+    """
+    
+    def __init__(self, prefix, target, hash_algorithm=DEFAULT_HASH_ALGORITHM):
+        """
+        Args:
+            prefix (bytes): Nonce hariç blok girdisi (block_hash_prefix)
+            target (bytes): Digest üst sınırı (difficulty_target)
+            hash_algorithm (str): Blok hash algoritması (HASH_ALGORITHMS)
+        """
+        self.prefix = prefix
+        self.hash_algorithm = hash_algorithm
+        self.midstate = get_hash_function(hash_algorithm)(prefix)
+        self.target = target
+    
+    @classmethod
+    def for_block(cls, index, timestamp, data, previous_hash, difficulty_bits,
+                  hash_algorithm=DEFAULT_HASH_ALGORITHM, merkle_root=None):
+        """Blok alanlarından çekirdek oluşturur"""
+        return cls(block_hash_prefix(index, timestamp, data, previous_hash, merkle_root),
+                   difficulty_target(difficulty_bits), hash_algorithm)
+    
+    def hash_nonce(self, nonce):
+        """Verilen nonce için ham digest döndürür"""
+        h = self.midstate.copy()
+        h.update(b'%d' % nonce)
+        return h.digest()
+    
+    def search(self, start, stop):
+        """
+        [start, stop) aralığında geçerli nonce arar
+        
+        Args:
+            start (int): İlk nonce
+            stop (int): Son nonce (dahil değil)
+        
+        Returns:
+            tuple: (nonce, hex_hash) bulunduysa, yoksa None
+        """
+        copy = self.midstate.copy
+        target = self.target
+        for nonce in range(start, stop):
+            h = copy()
+            h.update(b'%d' % nonce)
+            if h.digest() < target:
+                return nonce, h.hexdigest()
+        return None
+
+
+class MiningCancelToken:
+    """Madenciliği işbirlikçi olarak durdurmak için iptal sinyali
+    
+    Madencilik döngüsü her nonce parçası arasında sinyali kontrol eder;
+    `reason` durdurmanın nedenini taşır.
+    """
+    
+    CANCELLED = 'cancelled'
+    DEADLINE = 'deadline_exceeded'
+    HASH_BUDGET = 'hash_budget_exhausted'
+    DIFFICULTY_CHANGED = 'difficulty_changed'
+    PENDING_DATA_CHANGED = 'pending_data_changed'
+    
+    def __init__(self):
+        self._event = threading.Event()
+        self.reason = None
+    
+    def cancel(self, reason=CANCELLED):
+        """Madenciliğin durdurulmasını ister"""
+        self.reason = reason
+        self._event.set()
+    
+    def is_cancelled(self):
+        """İptal istendi mi"""
+        return self._event.is_set()
+    
+    def reset(self):
+        """Sinyali yeniden kullanım için temizler"""
+        self._event.clear()
+        self.reason = None
+
+
+class MiningCancelled(Exception):
+    """Madencilik blok bulunamadan durdurulduğunda fırlatılır"""
+    
+    def __init__(self, reason, result=None):
+        super().__init__(f"Madencilik durduruldu: {reason}")
+        self.reason = reason
+        self.result = result
+
+
+# Paralel madencilik işçi süreçlerinin paylaşılan durumu (initializer ile atanır)
+_worker_stop_event = None
+_worker_counters = None
+
+
+def _init_mining_worker(stop_event, counters):
+    """İşçi sürecine durdurma sinyalini ve hash sayaçlarını bağlar"""
+    global _worker_stop_event, _worker_counters
+    _worker_stop_event = stop_event
+    _worker_counters = counters
+
+
+def _mine_nonce_partition(worker_id, worker_count, prefix, target, batch_size, hash_algorithm):
+    """
+    Bir işçinin nonce bölümünü tarar
+    
+    Nonce uzayı batch_size'lık parçalara bölünür; işçi `worker_id`,
+    k % worker_count == worker_id olan k. parçaları sırayla tarar. Her parça
+    arasında durdurma sinyali kontrol edilir.
+    
+    Returns:
+        dict: İşçi sonucu (nonce/hash bulunamadıysa None)
+    """
+    kernel = MidstateKernel(prefix, target, hash_algorithm)
+    hash_operations = 0
+    batch = worker_id
+    
+    while not _worker_stop_event.is_set():
+        batch_start = batch * batch_size
+        found = kernel.search(batch_start, batch_start + batch_size)
+        
+        if found:
+            nonce, block_hash = found
+            hash_operations += nonce - batch_start + 1
+            _worker_counters[worker_id] = hash_operations
+            _worker_stop_event.set()
+            return {'worker_id': worker_id, 'nonce': nonce, 'hash': block_hash, 'hash_operations': hash_operations}
+        
+        hash_operations += batch_size
+        _worker_counters[worker_id] = hash_operations
+        batch += worker_count
+    
+    return {'worker_id': worker_id, 'nonce': None, 'hash': None, 'hash_operations': hash_operations}
+
+
+# Paralel madencilik süreç havuzu - bloklar ve MiningEngine nesneleri arasında paylaşılır.
+# Süreç başlatma maliyeti her blokta ödenmez; havuzu aynı anda tek madencilik kullanır.
+_mining_pool_lock = threading.Lock()
+_mining_pool = None  # (işçi sayısı, havuz, durdurma sinyali, hash sayaçları)
+
+
+def _get_mining_pool(workers):
+    """
+    İşçi sayısına uygun paylaşılan süreç havuzunu döndürür (gerekirse yeniden kurar)
+    
+    Çağıran _mining_pool_lock'u tutmalıdır.
+    
+    Returns:
+        tuple: (ProcessPoolExecutor, durdurma sinyali, hash sayaçları)
+    """
+    global _mining_pool
+    if _mining_pool is None or _mining_pool[0] != workers:
+        _close_mining_pool()
+        context = multiprocessing.get_context()
+        stop_event = context.Event()
+        counters = context.Array('Q', workers, lock=False)
+        pool = ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                                   initializer=_init_mining_worker,
+                                   initargs=(stop_event, counters))
+        _mining_pool = (workers, pool, stop_event, counters)
+    return _mining_pool[1:]
+
+
+def _close_mining_pool():
+    """Paylaşılan havuzu kapatır - çağıran _mining_pool_lock'u tutmalıdır"""
+    global _mining_pool
+    if _mining_pool is not None:
+        _, pool, stop_event, _ = _mining_pool
+        _mining_pool = None
+        stop_event.set()
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def shutdown_mining_pool():
+    """Paralel madencilik süreçlerini sonlandırır (sonraki paralel madencilik havuzu yeniden kurar)"""
+    with _mining_pool_lock:
+        _close_mining_pool()
+
 
 class MiningEngine:
     """Madencilik motoru - Makaledeki leading-zero algoritmasını implemente eder"""
     
-    def __init__(self, difficulty=Config.BLOCKCHAIN_DIFFICULTY):
+    # Tek seferde taranan nonce sayısı (ilerleme raporu da bu aralıkla yapılır)
+    BATCH_SIZE = 10000
+    # Paralel modda işçi sayaçlarının okunma aralığı (saniye)
+    PROGRESS_INTERVAL = 0.25
+    
+    def __init__(self, difficulty=Config.BLOCKCHAIN_DIFFICULTY, workers=Config.MINING_WORKERS, difficulty_bits=None,
+                 metrics=mining_metrics, hash_algorithm=Config.BLOCK_HASH_ALGORITHM):
         """
         Madencilik motoru oluşturur
         
         Args:
             difficulty (int): Zorluk seviyesi (1-5 arası)
+            workers (int): Paralel madencilik süreç sayısı (1 = tek süreç)
+            difficulty_bits (int): Bit cinsinden zorluk (verilirse seviyenin yerine geçer)
+            metrics (MiningMetrics): Telemetri deposu (None ise kayıt yapılmaz)
+            hash_algorithm (str): Blok hash algoritması (HASH_ALGORITHMS)
         """
+        get_hash_function(hash_algorithm)  # Geçersiz algoritma burada reddedilir
+        self.hash_algorithm = hash_algorithm
         self.difficulty = difficulty
+        self.difficulty_bits = difficulty_bits
+        self.metrics = metrics
+        self.workers = max(1, int(workers))
         self.nonce = 0
         self.hash_operations = 0
     
+    def get_difficulty_bits(self):
+        """Etkin bit zorluğunu döndürür (açık bit ayarı yoksa seviye * 4)"""
+        if self.difficulty_bits is not None:
+            return self.difficulty_bits
+        return difficulty_bits_for_level(self.difficulty)
+    
     def leading_zero_count(self, hash_string):
         """
         Leading-zero sayısını hesaplar - Makaledeki algoritma
@@ -36,9 +390,9 @@ class MiningEngine:
                 break
         return count
     
-    def calculate_hash(self, index, timestamp, data, previous_hash, nonce):
+    def calculate_hash(self, index, timestamp, data, previous_hash, nonce, merkle_root=None):
         """
-        SHA256 hash hesaplar - Makaledeki standart
+        Blok hash'ini motorun algoritmasıyla hesaplar (varsayılan SHA256 - Makaledeki standart)
         
         Args:
             index (int): Blok indexi
@@ -46,100 +400,253 @@ class MiningEngine:
             data (dict): Blok verisi
             previous_hash (str): Önceki hash
             nonce (int): Nonce değeri
+            merkle_root (str): Merkle köklü bloklarda kayıtların kökü (opsiyonel)
         
         Returns:
             str: Hesaplanan hash
         """
         # Makaledeki formata uygun hash hesaplama
-        import json
-        block_string = f"{index}{timestamp}{json.dumps(data, sort_keys=True)}{previous_hash}{nonce}"
-        return hashlib.sha256(block_string.encode()).hexdigest()
+        block_bytes = block_hash_prefix(index, timestamp, data, previous_hash, merkle_root) + b'%d' % nonce
+        return get_hash_function(self.hash_algorithm)(block_bytes).hexdigest()
     
-    def mine_block(self, index, timestamp, data, previous_hash):
+    def _stop_reason(self, cancel_token, deadline, max_hashes, hash_operations):
+        """
+        Madenciliğin durdurulması gerekip gerekmediğini kontrol eder
+        
+        Returns:
+            str: Durdurma nedeni veya None
+        """
+        if cancel_token is not None and cancel_token.is_cancelled():
+            return cancel_token.reason
+        if deadline is not None and time.time() >= deadline:
+            return MiningCancelToken.DEADLINE
+        if max_hashes is not None and hash_operations >= max_hashes:
+            return MiningCancelToken.HASH_BUDGET
+        return None
+    
+    def _cancelled_result(self, index, reason, start_time, difficulty_bits):
+        """Durdurulan madencilik için sonuç sözlüğü üretir"""
+        mining_time = time.time() - start_time
+        if self.metrics:
+            self.metrics.record_cancelled(reason)
+        return {
+            'nonce': None,
+            'hash': None,
+            'mining_time': mining_time,
+            'hash_operations': self.hash_operations,
+            'difficulty': self.difficulty,
+            'difficulty_bits': difficulty_bits,
+            'hash_algorithm': self.hash_algorithm,
+            'cancelled': True,
+            'cancel_reason': reason
+        }
+    
+    def mine_block(self, index, timestamp, data, previous_hash, progress_callback=None,
+                   cancel_token=None, deadline=None, max_hashes=None, merkle_root=None):
         """
         Blok madenciliği yapar - Leading-zero bulma
         
+        Durdurma koşulları her nonce parçası (BATCH_SIZE) arasında kontrol edilir.
+        Durdurulan madencilikte sonuçtaki 'cancelled' True, 'nonce' ve 'hash' None olur.
+        
         Args:
             index (int): Blok indexi
             timestamp (str): Zaman damgası
             data (dict): Blok verisi
             previous_hash (str): Önceki hash
+            progress_callback (callable): Denenen hash sayısıyla periyodik çağrılır (opsiyonel)
+            cancel_token (MiningCancelToken): İptal sinyali (opsiyonel)
+            deadline (float): time.time() cinsinden son an (opsiyonel)
+            max_hashes (int): Denenecek en fazla hash sayısı (opsiyonel)
+            merkle_root (str): Merkle köklü bloklarda hash'e veri yerine girer (opsiyonel)
         
         Returns:
             dict: Madencilik sonuçları
         """
-        print(f"⛏️  Blok #{index} madenciliği başlıyor... Zorluk: {self.difficulty}")
+        if self.workers > 1:
+            return self.mine_block_parallel(index, timestamp, data, previous_hash, progress_callback,
+                                            cancel_token, deadline, max_hashes, merkle_root)
+        
+        difficulty_bits = self.get_difficulty_bits()
+        metrics = self.metrics
         start_time = time.time()
         self.nonce = 0
         self.hash_operations = 0
         
-        target_zeros = '0' * self.difficulty
+        # Prefix bir kez serileştirilir, döngüde yalnızca nonce hash'lenir
+        kernel = MidstateKernel.for_block(index, timestamp, data, previous_hash, difficulty_bits,
+                                          self.hash_algorithm, merkle_root)
         
         while True:
-            current_hash = self.calculate_hash(index, timestamp, data, previous_hash, self.nonce)
-            self.hash_operations += 1
+            stop_reason = self._stop_reason(cancel_token, deadline, max_hashes, self.hash_operations)
+            if stop_reason:
+                return self._cancelled_result(index, stop_reason, start_time, difficulty_bits)
+            
+            batch_start = self.nonce
+            batch_end = batch_start + self.BATCH_SIZE
+            if max_hashes is not None:
+                batch_end = min(batch_end, max_hashes)
+            found = kernel.search(batch_start, batch_end)
             
             # Leading-zero kontrolü
-            if current_hash.startswith(target_zeros):
+            if found:
+                self.nonce, current_hash = found
+                self.hash_operations += self.nonce - batch_start + 1
+                if progress_callback:
+                    progress_callback(self.hash_operations)
                 end_time = time.time()
                 mining_time = end_time - start_time
                 
-                print(f"✅ Blok #{index} başarıyla madenci!")
-                print(f"🔗 Hash: {current_hash}")
-                print(f"🔢 Nonce: {self.nonce}")
-                print(f"⏱️  Süre: {mining_time:.6f} saniye")
-                print(f"🔄 Hash operasyonu: {self.hash_operations}")
+                if metrics:
+                    metrics.record_hashes(self.nonce - batch_start + 1)
+                    metrics.record_block(mining_time, self.hash_operations, difficulty_bits)
                 
                 return {
                     'nonce': self.nonce,
                     'hash': current_hash,
                     'mining_time': mining_time,
                     'hash_operations': self.hash_operations,
-                    'difficulty': self.difficulty
+                    'difficulty': self.difficulty,
+                    'difficulty_bits': difficulty_bits,
+                    'hash_algorithm': self.hash_algorithm,
+                    'cancelled': False
                 }
             
-            self.nonce += 1
+            self.hash_operations += batch_end - batch_start
+            self.nonce = batch_end
             
-            # Her 10000 denemede bir progress göster
-            if self.nonce % 10000 == 0:
-                print(f"⏳ Denenen nonce: {self.nonce}, Mevcut hash: {current_hash}")
+            # İlerleme parça başına bir kez raporlanır (deneme başına maliyet yok)
+            if metrics:
+                metrics.record_hashes(batch_end - batch_start)
+            if progress_callback:
+                progress_callback(self.hash_operations)
     
-    def benchmark_difficulty_levels(self, index, timestamp, data, previous_hash):
+    def mine_block_parallel(self, index, timestamp, data, previous_hash, progress_callback=None,
+                            cancel_token=None, deadline=None, max_hashes=None, merkle_root=None):
         """
-        Tüm zorluk seviyelerinde performans testi yapar - Makaledeki deney
+        Nonce uzayını süreç havuzuna bölerek paralel madencilik yapar
+        
+        İşçilerden biri geçerli hash bulduğunda ya da durdurma koşulu oluştuğunda
+        paylaşılan durdurma sinyali set edilir ve işçiler mevcut parçalarını
+        bitirip döner. Hash bütçesi işçi sayaçlarından okunduğu için yaklaşık
+        olarak uygulanır.
+        
+        Süreç havuzu bloklar arasında yeniden kullanılır; eşzamanlı paralel
+        madencilikler havuzu sırayla kullanır. Bekleme döngüsünde hata olursa
+        (işçi hatası, progress_callback, metrik kaydı) işçiler durdurulup
+        beklendikten sonra hata yükseltilir.
         
         Args:
             index (int): Blok indexi
             timestamp (str): Zaman damgası
             data (dict): Blok verisi
             previous_hash (str): Önceki hash
+            progress_callback (callable): Toplam denenen hash sayısıyla periyodik çağrılır (opsiyonel)
+            cancel_token (MiningCancelToken): İptal sinyali (opsiyonel)
+            deadline (float): time.time() cinsinden son an (opsiyonel)
+            max_hashes (int): Denenecek en fazla hash sayısı (opsiyonel)
+            merkle_root (str): Merkle köklü bloklarda hash'e veri yerine girer (opsiyonel)
         
         Returns:
-            dict: Tüm zorluk seviyeleri için sonuçlar
+            dict: Madencilik sonuçları (işçi bazında hash sayılarıyla)
         """
-        print("🧪 Zorluk seviyeleri performans testi başlıyor...")
-        results = {}
+        difficulty_bits = self.get_difficulty_bits()
+        metrics = self.metrics
+        start_time = time.time()
+        self.nonce = 0
+        self.hash_operations = 0
         
-        original_difficulty = self.difficulty
+        # Prefix ana süreçte bir kez serileştirilir, işçilere bytes olarak gider
+        kernel = MidstateKernel.for_block(index, timestamp, data, previous_hash, difficulty_bits,
+                                          self.hash_algorithm, merkle_root)
         
-        for difficulty in range(1, 6):  # 1-5 arası zorluk seviyeleri
-            self.difficulty = difficulty
-            print(f"\n🔬 Zorluk seviyesi {difficulty} test ediliyor...")
-            
-            result = self.mine_block(index, timestamp, data, previous_hash)
-            results[difficulty] = result
+        worker_results = []
+        stop_reason = None
+        reported_hashes = 0
+        with _mining_pool_lock:
+            pool, stop_event, counters = _get_mining_pool(self.workers)
+            stop_event.clear()
+            counters[:] = [0] * self.workers
+            pending = {
+                pool.submit(_mine_nonce_partition, worker_id, self.workers,
+                            kernel.prefix, kernel.target, self.BATCH_SIZE, self.hash_algorithm)
+                for worker_id in range(self.workers)
+            }
+            try:
+                while pending:
+                    done, pending = wait(pending, timeout=self.PROGRESS_INTERVAL, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        result = future.result()
+                        if result['nonce'] is not None:
+                            stop_event.set()
+                        worker_results.append(result)
+                    
+                    total_hashes = sum(counters)
+                    if metrics:
+                        metrics.record_hashes(total_hashes - reported_hashes)
+                    reported_hashes = total_hashes
+                    if progress_callback:
+                        progress_callback(total_hashes)
+                    
+                    if not stop_event.is_set():
+                        stop_reason = self._stop_reason(cancel_token, deadline, max_hashes, total_hashes)
+                        if stop_reason:
+                            stop_event.set()
+            except BrokenProcessPool:
+                # Çökmüş havuz bir sonraki madencilikte yeniden kurulur
+                _close_mining_pool()
+                raise
+            finally:
+                # Hata olsa da kalan işçiler durdurulup beklenir; havuz boşta kalır
+                stop_event.set()
+                wait(pending)
+        
+        worker_results.sort(key=lambda r: r['worker_id'])
+        self.hash_operations = sum(r['hash_operations'] for r in worker_results)
+        if metrics:
+            metrics.record_hashes(self.hash_operations - reported_hashes)
+        if progress_callback:
+            progress_callback(self.hash_operations)
+        
+        found_results = [r for r in worker_results if r['nonce'] is not None]
+        if not found_results:
+            return self._cancelled_result(index, stop_reason, start_time, difficulty_bits)
         
-        # Orijinal zorluk seviyesine geri dön
-        self.difficulty = original_difficulty
+        # Aynı anda birden fazla işçi bulabilir - en küçük nonce seçilir
+        winner = min(found_results, key=lambda r: r['nonce'])
+        self.nonce = winner['nonce']
+        mining_time = time.time() - start_time
         
-        return results
+        if metrics:
+            metrics.record_block(mining_time, self.hash_operations, difficulty_bits)
+        
+        return {
+            'nonce': self.nonce,
+            'hash': winner['hash'],
+            'mining_time': mining_time,
+            'hash_operations': self.hash_operations,
+            'difficulty': self.difficulty,
+            'difficulty_bits': difficulty_bits,
+            'hash_algorithm': self.hash_algorithm,
+            'cancelled': False,
+            'worker_count': self.workers,
+            'workers': [
+                {
+                    'worker_id': r['worker_id'],
+                    'hash_operations': r['hash_operations'],
+                    'found': r['nonce'] is not None
+                }
+                for r in worker_results
+            ]
+        }
     
     def compare_with_existing_networks(self, mining_time):
         """
         Mevcut blockchain ağları ile performans karşılaştırması - Makaledeki tablo
         
         Args:
-            mining_time (float): Bizim sistemin madencilik süresi
+            mining_time (float|dict): Tek ölçüm (saniye) ya da benchmark.summarize
+                çıktısı; istatistik verilirse ortalama ve p95/p99 birlikte karşılaştırılır
         
         Returns:
             dict: Karşılaştırma sonuçları
@@ -152,68 +659,305 @@ class MiningEngine:
             'dogecoin': 60    # 60 saniye
         }
         
+        if isinstance(mining_time, dict):
+            our_time = mining_time['mean']
+            tail_times = {'our_p95': mining_time['p95'], 'our_p99': mining_time['p99']}
+        else:
+            our_time = mining_time
+            tail_times = {}
+        
         comparison = {}
         for network, time_ in network_times.items():
             comparison[network] = {
                 'their_time': time_,
-                'our_time': mining_time,
-                'faster_by': time_ - mining_time if time_ > mining_time else 0,
-                'slower_by': mining_time - time_ if mining_time > time_ else 0,
-                'is_faster': mining_time < time_
+                'our_time': our_time,
+                **tail_times,
+                'faster_by': time_ - our_time if time_ > our_time else 0,
+                'slower_by': our_time - time_ if our_time > time_ else 0,
+                'is_faster': our_time < time_,
+                # Kuyruk gecikmesi de daha hızlı mı (tek ölçümde ortalama ile aynı)
+                'is_faster_at_p99': tail_times.get('our_p99', our_time) < time_
             }
         
         return comparison
 
 
 class DifficultyManager:
-    """Zorluk seviyesi yöneticisi - Makaledeki difficulty ayarlarını yönetir"""
+    """Zorluk seviyesi yöneticisi - Makaledeki difficulty ayarlarını yönetir
     
-    def __init__(self):
+    Bu makinenin hash hızı MiningEngine ile ölçülerek (kalibrasyon) her zorluk
+    ve veri boyutu için beklenen ve yüzdelik madencilik süreleri tahmin edilir.
+    """
+    
+    # Kalibrasyonda blok serileştirme maliyeti ölçülen kayıt sayıları
+    CALIBRATION_PAYLOAD_SIZES = (1, 10, 100, 1000)
+    
+    def __init__(self, mining_engine=None):
+        """
+        Args:
+            mining_engine (MiningEngine): Kalibrasyonda işçi sayısı alınacak motor (opsiyonel)
+        """
+        self.mining_engine = mining_engine
+        self.calibration = None
+        self.calibration_error = None
+        self._calibration_lock = threading.Lock()
+        self._calibration_thread = None
         self.difficulty_levels = {
             1: {
                 'leading_zeros': 1,
+                'leading_zero_bits': 4,
                 'example': '0xxxxxxxxxxx',
                 'description': 'Çok Kolay - Hızlı işlemler için'
             },
             2: {
                 'leading_zeros': 2,
+                'leading_zero_bits': 8,
                 'example': '00xxxxxxxxxx',
                 'description': 'Kolay - Önerilen IoT seviyesi'
             },
             3: {
                 'leading_zeros': 3,
+                'leading_zero_bits': 12,
                 'example': '000xxxxxxxxx',
                 'description': 'Orta - Denge performans'
             },
             4: {
                 'leading_zeros': 4,
+                'leading_zero_bits': 16,
                 'example': '0000xxxxxxxx',
                 'description': 'Zor - Yüksek güvenlik'
             },
             5: {
                 'leading_zeros': 5,
+                'leading_zero_bits': 20,
                 'example': '00000xxxxxxx',
                 'description': 'Çok Zor - Maksimum güvenlik'
             }
         }
     
-    def get_difficulty_settings(self, level):
+    def get_difficulty_settings(self, level, payload_size=None, target_latency=None):
         """
         Zorluk seviyesi ayarlarını getirir
         
         Args:
             level (int): Zorluk seviyesi (1-5)
+            payload_size (int): Verilirse bu blok boyutu için süre tahmini eklenir
+            target_latency (float): Tahminle birlikte hedef süreye uyup uymadığı eklenir
         
         Returns:
             dict: Zorluk ayarları
         """
-        return self.difficulty_levels.get(level, self.difficulty_levels[2])
+        settings = dict(self.difficulty_levels.get(level, self.difficulty_levels[2]))
+        if payload_size is not None:
+            settings['prediction'] = self.predict_mining_time(settings['leading_zero_bits'], payload_size)
+            if target_latency is not None:
+                settings['fits_target'] = settings['prediction']['p95_time'] <= target_latency
+        return settings
     
-    def get_all_difficulty_levels(self):
+    def get_all_difficulty_levels(self, payload_size=None, target_latency=None):
         """
         Tüm zorluk seviyelerini getirir
         
+        Args:
+            payload_size (int): Verilirse her seviye için süre tahmini eklenir
+            target_latency (float): Verilirse hedefe uyan en yüksek seviye işaretlenir
+        
         Returns:
             dict: Tüm zorluk seviyeleri
         """
-        return self.difficulty_levels
\ No newline at end of file
+        if payload_size is None:
+            return self.difficulty_levels
+        
+        levels = {
+            level: self.get_difficulty_settings(level, payload_size, target_latency)
+            for level in self.difficulty_levels
+        }
+        if target_latency is not None:
+            recommended = self.recommend_difficulty(target_latency, payload_size)['recommended_level']
+            for level, settings in levels.items():
+                settings['recommended'] = level == recommended
+        return levels
+    
+    def calibrate(self, sample_hashes=50000, payload_sizes=CALIBRATION_PAYLOAD_SIZES):
+        """
+        Bu makinenin madencilik hızını ölçer
+        
+        Hash hızı, hiçbir nonce'un sağlayamayacağı bir zorlukla MiningEngine'in
+        hash bütçesiyle çalıştırılmasıyla ölçülür. Blok başına sabit maliyet
+        (verinin kanonik serileştirilmesi) her veri boyutu için ayrıca ölçülüp
+        kayıt sayısına doğrusal olarak uydurulur.
+        
+        Args:
+            sample_hashes (int): Hız ölçümünde denenecek hash sayısı
+            payload_sizes (iterable): Serileştirme maliyeti ölçülecek kayıt sayıları
+        
+        Returns:
+            dict: Kalibrasyon sonucu
+        """
+        from benchmark import MiningBenchmark
+        
+        workers = self.mining_engine.workers if self.mining_engine else 1
+        hash_algorithm = self.mining_engine.hash_algorithm if self.mining_engine else Config.BLOCK_HASH_ALGORITHM
+        generator = MiningBenchmark(trials=1)
+        rng = random.Random(0)
+        payloads = {size: generator.generate_payload(size, rng) for size in payload_sizes}
+        
+        engine = MiningEngine(workers=workers, difficulty_bits=256, metrics=None, hash_algorithm=hash_algorithm)
+        result = engine.mine_block(0, datetime.now().isoformat(), payloads[min(payload_sizes)], '0' * 64,
+                                   max_hashes=sample_hashes)
+        hash_rate = result['hash_operations'] / result['mining_time']
+        
+        overheads = {}
+        for size, payload in payloads.items():
+            samples = []
+            for _ in range(5):
+                start = time.perf_counter()
+                MidstateKernel.for_block(1, datetime.now().isoformat(), payload, '0' * 64, 256, hash_algorithm)
+                samples.append(time.perf_counter() - start)
+            overheads[size] = sorted(samples)[len(samples) // 2]
+        
+        # En küçük kareler: overhead = sabit + kayıt_başı * boyut
+        sizes = list(overheads)
+        mean_size = sum(sizes) / len(sizes)
+        mean_overhead = sum(overheads.values()) / len(sizes)
+        spread = sum((size - mean_size) ** 2 for size in sizes)
+        per_record = sum((size - mean_size) * (overheads[size] - mean_overhead) for size in sizes) / spread if spread else 0.0
+        per_record = max(per_record, 0.0)
+        
+        self.calibration = {
+            'hash_rate': hash_rate,
+            'workers': workers,
+            'hash_algorithm': hash_algorithm,
+            'sample_hashes': result['hash_operations'],
+            'overhead_per_block': max(mean_overhead - per_record * mean_size, 0.0),
+            'overhead_per_record': per_record,
+            'measured_overheads': {str(size): overhead for size, overhead in overheads.items()},
+            'calibrated_at': datetime.now().isoformat()
+        }
+        return self.calibration
+    
+    def calibrate_in_background(self):
+        """
+        Kalibrasyonu arka plan thread'inde başlatır
+        
+        API açılışta bunu çağırır; tahmin isteyen GET istekleri ölçüm
+        bitene kadar beklemez ve ölçümü kendileri tetiklemez. Süren bir
+        kalibrasyon varsa yenisi başlatılmaz.
+        
+        Returns:
+            threading.Thread: Kalibrasyon thread'i
+        """
+        with self._calibration_lock:
+            if self._calibration_thread is None or not self._calibration_thread.is_alive():
+                self._calibration_thread = threading.Thread(target=self._calibrate_quietly,
+                                                            name='difficulty-calibration', daemon=True)
+                self._calibration_thread.start()
+            return self._calibration_thread
+    
+    def _calibrate_quietly(self):
+        """Arka plan kalibrasyonu - hata thread'i düşürmez, calibration_error'a yazılır"""
+        try:
+            self.calibrate()
+            self.calibration_error = None
+        except Exception as e:
+            self.calibration_error = str(e)
+            print(f"⚠️ Zorluk kalibrasyonu başarısız: {e}")
+    
+    def is_calibrating(self):
+        """Arka plan kalibrasyonu sürüyor mu"""
+        thread = self._calibration_thread
+        return thread is not None and thread.is_alive()
+    
+    def predict_mining_time(self, bits, payload_size=10):
+        """
+        Verilen zorluk ve blok boyutu için madencilik süresini tahmin eder
+        
+        Deneme sayısı p = 2^-bits ile geometrik dağılır; q yüzdeliği
+        ln(1-q) / ln(1-p) denemeye karşılık gelir.
+        
+        Args:
+            bits (int): Leading-zero bit sayısı
+            payload_size (int): Bloktaki kayıt sayısı
+        
+        Returns:
+            dict: Beklenen ve yüzdelik süreler (saniye)
+        """
+        calibration = self.calibration or self.calibrate()
+        hash_rate = calibration['hash_rate']
+        overhead = calibration['overhead_per_block'] + calibration['overhead_per_record'] * payload_size
+        success = 2.0 ** -bits
+        
+        def attempts_at(quantile):
+            if success >= 1:
+                return 1
+            return math.log(1 - quantile) / math.log1p(-success)
+        
+        expected_attempts = 2 ** bits
+        return {
+            'leading_zero_bits': bits,
+            'payload_size': payload_size,
+            'expected_attempts': expected_attempts,
+            'overhead_time': overhead,
+            'expected_time': overhead + expected_attempts / hash_rate,
+            'p50_time': overhead + attempts_at(0.50) / hash_rate,
+            'p95_time': overhead + attempts_at(0.95) / hash_rate,
+            'p99_time': overhead + attempts_at(0.99) / hash_rate,
+            'hash_rate': hash_rate
+        }
+    
+    def recommend_difficulty(self, target_latency, payload_size=10, quantile='p95'):
+        """
+        Hedef gecikme bütçesine uyan en yüksek zorluğu önerir
+        
+        Args:
+            target_latency (float): Gecikme bütçesi (saniye)
+            payload_size (int): Bloktaki kayıt sayısı
+            quantile (str): Bütçeyle karşılaştırılacak süre ('expected', 'p50', 'p95', 'p99')
+        
+        Returns:
+            dict: Önerilen bit zorluğu ve hex seviyesi
+        """
+        key = 'expected_time' if quantile == 'expected' else f'{quantile}_time'
+        
+        recommended_bits = None
+        for bits in range(Config.MIN_DIFFICULTY_BITS, Config.MAX_DIFFICULTY_BITS + 1):
+            if self.predict_mining_time(bits, payload_size)[key] > target_latency:
+                break
+            recommended_bits = bits
+        
+        recommended_level = None
+        for level, settings in sorted(self.difficulty_levels.items()):
+            if self.predict_mining_time(settings['leading_zero_bits'], payload_size)[key] <= target_latency:
+                recommended_level = level
+        
+        prediction_bits = recommended_bits if recommended_bits is not None else Config.MIN_DIFFICULTY_BITS
+        return {
+            'target_latency': target_latency,
+            'payload_size': payload_size,
+            'quantile': quantile,
+            'fits': recommended_bits is not None,
+            'recommended_bits': recommended_bits,
+            'recommended_level': recommended_level,
+            'prediction': self.predict_mining_time(prediction_bits, payload_size),
+            'calibration': self.calibration
+        }
+    
+    def get_bit_difficulty_settings(self, bits):
+        """
+        Bit cinsinden zorluk ayarlarını getirir
+        
+        Her ek bit beklenen iş miktarını iki katına çıkarır; hex seviyeleri
+        arasındaki 16 katlık sıçramalar bu sayede ara değerlerle ayarlanabilir.
+        
+        Args:
+            bits (int): Leading-zero bit sayısı
+        
+        Returns:
+            dict: Zorluk ayarları
+        """
+        return {
+            'leading_zero_bits': bits,
+            'equivalent_level': bits / 4,
+            'expected_attempts': 2 ** bits,
+            'description': f'{bits} bit - Seviye {bits // 4} ile {bits // 4 + 1} arası' if bits % 4 else f'{bits} bit - Seviye {bits // 4}'
+        }
\ No newline at end of file
@@ -0,0 +1,208 @@
+# Arka plan madencilik işleri - /api/blockchain/mine isteğini bloklamadan çalıştırır
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from datetime import datetime
+from queue import Queue
+from mining import MiningCancelled, MiningCancelToken
+
+
+class MiningJob:
+    """Tek bir madencilik işinin durumu"""
+    
+    QUEUED = 'queued'
+    RUNNING = 'running'
+    COMPLETED = 'completed'
+    NO_DATA = 'no_data'
+    FAILED = 'failed'
+    CANCELLED = 'cancelled'
+    
+    def __init__(self, job_id=None, max_seconds=None, max_hashes=None):
+        """
+        Madencilik işi oluşturur
+        
+        Args:
+            job_id (str): İş ID'si (verilmezse üretilir)
+            max_seconds (float): İşin en uzun madencilik süresi (opsiyonel)
+            max_hashes (int): İşin en fazla deneyeceği hash sayısı (opsiyonel)
+        """
+        self.job_id = job_id or f"mine_{uuid.uuid4().hex[:12]}"
+        self.max_seconds = max_seconds
+        self.max_hashes = max_hashes
+        self.cancel_token = MiningCancelToken()
+        self.status = self.QUEUED
+        self.created_at = datetime.now().isoformat()
+        self.started_at = None
+        self.finished_at = None
+        self.hash_operations = 0
+        self.block = None
+        self.error = None
+        self.cancel_reason = None
+    
+    def update_progress(self, hash_operations):
+        """Madencilik motorundan gelen ilerlemeyi kaydeder"""
+        self.hash_operations = hash_operations
+    
+    def is_finished(self):
+        """İş sonuçlandı mı"""
+        return self.status in (self.COMPLETED, self.NO_DATA, self.FAILED, self.CANCELLED)
+    
+    def to_dict(self):
+        """İş nesnesini sözlük formatına dönüştürür - API için"""
+        return {
+            'job_id': self.job_id,
+            'status': self.status,
+            'created_at': self.created_at,
+            'started_at': self.started_at,
+            'finished_at': self.finished_at,
+            'hash_operations': self.hash_operations,
+            'block': self.block,
+            'error': self.error,
+            'cancel_reason': self.cancel_reason,
+            'max_seconds': self.max_seconds,
+            'max_hashes': self.max_hashes
+        }
+
+
+class MiningScheduler:
+    """Madencilik zamanlayıcısı - İşleri tek bir arka plan thread'inde sırayla çalıştırır
+    
+    Zincire ekleme sıralı olmak zorunda olduğundan tek işçi thread kullanılır;
+    paralellik gerekiyorsa MiningEngine süreç havuzu (MINING_WORKERS) devreye girer.
+    """
+    
+    def __init__(self, blockchain, max_history=100):
+        """
+        Zamanlayıcı oluşturur
+        
+        Args:
+            blockchain (Blockchain): Madenciliği yapılacak zincir
+            max_history (int): Bellekte tutulacak en fazla iş sayısı
+        """
+        self.blockchain = blockchain
+        self.max_history = max_history
+        self.jobs = OrderedDict()
+        self._queue = Queue()
+        self._lock = threading.Lock()
+        self._worker = None
+    
+    def submit(self, max_seconds=None, max_hashes=None):
+        """
+        Yeni madencilik işi kuyruğa ekler
+        
+        Henüz başlamamış ve aynı limitlere sahip bir iş varsa yeni iş açılmaz;
+        o iş başladığında o ana kadar gelen tüm bekleyen veriler zaten bloğa
+        alınacaktır.
+        
+        Args:
+            max_seconds (float): İşin en uzun madencilik süresi (opsiyonel)
+            max_hashes (int): İşin en fazla deneyeceği hash sayısı (opsiyonel)
+        
+        Returns:
+            MiningJob: Kuyruktaki iş
+        """
+        with self._lock:
+            for job in self.jobs.values():
+                if (job.status == MiningJob.QUEUED and job.max_seconds == max_seconds
+                        and job.max_hashes == max_hashes):
+                    return job
+            
+            job = MiningJob(max_seconds=max_seconds, max_hashes=max_hashes)
+            self.jobs[job.job_id] = job
+            self._trim_history()
+            self._ensure_worker()
+        
+        self._queue.put(job)
+        return job
+    
+    def get_job(self, job_id):
+        """
+        İş durumunu getirir
+        
+        Args:
+            job_id (str): İş ID'si
+        
+        Returns:
+            MiningJob: İş veya None
+        """
+        return self.jobs.get(job_id)
+    
+    def cancel_job(self, job_id):
+        """
+        Kuyruktaki ya da çalışan işi iptal eder
+        
+        Args:
+            job_id (str): İş ID'si
+        
+        Returns:
+            MiningJob: İş veya None (bulunamadıysa)
+        """
+        job = self.jobs.get(job_id)
+        if not job or job.is_finished():
+            return job
+        
+        with self._lock:
+            if job.status == MiningJob.QUEUED:
+                job.status = MiningJob.CANCELLED
+                job.cancel_reason = MiningCancelToken.CANCELLED
+                job.finished_at = datetime.now().isoformat()
+                return job
+        
+        job.cancel_token.cancel(MiningCancelToken.CANCELLED)
+        return job
+    
+    def list_jobs(self):
+        """Son işleri (en yeni önce) döndürür"""
+        with self._lock:
+            return [job.to_dict() for job in reversed(self.jobs.values())]
+    
+    def _ensure_worker(self):
+        """Arka plan thread'ini gerekirse başlatır"""
+        if self._worker is None or not self._worker.is_alive():
+            self._worker = threading.Thread(target=self._run, name="mining-scheduler", daemon=True)
+            self._worker.start()
+    
+    def _trim_history(self):
+        """Eski, tamamlanmış işleri geçmişten siler"""
+        while len(self.jobs) > self.max_history:
+            oldest_id, oldest_job = next(iter(self.jobs.items()))
+            if not oldest_job.is_finished():
+                break
+            del self.jobs[oldest_id]
+    
+    def _run(self):
+        """Kuyruktaki işleri sırayla çalıştırır"""
+        while True:
+            job = self._queue.get()
+            with self._lock:
+                if job.status == MiningJob.CANCELLED:
+                    self._queue.task_done()
+                    continue
+                job.status = MiningJob.RUNNING
+                job.started_at = datetime.now().isoformat()
+            
+            deadline = time.time() + job.max_seconds if job.max_seconds else None
+            
+            try:
+                mined_block = self.blockchain.mine_pending_data(
+                    progress_callback=job.update_progress,
+                    cancel_token=job.cancel_token,
+                    deadline=deadline,
+                    max_hashes=job.max_hashes
+                )
+                if mined_block:
+                    job.block = mined_block.to_dict()
+                    job.status = MiningJob.COMPLETED
+                else:
+                    job.status = MiningJob.NO_DATA
+            except MiningCancelled as e:
+                job.cancel_reason = e.reason
+                job.status = MiningJob.CANCELLED
+            except Exception as e:
+                print(f"❌ Madencilik işi hatası ({job.job_id}): {e}")
+                job.error = str(e)
+                job.status = MiningJob.FAILED
+            finally:
+                job.finished_at = datetime.now().isoformat()
+                self._queue.task_done()
@@ -0,0 +1,308 @@
+# Sıkışık kayıt deposu - Zincirdeki tıbbi kayıtları sözlük listesi yerine sütunlarda tutar
+import sys
+import threading
+from array import array
+from collections import OrderedDict
+from collections.abc import Sequence
+from copy import deepcopy
+from itertools import accumulate, count
+
+# Bu uzunluğa kadarki metinler (hasta, cihaz, veri türü, AHI sınıfı) süreç genelinde
+# tek nesnede tutulur; daha uzun olanlar (data_id, zaman damgası) sütun başına tek metne paketlenir
+INTERN_MAX_LENGTH = 16
+
+# Tekil erişimde (indeks araması) sözlüğe çevrilip saklanan en fazla kayıt sayısı;
+# dolunca satırları ilk önbelleğe giren blokların satırları atılır
+ROW_CACHE_RECORDS = 16384
+
+# Sütun türleri
+CONSTANT = 0  # Tüm kayıtlarda aynı değer - bir kez saklanır
+FLOATS = 1  # array('d') - JSON'daki değerle birebir aynı
+INTS = 2  # array('q')
+PACKED = 3  # (birleştirilmiş metin, array('I') bitiş konumları)
+VALUES = 4  # tuple - karışık türler, kısa metinler (intern edilmiş)
+OBJECTS = 5  # tuple - liste/sözlük içeren sütun; her erişimde derin kopya döner
+
+# Sütunda paylaşılan nesne olarak döndürülemeyecek (değiştirilebilir) JSON türleri
+MUTABLE_TYPES = (list, dict)
+
+INT64_MIN = -2 ** 63
+INT64_MAX = 2 ** 63 - 1
+
+# Anahtar dizileri ve sütun türü dizileri tüm bloklarda ortak nesnelerdir
+_shared = {}
+
+# Önbellekteki satırlar (parti anahtarı -> sıra başına sözlük ya da None), eklenme sırasıyla.
+# Yalnızca üretilen sözlükler tutulur, partinin kendisi değil: blok önbelleğinden
+# çıkarılan gövdenin sütunları önbellekte satırı kalsa da serbest kalır
+_row_cache = OrderedDict()
+_row_cache_lock = threading.Lock()
+_row_cache_records = 0
+_row_cache_keys = count()
+
+
+def _share(value):
+    """Eşit tuple'ların süreç genelinde tek kopyasını döndürür"""
+    return _shared.setdefault(value, value)
+
+
+def _intern(value):
+    """Kısa metinleri intern eder, diğer değerleri aynen döndürür"""
+    if type(value) is str and len(value) <= INTERN_MAX_LENGTH:
+        return sys.intern(value)
+    return value
+
+
+def _encode_column(values):
+    """
+    Sütun değerleri için en sıkışık gösterimi seçer
+    
+    Args:
+        values: Sütun değerleri (liste, tuple ya da çözülmüş array('d')/array('q'))
+    
+    Returns:
+        tuple: (sütun türü, saklanan değer)
+    """
+    if isinstance(values, array):
+        if values.typecode == 'd':
+            return FLOATS, values
+        if values.count(values[0]) == len(values):
+            return CONSTANT, values[0]
+        return INTS, values
+    
+    first = values[0]
+    kind = type(first)
+    types = set(map(type, values))
+    if types == {kind}:
+        # -0.0 == 0.0 olduğundan ondalık sütunlar sabit sayılmaz (JSON'da işaret korunmalı)
+        if kind is float:
+            return FLOATS, array('d', values)
+        # Sabit sütun her kayda aynı nesneyi verir; yalnızca değiştirilemeyen değerler sabit olabilir
+        if kind in MUTABLE_TYPES:
+            return OBJECTS, tuple(values)
+        if values.count(first) == len(values):
+            return CONSTANT, _intern(first)
+        if kind is int and INT64_MIN <= min(values) and max(values) <= INT64_MAX:
+            return INTS, array('q', values)
+        if kind is str:
+            if max(map(len, values)) > INTERN_MAX_LENGTH:
+                return PACKED, (''.join(values), array('I', accumulate(map(len, values))))
+            return VALUES, tuple(map(sys.intern, values))
+    if any(mutable in types for mutable in MUTABLE_TYPES):
+        return OBJECTS, tuple(values)
+    return VALUES, tuple(map(_intern, values))
+
+
+class RecordBatch(Sequence):
+    """Aynı anahtarlara sahip kayıtların sütun düzeninde saklanması
+    
+    Bir bloktaki oksimetre kayıtları genellikle aynı anahtarları taşır;
+    sözlük başına anahtar tablosu ve her değer için ayrı nesne yerine her
+    anahtar bir sütun olarak tutulur: ondalık ve tamsayılar dizilerde, sabit
+    sütunlar tek değerde, kısa metinler intern edilmiş, uzun metinler tek
+    metinde. Kayıtlar erişildiğinde sözlüğe çevrilir; dönen sözlükler (ve
+    içlerindeki liste/sözlük değerleri) her seferinde yenidir, değiştirilmeleri
+    saklanan kayıtları etkilemez.
+    
+    İndeksle tekil erişimde üretilen sözlük süreç genelinde sınırlı bir
+    önbellekte (ROW_CACHE_RECORDS) tutulur; aynı kayda sonraki erişimler
+    yalnızca sözlüğü kopyalar. Önbellek partiye başvurmaz, parti bırakıldığında
+    sütunları önbellekteki satırlarından bağımsız olarak serbest kalır.
+    """
+    
+    __slots__ = ('_keys', '_kinds', '_columns', '_length', '_cache_key')
+    
+    def __init__(self, keys, kinds, columns, length):
+        """
+        Args:
+            keys (tuple): Kayıt anahtarları (sıralı)
+            kinds (tuple): Anahtar başına sütun türü
+            columns (tuple): Anahtar başına saklanan sütun
+            length (int): Kayıt sayısı
+        """
+        self._keys = keys
+        self._kinds = kinds
+        self._columns = columns
+        self._length = length
+        self._cache_key = None  # Satır önbelleğindeki anahtar (ilk tekil erişimde atanır)
+    
+    @classmethod
+    def from_records(cls, records):
+        """
+        Kayıt listesini sıkışık gösterime çevirir
+        
+        Args:
+            records: Blok verisi
+        
+        Returns:
+            RecordBatch veya records: Boş, sözlük listesi olmayan ya da farklı
+            anahtarlı kayıtlar içeren veri olduğu gibi döner
+        """
+        if isinstance(records, RecordBatch) or not isinstance(records, list) or not records:
+            return records
+        if not all(type(record) is dict for record in records):
+            return records
+        keys = tuple(records[0])
+        if not all(tuple(record) == keys for record in records):
+            return records
+        return cls.from_columns(keys, list(zip(*(record.values() for record in records))), len(records))
+    
+    @classmethod
+    def from_columns(cls, keys, columns, length):
+        """
+        Sütunlardan RecordBatch oluşturur - block_codec gövdeleri sözlük üretmeden çözülür
+        
+        Args:
+            keys (sequence): Kayıt anahtarları
+            columns (list): Anahtar başına değerler
+            length (int): Kayıt sayısı
+        
+        Returns:
+            RecordBatch veya list: Anahtarsız kayıtlarda boş sözlük listesi
+        """
+        if not keys:
+            return [{} for _ in range(length)]
+        kinds = []
+        stored = []
+        for values in columns:
+            kind, column = _encode_column(values)
+            kinds.append(kind)
+            stored.append(column)
+        return cls(_share(tuple(sys.intern(key) for key in keys)), _share(tuple(kinds)), tuple(stored), length)
+    
+    def __reduce__(self):
+        # Satır önbelleği anahtarı süreç içinde tekildir; süreçler arası kopyaya taşınmaz
+        return (RecordBatch, (self._keys, self._kinds, self._columns, self._length))
+    
+    def __len__(self):
+        return self._length
+    
+    def _column_values(self, position):
+        """Sütunun tüm değerlerini liste olarak döndürür"""
+        kind = self._kinds[position]
+        column = self._columns[position]
+        if kind == CONSTANT:
+            return [column] * self._length
+        if kind == PACKED:
+            text, ends = column
+            starts = [0]
+            starts.extend(ends[:-1])
+            return [text[start:end] for start, end in zip(starts, ends)]
+        if kind == OBJECTS:
+            return [deepcopy(value) for value in column]
+        return list(column)
+    
+    def _build_record(self, index):
+        """Sütunlardan tek kaydın sözlüğünü üretir"""
+        row = []
+        for kind, column in zip(self._kinds, self._columns):
+            if kind == CONSTANT:
+                row.append(column)
+            elif kind == PACKED:
+                text, ends = column
+                row.append(text[ends[index - 1] if index else 0:ends[index]])
+            else:
+                row.append(column[index])
+        return dict(zip(self._keys, row))
+    
+    def _cached_record(self, index):
+        """
+        Kaydın önbellekteki sözlüğünü döndürür, yoksa üretip önbelleğe ekler
+        
+        Returns:
+            dict: Saklanan sözlük - dışarı verilmeden önce kopyalanmalıdır
+        """
+        global _row_cache_records
+        rows = _row_cache.get(self._cache_key) if self._cache_key is not None else None
+        if rows is not None:
+            record = rows[index]
+            if record is not None:
+                return record
+        
+        record = self._build_record(index)
+        with _row_cache_lock:
+            if self._cache_key is None:
+                self._cache_key = next(_row_cache_keys)
+            rows = _row_cache.get(self._cache_key)
+            if rows is None:
+                rows = _row_cache[self._cache_key] = [None] * self._length
+            if rows[index] is None:
+                rows[index] = record
+                _row_cache_records += 1
+            else:
+                record = rows[index]
+            while _row_cache_records > ROW_CACHE_RECORDS:
+                _, evicted = _row_cache.popitem(last=False)
+                _row_cache_records -= sum(row is not None for row in evicted)
+        return record
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._length))]
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("Kayıt sırası aralık dışında")
+        record = self._cached_record(index)
+        if OBJECTS in self._kinds:
+            return deepcopy(record)
+        return record.copy()
+    
+    def __iter__(self):
+        keys = self._keys
+        columns = [self._column_values(position) for position in range(len(keys))]
+        for row in zip(*columns):
+            yield dict(zip(keys, row))
+    
+    def __eq__(self, other):
+        if not isinstance(other, (list, RecordBatch)):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+    
+    __hash__ = None
+    
+    def __repr__(self):
+        return f"RecordBatch({self._length} kayıt, anahtarlar={list(self._keys)})"
+    
+    def column(self, key):
+        """
+        Bir anahtarın tüm kayıtlardaki değerlerini sözlük üretmeden döndürür
+        
+        Args:
+            key (str): Kayıt anahtarı
+        
+        Returns:
+            list: Değerler (anahtar yoksa her kayıt için None)
+        """
+        try:
+            position = self._keys.index(key)
+        except ValueError:
+            return [None] * self._length
+        return self._column_values(position)
+    
+    def to_list(self):
+        """Kayıtları sözlük listesi olarak döndürür - API ve JSON sınırında"""
+        return list(self)
+
+
+def record_column(records, key):
+    """
+    Blok verisindeki kayıtların bir anahtarını döndürür (RecordBatch'te sözlük üretilmez)
+    
+    Args:
+        records: Blok verisi (RecordBatch veya sözlük listesi)
+        key (str): Kayıt anahtarı
+    
+    Returns:
+        list: Kayıt başına değer (anahtar yoksa None)
+    """
+    if isinstance(records, RecordBatch):
+        return records.column(key)
+    return [record.get(key) for record in records]
+
+
+def plain_records(records):
+    """RecordBatch'i JSON'a yazılabilir sözlük listesine çevirir, diğer verileri aynen döndürür"""
+    if isinstance(records, RecordBatch):
+        return records.to_list()
+    return records
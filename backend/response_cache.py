@@ -0,0 +1,97 @@
+# Okuma yanıtı önbelleği - Zincir ucu ve bekleyen havuz değişmedikçe yanıtlar yeniden üretilmez
+import hashlib
+import threading
+from collections import OrderedDict
+from config import Config
+
+
+class ResponseCache:
+    """Sürüm anahtarına bağlı yanıt önbelleği ve ETag üretimi
+    
+    Sürüm anahtarı Blockchain.read_version() çıktısıdır; yeni blok, bekleyen
+    veri veya ayar değişikliğinde değişir. Anahtar değiştiğinde saklanan tüm
+    yanıtlar düşer. Aynı anahtar altında biçim (yol, sorgu, çıktı türü)
+    başına bir gövde, en fazla `capacity` gövde tutulur. Boyutu zincirle
+    büyüyen yanıtlar (tam zincir, NDJSON, ikili) saklanmaz, yalnızca ETag alır.
+    """
+    
+    def __init__(self, capacity=Config.RESPONSE_CACHE_SIZE):
+        """
+        Args:
+            capacity (int): Önbellekteki en fazla yanıt gövdesi
+        """
+        self.capacity = max(1, capacity)
+        self._version = None
+        self._bodies = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.not_modified = 0
+    
+    @staticmethod
+    def etag(version, variant):
+        """
+        Sürüm anahtarı ve yanıt biçiminden ETag değeri üretir (tırnaksız)
+        
+        Args:
+            version (tuple): Blockchain.read_version() çıktısı
+            variant (str): Yanıt biçimi
+        
+        Returns:
+            str: 32 karakterlik hex özet
+        """
+        return hashlib.blake2b(repr((version, variant)).encode(), digest_size=16).hexdigest()
+    
+    def get(self, version, variant):
+        """
+        Saklanan yanıt gövdesini döndürür
+        
+        Args:
+            version (tuple): Güncel sürüm anahtarı
+            variant (str): Yanıt biçimi
+        
+        Returns:
+            bytes: Gövde veya None (yoksa ya da sürüm değiştiyse)
+        """
+        with self._lock:
+            body = self._bodies.get(variant) if version == self._version else None
+            if body is None:
+                self.misses += 1
+                return None
+            self._bodies.move_to_end(variant)
+            self.hits += 1
+            return body
+    
+    def put(self, version, variant, body):
+        """
+        Yanıt gövdesini sürüm anahtarıyla saklar
+        
+        Args:
+            version (tuple): Gövdenin üretildiği sürüm anahtarı
+            variant (str): Yanıt biçimi
+            body (bytes): Yanıt gövdesi
+        """
+        with self._lock:
+            if version != self._version:
+                self._version = version
+                self._bodies.clear()
+            self._bodies[variant] = body
+            self._bodies.move_to_end(variant)
+            while len(self._bodies) > self.capacity:
+                self._bodies.popitem(last=False)
+    
+    def clear(self):
+        """Saklanan tüm yanıtları atar"""
+        with self._lock:
+            self._version = None
+            self._bodies.clear()
+    
+    def stats(self):
+        """Önbellek doluluk ve isabet sayılarını döndürür"""
+        return {
+            'cached_responses': len(self._bodies),
+            'capacity': self.capacity,
+            'hits': self.hits,
+            'misses': self.misses,
+            'not_modified': self.not_modified
+        }
@@ -0,0 +1,66 @@
+# Test ortamı - backend modüllerini içe aktarılabilir yapar ve ortak zincir fixture'larını sağlar
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'backend'))
+
+from blockchain import Blockchain
+from database import DatabaseManager
+
+
+@pytest.fixture
+def database_uri(tmp_path):
+    """Teste özel geçici SQLite veritabanı adresi"""
+    return f"sqlite:///{tmp_path / 'chain.db'}"
+
+
+@pytest.fixture
+def make_blockchain():
+    """
+    Test zinciri üreten fonksiyon döndürür
+    
+    Varsayılanlar: veritabanı yok, PoW, retarget kapalı, açılış doğrulaması yok
+    ve hızlı madencilik için 4 bit zorluk. difficulty_bits=None verilirse
+    kayıtlı zincirin zorluğu değiştirilmez.
+    """
+    def make(database_uri=None, difficulty_bits=4, **options):
+        options = dict({'retarget': False, 'consensus': 'pow', 'boot_verification': 'none'}, **options)
+        database_manager = DatabaseManager(database_uri) if database_uri else None
+        blockchain = Blockchain(database_manager=database_manager, **options)
+        if difficulty_bits is not None:
+            blockchain.set_difficulty_bits(difficulty_bits)
+        return blockchain
+    return make
+
+
+@pytest.fixture
+def api(database_uri, monkeypatch):
+    """Geçici veritabanıyla API örneği (AuthService de aynı veritabanını kullanır)"""
+    monkeypatch.setattr(DatabaseManager.__init__, '__defaults__', (database_uri,))
+    from app import LightMedChainAPI
+    api = LightMedChainAPI()
+    api.blockchain.set_difficulty_bits(4)
+    return api
+
+
+@pytest.fixture
+def login():
+    """Test kullanıcısıyla giriş yapıp Authorization başlığını döndüren fonksiyon döndürür"""
+    def get_headers(client, username='admin'):
+        response = client.post('/api/auth/login', json={'username': username, 'password': '123456'})
+        return {'Authorization': f"Bearer {response.json['token']}"}
+    return get_headers
+
+
+@pytest.fixture
+def mine_blocks():
+    """Her kayıt listesini ayrı bir blokta madenciliği yapan fonksiyon döndürür"""
+    def mine(blockchain, *blocks):
+        for records in blocks:
+            for record in records:
+                blockchain.add_pending_data(record)
+            assert blockchain.mine_pending_data()
+        return blockchain
+    return mine
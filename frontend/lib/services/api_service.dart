@@ -93,6 +93,30 @@ class ApiService {
     }
   }
 
+  /// Zincirin bir bölümünü sayfalı getirir (next_from ile sonraki sayfa)
+  Future<Map<String, dynamic>> getChainPage({
+    int from = 0,
+    int limit = 100,
+    bool headersOnly = false,
+  }) async {
+    try {
+      final response = await client.get(
+        Uri.parse(
+            '$baseUrl/blockchain/chain?from=$from&limit=$limit&headers_only=$headersOnly'),
+        headers: _getHeaders(),
+      );
+
+      if (response.statusCode == 200) {
+        return json.decode(response.body);
+      } else {
+        throw Exception('Blockchain sayfası alınamadı: ${response.statusCode}');
+      }
+    } catch (e) {
+      _handleError(e);
+      rethrow;
+    }
+  }
+
   /// Yeni blok madenci
   Future<Map<String, dynamic>> mineBlock() async {
     try {
@@ -101,7 +125,7 @@ class ApiService {
         headers: _getHeaders(), // ← EKLENDİ
       );
 
-      if (response.statusCode == 200) {
+      if (response.statusCode == 200 || response.statusCode == 202) {
         return json.decode(response.body);
       } else {
         throw Exception('Madencilik başarısız: ${response.statusCode}');
@@ -104,6 +104,28 @@ Future<Map<String, dynamic>> login(String username, String password) async {
     }
   }
 
+  Future<Map<String, dynamic>> getChainPage({
+    int from = 0,
+    int limit = 100,
+    bool headersOnly = false,
+  }) async {
+    try {
+      final response = await http.get(
+        Uri.parse(
+            '$baseUrl/blockchain/chain?from=$from&limit=$limit&headers_only=$headersOnly'),
+        headers: _getHeaders(),
+      );
+
+      if (response.statusCode == 200) {
+        return json.decode(response.body);
+      } else {
+        throw Exception('Failed to get blockchain page: ${response.statusCode}');
+      }
+    } catch (e) {
+      throw Exception('API connection error: $e');
+    }
+  }
+
   Future<Map<String, dynamic>> mineBlock() async {
     try {
       final response = await http.post(
@@ -111,7 +133,7 @@ Future<Map<String, dynamic>> login(String username, String password) async {
         headers: _getHeaders(),
       );
 
-      if (response.statusCode == 200) {
+      if (response.statusCode == 200 || response.statusCode == 202) {
         return json.decode(response.body);
       } else {
         throw Exception('Mining failed: ${response.statusCode}');
@@ -0,0 +1,156 @@
+# İkili blok kodlayıcı testi - Kodlanıp çözülen bloklar alan alan ve kanonik JSON'da birebir aynıdır
+import json
+
+import pytest
+
+import block_codec
+from block import Block, GenesisBlock
+from record_batch import RecordBatch
+
+TIMESTAMP = "2024-01-01T23:00:00"
+
+
+def _block(index, data, **fields):
+    block = {
+        'version': 2,
+        'index': index,
+        'timestamp': TIMESTAMP,
+        'data': data,
+        'previous_hash': 'ab' * 32,
+        'hash': '0f' * 32,
+        'nonce': 123456,
+        'difficulty_bits': 12,
+        'mining_time': 0.25,
+        'signer': None,
+        'signature': None,
+        'merkle_root': 'cd' * 32
+    }
+    block.update(fields)
+    return block
+
+
+def _oximeter_records(count):
+    return [{
+        'data_id': f"ox_data_{i:06d}",
+        'patient_id': f"patient_{i % 4:03d}",
+        'data_type': 'OXIMETER',
+        'value': None,
+        'timestamp': f"2024-01-01T23:00:{i % 60:02d}",
+        'is_processed': False,
+        'spo2_value': 85.0 + i / 10,
+        'bpm_value': 60 + i,
+        'ahi_index': 'Mild'
+    } for i in range(count)]
+
+
+def _canonical(value):
+    return json.dumps(value, sort_keys=True)
+
+
+def _assert_round_trip(block):
+    decoded = block_codec.decode_block(block_codec.encode_block(block))
+    assert decoded == block
+    assert _canonical(decoded['data']) == _canonical(block['data'])
+    return decoded
+
+
+def test_genesis_uses_json_body():
+    """Genesis verisi sözlüktür; JSON gövdesiyle saklanır ve aynı hash'i verir"""
+    genesis = GenesisBlock()
+    block = genesis.to_dict()
+    del block['leading_zeros']
+    encoded = block_codec.encode_block(block)
+    assert block_codec.decode_header(encoded)['record_count'] == 0
+    decoded = _assert_round_trip(block)
+    assert Block(decoded['index'], decoded['timestamp'], decoded['data'], decoded['previous_hash'],
+                 nonce=decoded['nonce']).calculate_hash() == genesis.hash
+
+
+def test_json_body_record_count_matches_header_encoding():
+    """Kayıt listesi olmayan veride tam blok ve yalnızca başlık aynı kayıt sayısını yazar"""
+    for data in ({'note': 'sözlük', 'n': 2}, ['metin', 1], [{1: 'sayı anahtarı'}]):
+        block = _block(5, data, merkle_root=None, version=1)
+        from_block = block_codec.decode_header(block_codec.encode_block(block))['record_count']
+        from_header = block_codec.decode_header(block_codec.encode_header(block))['record_count']
+        assert from_block == from_header == len(data)
+    for data in ({'note': 'sözlük'}, 'metin'):
+        assert block_codec.decode_header(block_codec.encode_block(_block(0, data)))['record_count'] == 0
+
+
+def test_typed_columns_round_trip():
+    """Metin, ondalık, tamsayı, None ve bool sütunları ile özel değerler korunur"""
+    records = _oximeter_records(20)
+    records[3]['spo2_value'] = -0.0
+    records[4]['spo2_value'] = 1e-300
+    records[5]['patient_id'] = 'hasta_Ğüşıöç_😀'
+    _assert_round_trip(_block(1, records))
+    
+    decoded = block_codec.decode_block(block_codec.encode_block(_block(1, records)))
+    assert str(decoded['data'][3]['spo2_value']) == '-0.0'
+    assert type(decoded['data'][0]['bpm_value']) is int
+    assert type(decoded['data'][0]['spo2_value']) is float
+
+
+def test_mixed_columns_round_trip():
+    """Türü karışık, iç içe ya da int64 dışı değerli sütunlar JSON listesi olarak korunur"""
+    records = [
+        {'record_id': 'r1', 'value': 1, 'extra': {'a': [1, 2]}, 'big': 2 ** 70, 'flag': True},
+        {'record_id': 'r2', 'value': 1.5, 'extra': None, 'big': 5, 'flag': False},
+        {'record_id': 'r3', 'value': 'yüksek', 'extra': [1, 'x'], 'big': -2 ** 64, 'flag': None}
+    ]
+    _assert_round_trip(_block(2, records))
+
+
+def test_mixed_shapes_keep_record_order():
+    """Farklı anahtar dizili kayıtlar şemalara ayrılsa da blok içi sıra ve anahtar sırası korunur"""
+    records = [
+        {'record_id': 'r1', 'spo2': 91.0},
+        {'patient_id': 'p1', 'record_id': 'r2'},
+        {'spo2': 92.0, 'record_id': 'r3'},
+        {'record_id': 'r4', 'spo2': 93.0},
+        {},
+        {'patient_id': 'p2', 'record_id': 'r5'}
+    ]
+    decoded = _assert_round_trip(_block(3, records))
+    assert [list(record) for record in decoded['data']] == [list(record) for record in records]
+    
+    data = block_codec.decode_data(block_codec.encode_block(_block(3, records)), compact=True)
+    assert data == records and not isinstance(data, RecordBatch)
+
+
+def test_compact_decode_returns_record_batch():
+    """Tek şemalı gövde sözlük üretilmeden RecordBatch olarak çözülür"""
+    records = _oximeter_records(12)
+    data = block_codec.decode_data(block_codec.encode_block(_block(4, records)), compact=True)
+    assert isinstance(data, RecordBatch)
+    assert data == records
+    assert _canonical(data.to_list()) == _canonical(records)
+
+
+def test_optional_header_fields_round_trip():
+    """Eski bloklardaki boş alanlar ve PoA imza alanları korunur"""
+    _assert_round_trip(_block(6, [], version=1, merkle_root=None, difficulty_bits=None, mining_time=None))
+    _assert_round_trip(_block(7, _oximeter_records(2), signer='ee' * 32, signature='ff' * 64))
+
+
+def test_chain_export_round_trip():
+    """Zincir dışa aktarımı bloklar tek tek üretilse de tek seferlik kodlamayla aynıdır"""
+    genesis = GenesisBlock().to_dict()
+    del genesis['leading_zeros']
+    blocks = [genesis, _block(1, _oximeter_records(3)), _block(2, [{'record_id': 'r1'}])]
+    encoded = block_codec.encode_chain(blocks)
+    assert b''.join(block_codec.iter_encode_chain(iter(blocks), len(blocks))) == encoded
+    assert block_codec.decode_chain(encoded) == blocks
+    assert block_codec.decode_chain(block_codec.encode_chain([])) == []
+
+
+def test_invalid_input_is_rejected():
+    """Bozuk hash alanı kodlanmaz; tanınmayan byte'lar çözülmez"""
+    with pytest.raises(ValueError):
+        block_codec.encode_block(_block(1, [], hash='xyz'))
+    with pytest.raises(ValueError):
+        block_codec.encode_block(_block(1, [], nonce=-1))
+    with pytest.raises(ValueError):
+        block_codec.decode_block(b'{"index": 1}' + b'\x00' * 64)
+    with pytest.raises(ValueError):
+        block_codec.decode_chain(b'NOTACHAIN')
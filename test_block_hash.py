@@ -0,0 +1,73 @@
+# Blok hash uyumluluk testi - Midstate madenciliği ve önbellekli serileştirme eski hash formatını değiştirmez
+import hashlib
+import json
+
+from block import Block, GenesisBlock
+from mining import MidstateKernel, MiningEngine, block_hash_prefix
+
+TIMESTAMP = "2024-01-01T23:00:00"
+PREVIOUS_HASH = "ab" * 32
+
+PAYLOADS = [
+    [{'patient_id': 'patient_001', 'spo2_value': 94.5, 'bpm_value': 72.0, 'device_id': 'BT_OXIMETER_001'}],
+    [{'patient_id': 'patient_002', 'full_name': 'Ayşe Demir', 'value': None, 'is_processed': False,
+      'tags': ['gece', 'apne'], 'meta': {'z': 1, 'a': [1.0, -0.0]}}],
+    [{'record_id': f"rec_{i}", 'spo2': 90 + i % 10} for i in range(25)],
+    {'message': 'LightMedChain Genesis Block', 'version': '1.0'},
+    []
+]
+
+
+def _legacy_hash(index, timestamp, data, previous_hash, nonce):
+    """Değişiklik öncesi Block.calculate_hash formatı"""
+    block_string = f"{index}{timestamp}{json.dumps(data, sort_keys=True)}{previous_hash}{nonce}"
+    return hashlib.sha256(block_string.encode()).hexdigest()
+
+
+def test_calculate_hash_matches_legacy_format():
+    """Sürüm 1 bloklarda hash, verinin sort_keys JSON'u ile eski formatta hesaplanır"""
+    for index, data in enumerate(PAYLOADS, start=1):
+        for nonce in (0, 7, 123456789):
+            block = Block(index, TIMESTAMP, json.loads(json.dumps(data)), PREVIOUS_HASH, nonce=nonce)
+            assert block.calculate_hash() == _legacy_hash(index, TIMESTAMP, data, PREVIOUS_HASH, nonce)
+
+
+def test_midstate_kernel_matches_legacy_format():
+    """Prefix bir kez hash'lense de her nonce için digest eski formatla aynıdır"""
+    for data in PAYLOADS:
+        assert block_hash_prefix(3, TIMESTAMP, data, PREVIOUS_HASH) == \
+            f"3{TIMESTAMP}{json.dumps(data, sort_keys=True)}{PREVIOUS_HASH}".encode()
+        kernel = MidstateKernel.for_block(3, TIMESTAMP, data, PREVIOUS_HASH, 0)
+        for nonce in (0, 1, 10, 99999):
+            assert kernel.hash_nonce(nonce).hex() == _legacy_hash(3, TIMESTAMP, data, PREVIOUS_HASH, nonce)
+
+
+def test_mined_block_hash_matches_legacy_format():
+    """Madencilik sonucu, bulunan nonce ile eski formatta hesaplanan hash'tir"""
+    engine = MiningEngine(workers=1, difficulty_bits=8, metrics=None)
+    data = PAYLOADS[0]
+    result = engine.mine_block(1, TIMESTAMP, data, PREVIOUS_HASH)
+    assert result['hash'] == _legacy_hash(1, TIMESTAMP, data, PREVIOUS_HASH, result['nonce'])
+    assert int(result['hash'][:2], 16) == 0
+    
+    block = Block(1, TIMESTAMP, data, PREVIOUS_HASH, nonce=result['nonce'], hash_value=result['hash'])
+    assert block.calculate_hash() == result['hash']
+    assert block.is_valid(difficulty_bits=8)
+
+
+def test_hash_survives_compaction_and_cached_serialization():
+    """Kayıtlar sütunlara çevrilip kanonik byte'lar önbelleğe alındıktan sonra hash değişmez"""
+    data = PAYLOADS[2]
+    block = Block(2, TIMESTAMP, json.loads(json.dumps(data)), PREVIOUS_HASH, nonce=42)
+    expected = _legacy_hash(2, TIMESTAMP, data, PREVIOUS_HASH, 42)
+    block.canonical_data()
+    block.compact_data()
+    assert block.calculate_hash() == expected
+    block.clear_serialized()
+    assert block.calculate_hash() == expected
+
+
+def test_genesis_hash_matches_legacy_format():
+    """Genesis bloğu da eski formatla hesaplanır"""
+    genesis = GenesisBlock()
+    assert genesis.hash == _legacy_hash(0, genesis.timestamp, genesis.data, genesis.previous_hash, genesis.nonce)
@@ -0,0 +1,67 @@
+# Kanonik byte önbelleği testi - Kazılmış bloklar serileştirmeyi bir kez yapar; deep doğrulama kayıtları yeniden serileştirir
+from mining import canonical_json
+from record_batch import RecordBatch
+
+
+def _records(height):
+    return [{'record_id': f"r{height}_{i}", 'patient_id': 'patient_001', 'spo2': 90 + i} for i in range(3)]
+
+
+def _chain(make_blockchain, mine_blocks, blocks=3):
+    return mine_blocks(make_blockchain(), *(_records(height) for height in range(1, blocks + 1)))
+
+
+def _tamper(block):
+    """Bellekteki kayıtları data setter'ını atlayarak değiştirir (saklanan byte'lar kalır)"""
+    records = block.data.to_list()
+    records[0]['spo2'] = 50
+    block._data = RecordBatch.from_records(records)
+
+
+def test_serialization_is_computed_once(make_blockchain, mine_blocks):
+    """Kanonik ve API byte'ları tekrar üretilmez; saklanan değer kayıtların serileştirmesiyle aynıdır"""
+    block = _chain(make_blockchain, mine_blocks, blocks=1).chain[1]
+    canonical = block.canonical_data()
+    assert canonical == tuple(canonical_json(record) for record in _records(1))
+    assert block.canonical_data() is canonical
+    assert block.api_json() is block.api_json()
+    
+    block.clear_serialized()
+    assert block.canonical_data() == canonical and block.canonical_data() is not canonical
+    assert block.is_valid()
+
+
+def test_data_setter_drops_cached_bytes(make_blockchain, mine_blocks):
+    """Kayıtlar setter ile değiştirilince saklanan byte'lar atılır ve blok geçersizleşir"""
+    blockchain = _chain(make_blockchain, mine_blocks)
+    block = blockchain.chain[2]
+    api_json = block.api_json()
+    
+    block.data = _records(9)
+    assert block.api_json() != api_json
+    assert not block.is_valid()
+    assert blockchain.verify_chain(full=True)['first_invalid_index'] == 2
+
+
+def test_deep_verification_sees_in_memory_changes(make_blockchain, mine_blocks):
+    """Saklanan byte'larla yapılan tam doğrulama bellekteki değişikliği görmez; deep doğrulama görür"""
+    blockchain = _chain(make_blockchain, mine_blocks)
+    _tamper(blockchain.chain[2])
+    
+    assert blockchain.verify_chain(full=True)['valid']
+    report = blockchain.verify_chain(full=True, deep=True)
+    assert not report['valid'] and report['first_invalid_index'] == 2
+    assert blockchain.validated_height == 1
+    
+    # Byte'lar atıldıktan sonra normal tam doğrulama da değişikliği görür
+    assert not blockchain.verify_chain(full=True)['valid']
+
+
+def test_parallel_deep_verification(make_blockchain, mine_blocks):
+    """Süreç havuzundaki deep doğrulama da saklanan byte'ları kullanmaz"""
+    blockchain = _chain(make_blockchain, mine_blocks, blocks=4)
+    _tamper(blockchain.chain[3])
+    
+    assert blockchain.verify_chain(full=True, workers=2)['valid']
+    report = blockchain.verify_chain(full=True, workers=2, deep=True)
+    assert not report['valid'] and report['first_invalid_index'] == 3
@@ -0,0 +1,75 @@
+# Zincir akışı testi - NDJSON ve ikili dışa aktarım blokları eksiksiz akıtır; from/limit/headers_only uygulanır
+import json
+
+import pytest
+
+from block_codec import decode_chain
+
+
+@pytest.fixture
+def client(api, mine_blocks):
+    mine_blocks(api.blockchain, *([{'record_id': f"r{height}_{i}", 'patient_id': 'patient_001', 'spo2': 90 + i}
+                                   for i in range(2)] for height in range(1, 5)))
+    return api.app.test_client()
+
+
+def _ndjson(response):
+    assert response.status_code == 200 and response.mimetype == 'application/x-ndjson'
+    assert not response.data or response.data.endswith(b'\n')
+    return [json.loads(line) for line in response.data.splitlines()]
+
+
+def _exported(block):
+    """İkili formatta saklanmayan türetilmiş leading_zeros alanı olmadan blok sözlüğü"""
+    block = block.to_dict()
+    del block['leading_zeros']
+    return block
+
+
+def test_ndjson_streams_blocks(api, client):
+    """Her satır bir bloğun API JSON'udur; format parametresi ve Accept başlığı aynı akışı verir"""
+    chain = api.blockchain.chain
+    response = client.get('/api/blockchain/chain?format=ndjson')
+    assert _ndjson(response) == [block.to_dict() for block in chain]
+    assert response.headers['X-Chain-Height'] == str(len(chain))
+    assert response.data == b''.join(block.api_json() + b'\n' for block in chain)
+    
+    accepted = client.get('/api/blockchain/chain', headers={'Accept': 'application/x-ndjson'})
+    assert accepted.data == response.data
+
+
+def test_ndjson_range_and_headers(api, client):
+    """from/limit yükseklik aralığını seçer; headers_only kayıt gövdelerini çıkarır"""
+    chain = api.blockchain.chain
+    page = _ndjson(client.get('/api/blockchain/chain?format=ndjson&from=2&limit=2'))
+    assert [block['index'] for block in page] == [2, 3]
+    assert page[0]['data'] == chain[2].to_dict()['data']
+    
+    headers = _ndjson(client.get('/api/blockchain/chain?format=ndjson&from=3&headers_only=true'))
+    assert headers == [chain[3].header(), chain[4].header()]
+    assert all('data' not in header and header['record_count'] == 2 for header in headers)
+    
+    assert _ndjson(client.get('/api/blockchain/chain?format=ndjson&from=10')) == []
+
+
+def test_binary_export_decodes(api, client):
+    """İkili akış decode_chain ile bloklara çözülür; aralık ve zincir başlıkları uygulanır"""
+    chain = api.blockchain.chain
+    response = client.get('/api/blockchain/chain', headers={'Accept': 'application/octet-stream'})
+    assert response.status_code == 200 and response.mimetype == 'application/octet-stream'
+    assert decode_chain(response.data) == [_exported(block) for block in chain]
+    assert response.headers['X-Chain-Height'] == str(len(chain))
+    assert response.headers['X-Hash-Algorithm'] == api.blockchain.hash_algorithm
+    assert response.headers['X-Difficulty-Bits'] == str(api.blockchain.difficulty_bits)
+    
+    page = client.get('/api/blockchain/chain?format=binary&from=1&limit=2')
+    assert [block['index'] for block in decode_chain(page.data)] == [1, 2]
+    assert decode_chain(client.get('/api/blockchain/chain?format=binary&from=10').data) == []
+
+
+@pytest.mark.parametrize('query', ['from=-1', 'limit=0', 'limit=-5'])
+@pytest.mark.parametrize('output', ['ndjson', 'binary'])
+def test_invalid_range_is_rejected(client, output, query):
+    """Negatif from ve pozitif olmayan limit 400 döner"""
+    response = client.get(f"/api/blockchain/chain?format={output}&{query}")
+    assert response.status_code == 400 and 'error' in response.json
@@ -0,0 +1,63 @@
+# Paralel doğrulama testi - Süreç havuzundaki doğrulama seri doğrulamayla aynı sonucu verir
+import os
+
+from chain_verifier import ParallelChainVerifier
+
+
+def _records(height):
+    return [{'record_id': f"r{height}_{i}", 'patient_id': 'patient_001', 'spo2': 90 + i} for i in range(3)]
+
+
+def _chain(make_blockchain, mine_blocks, blocks=8):
+    return mine_blocks(make_blockchain(), *(_records(height) for height in range(1, blocks + 1)))
+
+
+def test_parallel_matches_serial(make_blockchain, mine_blocks):
+    """Geçerli ve bozuk zincirde paralel ve seri doğrulama aynı bloğu ve kayıt sayısını bildirir"""
+    blockchain = _chain(make_blockchain, mine_blocks)
+    parallel = blockchain.verify_chain(full=True, workers=2)
+    serial = blockchain.verify_chain(full=True, workers=1)
+    assert parallel['valid'] and serial['valid']
+    assert parallel['verified_records'] == 24
+    
+    blockchain.chain[5].nonce += 1
+    parallel = blockchain.verify_chain(full=True, workers=2)
+    assert not parallel['valid'] and parallel['first_invalid_index'] == 5
+    assert parallel['verified_records'] == 12 and parallel['validated_height'] == 4
+    assert blockchain.verify_chain(full=True, workers=1)['first_invalid_index'] == 5
+
+
+def test_broken_link_is_reported(make_blockchain, mine_blocks):
+    """Hash'i geçerli ama önceki bloğa bağlanmayan blok bağlantı hatasıyla reddedilir"""
+    blockchain = _chain(make_blockchain, mine_blocks, blocks=4)
+    blockchain.chain[3] = blockchain.chain[2]
+    report = blockchain.verify_chain(full=True, workers=2)
+    assert not report['valid'] and report['first_invalid_index'] == 3
+    assert report['error'] == "önceki hash uyuşmuyor"
+
+
+def test_worker_count_is_bounded():
+    """Süreç sayısı 1 ile çekirdek sayısı arasına sınırlanır; aralıklar zinciri eksiksiz kapsar"""
+    assert ParallelChainVerifier(0).workers == 1
+    assert ParallelChainVerifier(5000).workers == (os.cpu_count() or 1)
+    
+    verifier = ParallelChainVerifier(2)
+    for length in (1, 2, 9, 100):
+        ranges = verifier.split_ranges(length)
+        covered = [height for start, stop in ranges for height in range(start, stop)]
+        assert covered == list(range(1, length))
+
+
+def test_verify_endpoint_validates_workers(api, login):
+    """Doğrulama uç noktası pozitif olmayan süreç sayısını reddeder, fazlasını çekirdek sayısına indirir"""
+    client = api.app.test_client()
+    headers = login(client)
+    assert client.post('/api/blockchain/verify?workers=0', headers=headers).status_code == 400
+    assert client.post('/api/blockchain/verify?workers=-3', headers=headers).status_code == 400
+    assert client.post('/api/blockchain/verify?mode=other', headers=headers).status_code == 400
+    
+    response = client.post('/api/blockchain/verify?workers=5000', headers=headers)
+    assert response.status_code == 200 and response.json['valid']
+    assert response.json.get('workers', 1) <= (os.cpu_count() or 1)
+    
+    assert client.post('/api/blockchain/verify', headers=login(client, 'doktor')).status_code == 403
@@ -0,0 +1,103 @@
+# Kontrol noktası testi - Kümülatif özet, imza ve açılışta kontrol noktasından doğrulama
+import hashlib
+import sqlite3
+
+from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
+
+from checkpoints import EMPTY_DIGEST, chain_digest, create_checkpoint, verify_checkpoint
+from consensus import AuthoritySet, AuthoritySigner
+
+
+def _mine(blockchain, blocks):
+    for number in range(blocks):
+        blockchain.add_pending_data({'record_id': f"r{len(blockchain.chain)}_{number}", 'spo2': 90 + number})
+        blockchain.mine_pending_data()
+
+
+def test_digest_is_hash_fold_of_block_hashes(make_blockchain):
+    """Özet D_h = H(D_{h-1} || hash_h) ile genesis'ten itibaren katlanır"""
+    blockchain = make_blockchain()
+    _mine(blockchain, 4)
+    digest = bytes.fromhex(EMPTY_DIGEST)
+    for block in blockchain.chain:
+        digest = hashlib.sha256(digest + bytes.fromhex(block.hash)).digest()
+    assert chain_digest(blockchain.chain, 4, 'sha256') == digest.hex()
+    
+    checkpoint = create_checkpoint(blockchain.chain, 4, 'sha256')
+    assert checkpoint['digest'] == digest.hex() and checkpoint['tip_hash'] == blockchain.chain[4].hash
+    assert verify_checkpoint(checkpoint, blockchain.chain, 'sha256', AuthoritySet()) is None
+
+
+def test_digest_continues_from_previous_checkpoint(make_blockchain):
+    """Önceki kontrol noktasından devam eden özet genesis'ten hesaplananla aynıdır"""
+    blockchain = make_blockchain()
+    _mine(blockchain, 6)
+    previous = create_checkpoint(blockchain.chain, 3, 'sha256')
+    assert create_checkpoint(blockchain.chain, 6, 'sha256', previous=previous)['digest'] == \
+        chain_digest(blockchain.chain, 6, 'sha256')
+    
+    # Zincirle uyuşmayan önceki kontrol noktası kullanılmaz
+    stale = dict(previous, tip_hash='00' * 32, digest='11' * 32)
+    assert create_checkpoint(blockchain.chain, 6, 'sha256', previous=stale)['digest'] == \
+        chain_digest(blockchain.chain, 6, 'sha256')
+
+
+def test_mismatching_checkpoints_are_rejected(make_blockchain):
+    """Uç hash'i, özet ya da previous_hash bağlantısı uyuşmayan kontrol noktası reddedilir"""
+    blockchain = make_blockchain()
+    _mine(blockchain, 4)
+    checkpoint = create_checkpoint(blockchain.chain, 3, 'sha256')
+    authorities = AuthoritySet()
+    
+    assert verify_checkpoint(dict(checkpoint, digest='22' * 32), blockchain.chain, 'sha256', authorities) == \
+        "kümülatif özet uyuşmuyor"
+    assert verify_checkpoint(dict(checkpoint, tip_hash='33' * 32), blockchain.chain, 'sha256', authorities) == \
+        "uç hash'i zincirle uyuşmuyor"
+    assert verify_checkpoint(dict(checkpoint, height=10), blockchain.chain, 'sha256', authorities) == \
+        "uç hash'i zincirle uyuşmuyor"
+    assert verify_checkpoint(checkpoint, blockchain.chain, 'blake2b', authorities) == "kümülatif özet uyuşmuyor"
+    
+    blockchain.chain[2].previous_hash = '44' * 32
+    assert verify_checkpoint(checkpoint, blockchain.chain, 'sha256', authorities) == "blok #2 önceki hash uyuşmuyor"
+
+
+def test_signed_checkpoints(make_blockchain):
+    """İmza yalnızca yetkili anahtarla ve değiştirilmemiş özetle geçerlidir"""
+    blockchain = make_blockchain()
+    _mine(blockchain, 3)
+    signer = AuthoritySigner(Ed25519PrivateKey.generate())
+    outsider = AuthoritySigner(Ed25519PrivateKey.generate())
+    authorities = AuthoritySet([signer.signer_id])
+    
+    checkpoint = create_checkpoint(blockchain.chain, 3, 'sha256', signer=signer)
+    assert verify_checkpoint(checkpoint, blockchain.chain, 'sha256', authorities, require_signature=True) is None
+    
+    forged = create_checkpoint(blockchain.chain, 3, 'sha256', signer=outsider)
+    assert verify_checkpoint(forged, blockchain.chain, 'sha256', authorities) == "geçersiz ya da yetkisiz imza"
+    
+    # Özet değiştirilirse imza tutmaz (özet kontrolünden önce yakalanır)
+    tampered = dict(checkpoint, digest='55' * 32)
+    assert verify_checkpoint(tampered, blockchain.chain, 'sha256', authorities) == "geçersiz ya da yetkisiz imza"
+    
+    unsigned = create_checkpoint(blockchain.chain, 3, 'sha256')
+    assert verify_checkpoint(unsigned, blockchain.chain, 'sha256', authorities) is None
+    assert verify_checkpoint(unsigned, blockchain.chain, 'sha256', authorities, require_signature=True) == "imzasız"
+
+
+def test_boot_verifies_only_blocks_after_checkpoint(make_blockchain, database_uri, tmp_path):
+    """Açılışta kontrol noktasına kadarki bloklar yeniden hash'lenmez; bozuk kontrol noktası kullanılmaz"""
+    blockchain = make_blockchain(database_uri)
+    _mine(blockchain, 3)
+    checkpoint = blockchain.create_checkpoint()
+    assert checkpoint['height'] == 3
+    _mine(blockchain, 2)
+    
+    report = make_blockchain(database_uri, None, boot_verification='checkpoint').boot_verification
+    assert report['checkpoint_height'] == 3
+    assert report['valid'] and report['checked_blocks'] == 2 and report['validated_height'] == 5
+    
+    with sqlite3.connect(str(tmp_path / 'chain.db')) as conn:
+        conn.execute('UPDATE checkpoints SET digest = ?', ('66' * 32,))
+    report = make_blockchain(database_uri, None, boot_verification='checkpoint').boot_verification
+    assert report['checkpoint_height'] is None
+    assert report['valid'] and report['checked_blocks'] == 5
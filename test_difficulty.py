@@ -0,0 +1,74 @@
+# Zorluk takvimi testi - Retarget adımı ve sınırları korunur; takvimin altındaki blok doğrulamada reddedilir
+from block import Block
+from chain_verifier import check_difficulty_schedule
+from config import Config
+from mining import retarget_bits
+
+
+def _header(index, difficulty_bits, mining_time, signature=None):
+    return Block(index, f"2024-01-01T10:00:{index:02d}", [], '0' * 64, hash_value='0' * 64,
+                 difficulty_bits=difficulty_bits, mining_time=mining_time, signature=signature)
+
+
+def _window(difficulty_bits, mining_time, blocks=Config.RETARGET_WINDOW):
+    """Genesis ve aynı zorluk/sürede kazılmış bloklardan oluşan başlık listesi"""
+    return [_header(0, None, None)] + [_header(index, difficulty_bits, mining_time)
+                                       for index in range(1, blocks + 1)]
+
+
+def test_retarget_steps_towards_target_time():
+    """Hedef süreyi tutan pencere zorluğu korur; hızlı ve yavaş pencereler en fazla bir adım kayar"""
+    step = Config.RETARGET_MAX_STEP_BITS
+    assert retarget_bits(_window(12, Config.TARGET_BLOCK_TIME), 12) == 12
+    assert retarget_bits(_window(12, Config.TARGET_BLOCK_TIME / 2), 12) == 13
+    assert retarget_bits(_window(12, Config.TARGET_BLOCK_TIME / 1024), 12) == 12 + step
+    assert retarget_bits(_window(12, Config.TARGET_BLOCK_TIME * 1024), 12) == 12 - step
+
+
+def test_retarget_is_clamped_to_difficulty_limits():
+    """Sonuç MIN_DIFFICULTY_BITS ile MAX_DIFFICULTY_BITS arasında kalır"""
+    top = Config.MAX_DIFFICULTY_BITS
+    bottom = Config.MIN_DIFFICULTY_BITS
+    assert retarget_bits(_window(top - 1, Config.TARGET_BLOCK_TIME / 1024), top - 1) == top
+    assert retarget_bits(_window(bottom + 1, Config.TARGET_BLOCK_TIME * 1024), bottom + 1) == bottom
+
+
+def test_retarget_needs_a_full_window():
+    """Pencerede yeterli kazılmış blok yoksa takvim yoktur; genesis ve süresiz bloklar sayılmaz"""
+    assert retarget_bits(_window(8, 0.001, blocks=Config.RETARGET_WINDOW - 1), 8) is None
+    
+    chain = _window(8, 0.001)
+    chain[-1].mining_time = None
+    assert retarget_bits(chain, 8) is None
+    assert retarget_bits(_window(8, 0.001), None) is None
+
+
+def test_schedule_rejects_blocks_below_it():
+    """Takvimin altındaki zorlukla kazılan blok reddedilir; imzalı bloklar ve ilk iki yükseklik atlanır"""
+    chain = _window(8, Config.TARGET_BLOCK_TIME / 1024)
+    height = len(chain)
+    scheduled = retarget_bits(chain, 8)
+    
+    chain.append(_header(height, 8, 0.001))
+    assert check_difficulty_schedule(chain, height) == f"zorluğu retarget takviminin altında (8 < {scheduled} bit)"
+    chain[height].difficulty_bits = None
+    assert check_difficulty_schedule(chain, height) is not None
+    chain[height].difficulty_bits = scheduled
+    assert check_difficulty_schedule(chain, height) is None
+    
+    chain[height] = _header(height, None, None, signature='00')
+    assert check_difficulty_schedule(chain, height) is None
+    assert check_difficulty_schedule(chain, 1) is None
+
+
+def test_mined_chain_follows_schedule(make_blockchain, mine_blocks):
+    """Retarget açık zincirde zorluk takvime göre artar ve elle takvimin altına indirilemez"""
+    blockchain = make_blockchain(retarget=True)
+    mine_blocks(blockchain, *([{'record_id': f"r{height}", 'patient_id': 'patient_001'}]
+                              for height in range(Config.RETARGET_WINDOW)))
+    
+    scheduled = blockchain.scheduled_difficulty_bits()
+    assert scheduled > 4 and blockchain.difficulty_bits == scheduled
+    assert blockchain.set_difficulty_bits(Config.MIN_DIFFICULTY_BITS) == scheduled
+    assert blockchain.verify_chain(full=True)['valid']
+    assert make_blockchain().scheduled_difficulty_bits() is None
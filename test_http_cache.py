@@ -0,0 +1,75 @@
+# HTTP önbellek testi - Okuma uç noktaları ETag verir, değişmeyen zincirde 304 döner ve değişiklikte yenilenir
+def _add_record(client, headers, spo2=92):
+    response = client.post('/api/medical-data/record', headers=headers,
+                           json={'patient_id': 'patient_001', 'spo2_value': spo2, 'bpm_value': 70})
+    assert response.status_code == 200
+
+
+def test_status_revalidates_with_etag(api):
+    """Aynı durumda If-None-Match ile gövdesiz 304 döner; zayıf ETag da eşleşir"""
+    client = api.app.test_client()
+    first = client.get('/api/blockchain/status')
+    assert first.status_code == 200 and first.headers['Cache-Control'] == 'no-cache'
+    etag = first.headers['ETag']
+    
+    cached = client.get('/api/blockchain/status', headers={'If-None-Match': etag})
+    assert cached.status_code == 304 and cached.data == b''
+    assert cached.headers['ETag'] == etag
+    assert client.get('/api/blockchain/status', headers={'If-None-Match': f"W/{etag}"}).status_code == 304
+    assert client.get('/api/blockchain/status', headers={'If-None-Match': '"eski"'}).status_code == 200
+    assert api.response_cache.not_modified == 2
+    
+    # Aynı sürümde gövde yeniden üretilmez
+    hits = api.response_cache.hits
+    assert client.get('/api/blockchain/status').data == first.data
+    assert api.response_cache.hits == hits + 1
+
+
+def test_pending_and_mined_data_change_etag(api, login):
+    """Bekleyen kayıt ve yeni blok eski ETag'i geçersiz kılar; güncel gövde döner"""
+    client = api.app.test_client()
+    headers = login(client)
+    first = client.get('/api/blockchain/status')
+    
+    _add_record(client, headers)
+    pending = client.get('/api/blockchain/status', headers={'If-None-Match': first.headers['ETag']})
+    assert pending.status_code == 200 and pending.headers['ETag'] != first.headers['ETag']
+    assert pending.json['pending_transactions'] == first.json['pending_transactions'] + 1
+    
+    api.blockchain.mine_pending_data()
+    mined = client.get('/api/blockchain/status', headers={'If-None-Match': pending.headers['ETag']})
+    assert mined.status_code == 200 and mined.headers['ETag'] not in (first.headers['ETag'], pending.headers['ETag'])
+    assert mined.json['total_blocks'] == first.json['total_blocks'] + 1
+    assert client.get('/api/blockchain/status', headers={'If-None-Match': mined.headers['ETag']}).status_code == 304
+
+
+def test_chain_formats_have_separate_etags(api, login):
+    """Aynı zincirin JSON, sayfa, NDJSON ve ikili biçimleri ayrı ETag alır ve her biri 304 ile doğrulanır"""
+    client = api.app.test_client()
+    _add_record(client, login(client))
+    api.blockchain.mine_pending_data()
+    
+    requests = [
+        ('/api/blockchain/chain', {}),
+        ('/api/blockchain/chain?from=0&limit=1', {}),
+        ('/api/blockchain/chain?from=1&limit=1', {}),
+        ('/api/blockchain/chain?format=ndjson', {}),
+        ('/api/blockchain/chain', {'Accept': 'application/x-ndjson'}),
+        ('/api/blockchain/chain', {'Accept': 'application/octet-stream'})
+    ]
+    etags = []
+    for url, headers in requests:
+        response = client.get(url, headers=headers)
+        assert response.status_code == 200 and response.data
+        assert 'Accept' in response.headers['Vary']
+        etags.append(response.headers['ETag'])
+        
+        cached = client.get(url, headers=dict(headers, **{'If-None-Match': response.headers['ETag']}))
+        assert cached.status_code == 304 and cached.data == b''
+    assert len(set(etags)) == len(etags)
+    
+    # Yeni blok tüm biçimlerin ETag'ini değiştirir
+    _add_record(client, login(client), spo2=95)
+    api.blockchain.mine_pending_data()
+    for (url, headers), etag in zip(requests, etags):
+        assert client.get(url, headers=dict(headers, **{'If-None-Match': etag})).status_code == 200
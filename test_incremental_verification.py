@@ -0,0 +1,62 @@
+# Artımlı doğrulama testi - Doğrulama işareti yalnızca yeni blokları kontrol eder; değişen uç baştan doğrulatır
+def _records(height):
+    return [{'record_id': f"r{height}", 'patient_id': 'patient_001', 'spo2': 95}]
+
+
+def _mine(mine_blocks, blockchain, heights):
+    return mine_blocks(blockchain, *(_records(height) for height in heights))
+
+
+def test_only_new_blocks_are_checked(make_blockchain, mine_blocks):
+    """İşaret doğrulanan uca ilerler; sonraki çağrı yalnızca yeni blokları kontrol eder"""
+    blockchain = _mine(mine_blocks, make_blockchain(), range(1, 4))
+    assert blockchain.validated_height == 0
+    
+    report = blockchain.verify_chain()
+    assert report['valid'] and report['checked_blocks'] == 3
+    assert blockchain.validated_height == 3 and blockchain.validated_hash == blockchain.chain[3].hash
+    assert blockchain.verify_chain()['checked_blocks'] == 0
+    
+    _mine(mine_blocks, blockchain, range(4, 6))
+    report = blockchain.verify_chain()
+    assert report['valid'] and report['checked_blocks'] == 2 and report['verified_records'] == 2
+    assert blockchain.validated_height == 5
+    assert blockchain.verify_chain(full=True)['checked_blocks'] == 5
+
+
+def test_tampering_below_watermark_needs_full_check(make_blockchain, mine_blocks):
+    """İşaretin altındaki değişiklik artımlı doğrulamada görülmez; tam doğrulama bulur ve işareti geri çeker"""
+    blockchain = _mine(mine_blocks, make_blockchain(), range(1, 5))
+    assert blockchain.is_chain_valid()
+    
+    blockchain.chain[2].nonce += 1
+    assert blockchain.is_chain_valid()
+    assert blockchain.validated_height == 4
+    
+    report = blockchain.verify_chain(full=True)
+    assert not report['valid'] and report['first_invalid_index'] == 2
+    assert blockchain.validated_height == 1 and blockchain.validated_hash == blockchain.chain[1].hash
+    assert not blockchain.is_chain_valid()
+
+
+def test_tampering_above_watermark_is_found(make_blockchain, mine_blocks):
+    """İşaretten sonra eklenen bozuk blok artımlı doğrulamada reddedilir; işaret ilerlemez"""
+    blockchain = _mine(mine_blocks, make_blockchain(), range(1, 3))
+    assert blockchain.is_chain_valid()
+    
+    _mine(mine_blocks, blockchain, range(3, 5))
+    blockchain.chain[4].nonce += 1
+    report = blockchain.verify_chain()
+    assert not report['valid'] and report['first_invalid_index'] == 4
+    assert report['checked_blocks'] == 2 and blockchain.validated_height == 3
+
+
+def test_replaced_tip_restarts_validation(make_blockchain, mine_blocks):
+    """İşaretteki bloğun hash'i değiştiyse doğrulama genesis'ten yeniden yapılır"""
+    blockchain = _mine(mine_blocks, make_blockchain(), range(1, 4))
+    assert blockchain.is_chain_valid()
+    
+    blockchain.chain[3].hash = blockchain.chain[3].calculate_hash()[::-1]
+    report = blockchain.verify_chain()
+    assert not report['valid'] and report['first_invalid_index'] == 3
+    assert report['checked_blocks'] == 3 and blockchain.validated_height == 2
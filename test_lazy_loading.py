@@ -0,0 +1,63 @@
+# Tembel zincir yükleme testi - Açılışta yalnızca başlıklar okunur; kayıtlar ve hasta indeksi ihtiyaçta gelir
+import sqlite3
+
+
+def _record(patient_id, data_id):
+    return {'data_id': data_id, 'patient_id': patient_id, 'spo2_value': 95.0, 'timestamp': '2024-01-01T23:00:00'}
+
+
+def _patient_hits(blockchain, patient_id):
+    return [(result['block_index'], result['medical_data']['data_id'])
+            for result in blockchain.search_medical_data(patient_id=patient_id)]
+
+
+def test_restart_loads_headers_then_bodies(make_blockchain, mine_blocks, database_uri):
+    """Yeniden açılan zincir aynı hash'lere sahiptir; kayıtlar ilk erişimde veritabanından okunur"""
+    blockchain = mine_blocks(make_blockchain(database_uri),
+                             [_record('p1', 'd1'), _record('p2', 'd2')], [_record('p1', 'd3')])
+    
+    reopened = make_blockchain(database_uri, None)
+    assert [block.hash for block in reopened.chain] == [block.hash for block in blockchain.chain]
+    assert reopened.total_transactions == 3
+    assert reopened.block_store.stats()['cached_blocks'] == 0
+    assert reopened.chain[2].data == [_record('p1', 'd3')]
+    assert reopened.chain[1].data == [_record('p1', 'd1'), _record('p2', 'd2')]
+
+
+def test_patient_search_after_restart_and_mine(make_blockchain, mine_blocks, database_uri):
+    """Açılıştan sonra kazılan bloklar kalıcı hasta indeksine yazılsa da aramada bir kez görünür"""
+    mine_blocks(make_blockchain(database_uri), [_record('p1', 'd1')])
+    
+    blockchain = mine_blocks(make_blockchain(database_uri), [_record('p1', 'd2')])
+    assert _patient_hits(blockchain, 'p1') == [(1, 'd1'), (2, 'd2')]
+    
+    # Hasta indeksi yüklendikten sonra eklenen bloklar da tek kez eklenir
+    mine_blocks(blockchain, [_record('p1', 'd3'), _record('p2', 'd4')])
+    assert _patient_hits(blockchain, 'p1') == [(1, 'd1'), (2, 'd2'), (3, 'd3')]
+    assert _patient_hits(blockchain, 'p2') == [(3, 'd4')]
+    
+    reopened = make_blockchain(database_uri)
+    assert _patient_hits(reopened, 'p1') == [(1, 'd1'), (2, 'd2'), (3, 'd3')]
+
+
+def test_postings_persisted_before_first_query_are_not_rescanned(make_blockchain, mine_blocks, database_uri):
+    """Kalıcı kopyaya yazılan bloklar ilk sorguda kopyadan okunur, zincirden yeniden taranmaz"""
+    mine_blocks(make_blockchain(database_uri), [_record('p1', 'd1')])
+    blockchain = mine_blocks(make_blockchain(database_uri), [_record('p1', 'd2')], [_record('p3', 'd3')])
+    assert not blockchain.chain_index.stats()['patient_index_ready']
+    assert blockchain.chain_index._postings_height == 3
+    
+    assert _patient_hits(blockchain, 'p3') == [(3, 'd3')]
+    assert _patient_hits(blockchain, 'p1') == [(1, 'd1'), (2, 'd2')]
+
+
+def test_stale_postings_are_rebuilt(make_blockchain, mine_blocks, database_uri, tmp_path):
+    """Kaydedildiği uç hash'i zincirle uyuşmayan kalıcı hasta indeksi silinip zincirden kurulur"""
+    mine_blocks(make_blockchain(database_uri), [_record('p1', 'd1')], [_record('p1', 'd2')])
+    with sqlite3.connect(str(tmp_path / 'chain.db')) as conn:
+        conn.execute("UPDATE index_state SET tip_hash = ? WHERE name = 'patient_postings'", ('00' * 32,))
+        conn.execute("INSERT INTO patient_postings VALUES ('p9', 1, 0)")
+    
+    blockchain = make_blockchain(database_uri)
+    assert _patient_hits(blockchain, 'p1') == [(1, 'd1'), (2, 'd2')]
+    assert _patient_hits(blockchain, 'p9') == []
@@ -0,0 +1,129 @@
+# Mempool stres testi - Eşzamanlı eklemelerde her kaydın tam olarak bir bloğa girdiğini doğrular
+import random
+import threading
+import time
+from collections import Counter
+
+from mempool import Mempool
+
+WRITERS = 16
+RECORDS_PER_WRITER = 500
+WRITE_PAUSE_EVERY = 10  # Yazıcılar ara sıra bekler; eklemeler birçok madencilik turuna yayılır
+
+
+def _record(writer, number):
+    return {'record_id': f"w{writer}-{number}", 'patient_id': f"patient_{writer:03d}", 'spo2': 90 + number % 10}
+
+
+def _run_writers(add, writers=WRITERS, records=RECORDS_PER_WRITER):
+    """Yazıcı iş parçacıklarını başlatır; hepsi aynı anda eklemeye başlar"""
+    barrier = threading.Barrier(writers)
+    
+    def write(writer):
+        barrier.wait()
+        for number in range(records):
+            add(_record(writer, number))
+            if number % WRITE_PAUSE_EVERY == 0:
+                time.sleep(0.001)
+    
+    threads = [threading.Thread(target=write, args=(writer,)) for writer in range(writers)]
+    for thread in threads:
+        thread.start()
+    return threads
+
+
+def _expected_ids():
+    return {f"w{writer}-{number}" for writer in range(WRITERS) for number in range(RECORDS_PER_WRITER)}
+
+
+def test_release_keeps_arrival_order():
+    """Geri verilen kayıtlar sonraki ayırmada yeni gelenlerin önünde yer alır"""
+    pool = Mempool(shards=4)
+    for number in range(5):
+        pool.add({'n': number})
+    batch = pool.take()
+    pool.add({'n': 5})
+    assert len(pool) == 6
+    pool.release(batch)
+    
+    batch = pool.take(limit=4)
+    assert [record['n'] for record in batch.records] == [0, 1, 2, 3]
+    pool.commit(batch)
+    assert [record['n'] for record in pool.records()] == [4, 5]
+    assert len(pool) == 2
+
+
+def test_concurrent_take_commit_release():
+    """Yazıcılar eklerken ayıran iş parçacıkları rastgele düşer ya da geri verir; kayıp ve tekrar olmaz"""
+    pool = Mempool()
+    committed = []
+    committed_lock = threading.Lock()
+    writers_done = threading.Event()
+    
+    def take_loop(seed):
+        rng = random.Random(seed)
+        while not (writers_done.is_set() and not pool):
+            batch = pool.take(limit=rng.choice([None, 50]))
+            if batch is None:
+                continue
+            if rng.random() < 0.3:
+                pool.release(batch)
+                continue
+            with committed_lock:
+                committed.extend(record['record_id'] for record in batch.records)
+            pool.commit(batch)
+    
+    takers = [threading.Thread(target=take_loop, args=(seed,)) for seed in range(4)]
+    for thread in takers:
+        thread.start()
+    for thread in _run_writers(pool.add):
+        thread.join()
+    writers_done.set()
+    for thread in takers:
+        thread.join()
+    
+    assert len(committed) == WRITERS * RECORDS_PER_WRITER
+    assert set(committed) == _expected_ids()
+    assert len(pool) == 0 and pool.stats()['reserved_batches'] == 0
+
+
+def _mine_concurrently(blockchain, restart_on_new_data, miners):
+    blockchain.restart_on_new_data = restart_on_new_data
+    writers_done = threading.Event()
+    
+    def mine_loop():
+        while not (writers_done.is_set() and not blockchain.mempool):
+            blockchain.mine_pending_data()
+    
+    miner_threads = [threading.Thread(target=mine_loop) for _ in range(miners)]
+    for thread in miner_threads:
+        thread.start()
+    for thread in _run_writers(blockchain.add_pending_data):
+        thread.join()
+    writers_done.set()
+    for thread in miner_threads:
+        thread.join()
+    return blockchain
+
+
+def _assert_every_record_in_one_block(blockchain):
+    counts = Counter(record['record_id'] for block in blockchain.chain[1:] for record in block.data)
+    assert set(counts) == _expected_ids()
+    assert max(counts.values()) == 1
+    assert blockchain.total_transactions == WRITERS * RECORDS_PER_WRITER
+    assert len(blockchain.mempool) == 0 and blockchain.pending_data == []
+    assert blockchain.verify_chain(full=True)['valid']
+
+
+def test_mining_during_ingestion(make_blockchain):
+    """Madencilik sürerken gelen kayıtlar kaybolmaz ve her biri tek bir bloğa girer"""
+    blockchain = _mine_concurrently(make_blockchain(difficulty_bits=12), restart_on_new_data=False, miners=1)
+    _assert_every_record_in_one_block(blockchain)
+
+
+def test_concurrent_miners_with_restarts(make_blockchain):
+    """Yeni veriyle yeniden başlatılan ve aynı uçta yarışan madencilerde de kayıt tekrarlanmaz"""
+    blockchain = _mine_concurrently(make_blockchain(difficulty_bits=12), restart_on_new_data=True, miners=3)
+    _assert_every_record_in_one_block(blockchain)
+    heights = [block.index for block in blockchain.chain]
+    assert heights == list(range(len(blockchain.chain)))
@@ -0,0 +1,91 @@
+# Merkle kanıtı testi - Her kayıt, tek sayıda yaprakta sondaki kayıt dahil, blok köküne kanıtla bağlanır
+import hashlib
+
+import pytest
+
+from merkle import LEFT, RIGHT, merkle_proof, merkle_root, verify_merkle_proof
+from mining import block_hash_prefix
+
+
+def _records(count):
+    return [{'record_id': f"rec_{i}", 'patient_id': f"patient_{i % 3:03d}", 'spo2': 90 + i} for i in range(count)]
+
+
+def test_every_position_verifies():
+    """1-9 kayıtlı bloklarda her sıradaki kaydın kanıtı köke ulaşır"""
+    for count in range(1, 10):
+        records = _records(count)
+        root = merkle_root(records)
+        for position, record in enumerate(records):
+            proof = merkle_proof(records, position)
+            assert verify_merkle_proof(record, proof, root)
+            assert len(proof) <= max(1, (count - 1).bit_length())
+
+
+def test_odd_trailing_leaf():
+    """Tek sayıda yaprakta sondaki kayıt kopyalanmadan üst seviyeye taşınır"""
+    records = _records(5)
+    root = merkle_root(records)
+    
+    # 5. kaydın ilk iki seviyede kardeşi yoktur; tek adım soldaki dört kaydın alt ağacıdır
+    proof = merkle_proof(records, 4)
+    assert [step['side'] for step in proof] == [LEFT]
+    assert verify_merkle_proof(records[4], proof, root)
+    
+    proof = merkle_proof(_records(3), 2)
+    assert [step['side'] for step in proof] == [LEFT]
+    
+    # Son kaydı tekrarlayan liste farklı köke sahiptir (kopyalamalı ağaçlardaki çakışma yok)
+    assert merkle_root(records + [records[-1]]) != root
+    assert merkle_root(records[:4]) != root
+
+
+def test_tampered_proofs_fail():
+    """Değiştirilmiş kayıt, kardeş hash'i ya da taraf bilgisiyle kanıt geçersizdir"""
+    records = _records(6)
+    root = merkle_root(records)
+    proof = merkle_proof(records, 3)
+    
+    assert not verify_merkle_proof(dict(records[3], spo2=0), proof, root)
+    assert not verify_merkle_proof(records[2], proof, root)
+    
+    flipped = [dict(step, side=RIGHT if step['side'] == LEFT else LEFT) for step in proof]
+    assert not verify_merkle_proof(records[3], flipped, root)
+    
+    forged = [dict(proof[0], hash='00' * 32)] + proof[1:]
+    assert not verify_merkle_proof(records[3], forged, root)
+    assert not verify_merkle_proof(records[3], [{'side': 'up', 'hash': proof[0]['hash']}], root)
+    assert not verify_merkle_proof(records[3], [{'side': LEFT, 'hash': 'xyz'}], root)
+
+
+def test_proof_position_out_of_range():
+    """Bloktaki kayıt sayısı dışındaki sıra için kanıt üretilmez"""
+    with pytest.raises(IndexError):
+        merkle_proof(_records(3), 3)
+    with pytest.raises(IndexError):
+        merkle_proof(_records(3), -1)
+
+
+def test_record_proof_links_to_chain_tip(make_blockchain):
+    """Zincirden alınan kanıt: kayıt -> Merkle kökü -> blok hash'i -> sonraki başlıklar -> zincir ucu"""
+    blockchain = make_blockchain()
+    for count in (5, 2, 3):
+        for record in _records(count):
+            blockchain.add_pending_data(dict(record, record_id=f"{record['record_id']}_{count}"))
+        blockchain.mine_pending_data()
+    
+    for position in range(5):
+        result = blockchain.get_record_proof(1, position)
+        header = result['block_header']
+        assert verify_merkle_proof(result['medical_data'], result['proof'], header['merkle_root'],
+                                   result['hash_algorithm'])
+        
+        prefix = block_hash_prefix(header['index'], header['timestamp'], None, header['previous_hash'],
+                                   header['merkle_root'])
+        assert hashlib.sha256(prefix + b'%d' % header['nonce']).hexdigest() == header['hash']
+        
+        previous = header['hash']
+        for next_header in result['headers']:
+            assert next_header['previous_hash'] == previous
+            previous = next_header['hash']
+        assert previous == blockchain.chain[-1].hash
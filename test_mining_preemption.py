@@ -0,0 +1,98 @@
+# Madencilik kesme testi - İptal edilen ya da yeniden başlatılan madencilikte ayrılan kayıtlar havuza geri döner
+import threading
+
+import pytest
+
+from config import Config
+from mining import MiningCancelled, MiningCancelToken
+
+SLOW_BITS = 28  # Test süresince blok bulunamayacak kadar yüksek zorluk
+
+
+def _record(record_id):
+    return {'record_id': record_id, 'patient_id': 'patient_001', 'spo2': 95}
+
+
+def _start_mining(blockchain):
+    """Madenciliği arka planda başlatır; ilk nonce parçası denenince döner"""
+    started = threading.Event()
+    outcome = {}
+    
+    def mine():
+        try:
+            outcome['block'] = blockchain.mine_pending_data(progress_callback=lambda hashes: started.set())
+        except MiningCancelled as e:
+            outcome['error'] = e
+    
+    thread = threading.Thread(target=mine)
+    thread.start()
+    assert started.wait(timeout=30)
+    return thread, outcome
+
+
+def _pending_ids(blockchain):
+    return [record['record_id'] for record in blockchain.pending_data]
+
+
+def test_hash_budget_releases_batch(make_blockchain):
+    """Hash bütçesi biten madencilik hata verir; kayıtlar sırasıyla bekler ve sonra kazılır"""
+    blockchain = make_blockchain(difficulty_bits=SLOW_BITS)
+    for record_id in ('r1', 'r2'):
+        blockchain.add_pending_data(_record(record_id))
+    
+    with pytest.raises(MiningCancelled) as excinfo:
+        blockchain.mine_pending_data(max_hashes=1000)
+    assert excinfo.value.reason == MiningCancelToken.HASH_BUDGET
+    assert _pending_ids(blockchain) == ['r1', 'r2']
+    assert blockchain.mempool.stats()['reserved_batches'] == 0 and len(blockchain.chain) == 1
+    
+    blockchain.set_difficulty_bits(4)
+    assert [record['record_id'] for record in blockchain.mine_pending_data().data] == ['r1', 'r2']
+    assert blockchain.pending_data == []
+
+
+def test_cancel_releases_batch(make_blockchain):
+    """Dışarıdan durdurulan madencilik yeniden başlamaz; ayrılan kayıtlar havuza döner"""
+    blockchain = make_blockchain(difficulty_bits=SLOW_BITS)
+    blockchain.add_pending_data(_record('r1'))
+    thread, outcome = _start_mining(blockchain)
+    
+    blockchain.add_pending_data(_record('r2'))
+    assert blockchain.cancel_mining()
+    thread.join()
+    assert outcome['error'].reason == MiningCancelToken.CANCELLED
+    assert _pending_ids(blockchain) == ['r1', 'r2']
+    assert blockchain.mempool.stats()['reserved_batches'] == 0 and len(blockchain.chain) == 1
+    assert not blockchain.cancel_mining()
+
+
+def test_restarts_pick_up_new_data_and_difficulty(make_blockchain):
+    """Yeni veri ve zorluk değişikliği madenciliği yeniden başlatır; blok tüm kayıtları bir kez içerir"""
+    blockchain = make_blockchain(difficulty_bits=SLOW_BITS)
+    blockchain.restart_on_new_data = True
+    blockchain.add_pending_data(_record('r1'))
+    thread, outcome = _start_mining(blockchain)
+    
+    blockchain.add_pending_data(_record('r2'))
+    blockchain.set_difficulty_bits(4)
+    thread.join()
+    
+    block = outcome['block']
+    assert [record['record_id'] for record in block.data] == ['r1', 'r2']
+    assert block.difficulty_bits == 4 and blockchain.chain[-1] is block
+    assert blockchain.pending_data == [] and blockchain.mempool.stats()['reserved_batches'] == 0
+    assert blockchain.verify_chain(full=True)['valid']
+
+
+def test_restart_limit_stops_preemption(make_blockchain, monkeypatch):
+    """Yeniden başlatma sınırına ulaşan madencilik kesilmez; yalnızca açık iptal durdurur"""
+    monkeypatch.setattr(Config, 'MINING_MAX_RESTARTS', 0)
+    blockchain = make_blockchain(difficulty_bits=SLOW_BITS)
+    blockchain.add_pending_data(_record('r1'))
+    thread, outcome = _start_mining(blockchain)
+    
+    assert not blockchain.preempt_mining(MiningCancelToken.PENDING_DATA_CHANGED)
+    assert blockchain.cancel_mining()
+    thread.join()
+    assert outcome['error'].reason == MiningCancelToken.CANCELLED
+    assert _pending_ids(blockchain) == ['r1']
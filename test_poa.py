@@ -0,0 +1,77 @@
+# Proof-of-Authority testi - Mühürlenen bloklar yetkili imzayla doğrulanır; yetkisiz, bozuk ve kanıtsız bloklar reddedilir
+from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
+
+from block import Block
+from chain_verifier import check_block
+from consensus import AuthoritySet, AuthoritySigner
+
+
+def _signer():
+    return AuthoritySigner(Ed25519PrivateKey.generate())
+
+
+def _records(height):
+    return [{'record_id': f"r{height}_{i}", 'patient_id': 'patient_001', 'spo2': 90 + i} for i in range(2)]
+
+
+def _poa_chain(make_blockchain, mine_blocks, signer, database_uri=None, blocks=3):
+    blockchain = make_blockchain(database_uri, None, consensus='poa', signer=signer)
+    return mine_blocks(blockchain, *(_records(height) for height in range(1, blocks + 1)))
+
+
+def test_sealed_blocks_verify(make_blockchain, mine_blocks, database_uri):
+    """PoA blokları nonce araması olmadan yerel anahtarla imzalanır; zincir açılışta da doğrulanır"""
+    signer = _signer()
+    blockchain = _poa_chain(make_blockchain, mine_blocks, signer, database_uri)
+    
+    for block in blockchain.chain[1:]:
+        assert block.is_sealed() and block.signer == signer.signer_id
+        assert block.nonce == 0 and block.difficulty_bits is None
+        assert block.verify_seal(blockchain.authority_set)
+        assert check_block(block, blockchain.authority_set) is None
+    assert blockchain.verify_chain(full=True)['valid']
+    
+    reopened = make_blockchain(database_uri, None, consensus='poa', signer=signer, boot_verification='full')
+    assert reopened.boot_verification['valid']
+    assert [block.signature for block in reopened.chain] == [block.signature for block in blockchain.chain]
+
+
+def test_unauthorized_signer_is_rejected(make_blockchain, mine_blocks):
+    """Yetkili kümede olmayan anahtarın imzası ve başka anahtar adına konan imza kabul edilmez"""
+    signer = _signer()
+    outsider = _signer()
+    blockchain = _poa_chain(make_blockchain, mine_blocks, signer)
+    block = blockchain.chain[2]
+    
+    assert check_block(block, AuthoritySet([outsider.signer_id])) == "geçersiz ya da yetkisiz imza"
+    assert check_block(block, AuthoritySet([outsider.signer_id, signer.signer_id])) is None
+    
+    block.signer, block.signature = outsider.signer_id, outsider.sign(block.hash)
+    assert check_block(block, blockchain.authority_set) == "geçersiz ya da yetkisiz imza"
+    
+    block.signer, block.signature = signer.signer_id, outsider.sign(block.hash)
+    report = blockchain.verify_chain(full=True)
+    assert not report['valid'] and report['first_invalid_index'] == 2
+
+
+def test_tampered_sealed_block_fails(make_blockchain, mine_blocks):
+    """Mühürden sonra değişen başlık hash'i, yeniden hesaplanan hash ise imzayı bozar"""
+    blockchain = _poa_chain(make_blockchain, mine_blocks, _signer())
+    block = blockchain.chain[1]
+    
+    block.timestamp = '2024-01-01T00:00:00'
+    assert check_block(block, blockchain.authority_set) == "geçersiz hash"
+    
+    block.hash = block.calculate_hash()
+    assert check_block(block, blockchain.authority_set) == "geçersiz ya da yetkisiz imza"
+    assert blockchain.verify_chain(full=True)['first_invalid_index'] == 1
+
+
+def test_unsigned_block_needs_proof_of_work():
+    """İmzasız blok PoA zincirinde de en az MIN_DIFFICULTY_BITS sıfır bitle kazılmış olmalıdır"""
+    block = Block(1, '2024-01-01T10:00:00', _records(1), '0' * 64, version=Block.MERKLE_VERSION)
+    while block.get_leading_zero_bits() >= 4:
+        block.nonce += 1
+        block.hash = block.calculate_hash()
+    
+    assert check_block(block, AuthoritySet([_signer().signer_id])) == "imzasız ve PoW kanıtı yok"
@@ -0,0 +1,108 @@
+# Zaman aralığı sayfalama testi - Cursor ile gezilen sayfalar kayıtları eksiksiz, tekrarsız ve zaman sırasıyla verir
+import pytest
+
+# Bloklar zaman sırasıyla gelmez; aynı zaman damgası farklı blok ve sıralarda tekrarlanır
+BLOCK_TIMESTAMPS = [
+    ['2024-01-01T23:00:05', '2024-01-01T23:00:01', '2024-01-01T23:00:03', '2024-01-01T23:00:03'],
+    ['2024-01-01T23:00:02', '2024-01-01T23:00:03', None, '2024-01-01T23:00:00'],
+    ['2024-01-01T23:00:03', '2024-01-01T23:00:04', '2024-01-01T23:00:06']
+]
+
+
+@pytest.fixture
+def blockchain(make_blockchain):
+    return _mine(make_blockchain(), BLOCK_TIMESTAMPS)
+
+
+def _mine(blockchain, block_timestamps):
+    for timestamps in block_timestamps:
+        for number, timestamp in enumerate(timestamps):
+            record = {'record_id': f"r{len(blockchain.chain)}_{number}", 'patient_id': f"patient_{number % 2:03d}"}
+            if timestamp:
+                record['timestamp'] = timestamp
+            blockchain.add_pending_data(record)
+        blockchain.mine_pending_data()
+    return blockchain
+
+
+def _expected(blockchain, start=None, end=None, patient_id=None):
+    """Tüm zincir taranarak beklenen (timestamp, blok, sıra) sırası"""
+    keys = []
+    for block in blockchain.chain[1:]:
+        for position, record in enumerate(block.data):
+            timestamp = record.get('timestamp')
+            if not timestamp or (patient_id and record['patient_id'] != patient_id):
+                continue
+            if (start and timestamp < start) or (end and timestamp >= end):
+                continue
+            keys.append((timestamp, block.index, position))
+    return sorted(keys)
+
+
+def _walk(blockchain, limit, **filters):
+    """Tüm sayfaları cursor ile gezer; (sayfalar, anahtarlar) döndürür"""
+    pages, keys, cursor = [], [], None
+    while True:
+        page = blockchain.query_records_by_time(limit=limit, cursor=cursor, **filters)
+        pages.append(page)
+        keys.extend((result['medical_data']['timestamp'], result['block_index'], result['position'])
+                    for result in page['records'])
+        cursor = page['next_cursor']
+        if cursor is None:
+            return pages, keys
+
+
+def test_pages_cover_range_in_time_order(blockchain):
+    """Her sayfa boyutunda sayfalar birleşince tarama ile aynı sıra elde edilir"""
+    expected = _expected(blockchain)
+    assert len(expected) == 10
+    for limit in range(1, 12):
+        pages, keys = _walk(blockchain, limit)
+        assert keys == expected
+        assert all(len(page['records']) == limit for page in pages[:-1])
+        # Kayıt sayısı sayfa boyutunun katıysa sonda boş sayfa kalmaz
+        assert pages[-1]['records']
+
+
+def test_equal_timestamps_split_across_pages(blockchain):
+    """Aynı zaman damgalı kayıtlar sayfa sınırında bölünse de atlanmaz ve tekrarlanmaz"""
+    page = blockchain.query_records_by_time(start='2024-01-01T23:00:03', limit=2)
+    assert [(r['block_index'], r['position']) for r in page['records']] == [(1, 2), (1, 3)]
+    assert page['next_cursor'] == '1:3:2024-01-01T23:00:03'
+    page = blockchain.query_records_by_time(start='2024-01-01T23:00:03', limit=2, cursor=page['next_cursor'])
+    assert [(r['block_index'], r['position']) for r in page['records']] == [(2, 1), (3, 0)]
+
+
+def test_bounds_and_patient_filter(blockchain):
+    """Aralık [start, end) şeklindedir; hasta filtresi kendi zaman indeksini kullanır"""
+    bounds = {'start': '2024-01-01T23:00:01', 'end': '2024-01-01T23:00:04'}
+    assert _walk(blockchain, 2, **bounds)[1] == _expected(blockchain, **bounds)
+    assert _walk(blockchain, 2, patient_id='patient_001')[1] == _expected(blockchain, patient_id='patient_001')
+    assert _walk(blockchain, 1, patient_id='patient_000', **bounds)[1] == \
+        _expected(blockchain, patient_id='patient_000', **bounds)
+    assert blockchain.query_records_by_time(patient_id='patient_999') == {'records': [], 'next_cursor': None}
+    assert blockchain.query_records_by_time(start='2024-01-02T00:00:00')['records'] == []
+
+
+def test_cursor_survives_new_blocks(blockchain):
+    """Cursor verildikten sonra eklenen bloklardaki sonraki kayıtlar sonraki sayfalarda görünür"""
+    first = blockchain.query_records_by_time(limit=4)
+    _mine(blockchain, [['2024-01-01T23:00:07', '2024-01-01T23:00:00']])
+    
+    keys = [(r['medical_data']['timestamp'], r['block_index'], r['position']) for r in first['records']]
+    cursor = first['next_cursor']
+    while cursor:
+        page = blockchain.query_records_by_time(limit=4, cursor=cursor)
+        keys.extend((r['medical_data']['timestamp'], r['block_index'], r['position']) for r in page['records'])
+        cursor = page['next_cursor']
+    
+    # Cursor'dan önceki zamana düşen yeni kayıt bu gezintide görünmez; sonrakiler eksiksiz gelir
+    expected = _expected(blockchain)
+    assert keys == [key for key in expected if key != ('2024-01-01T23:00:00', 4, 1)]
+
+
+def test_invalid_cursor(blockchain):
+    """Çözülemeyen cursor ValueError verir"""
+    for cursor in ('abc', '1:x:2024-01-01T23:00:03', '1'):
+        with pytest.raises(ValueError):
+            blockchain.query_records_by_time(cursor=cursor)
@@ -0,0 +1,139 @@
+# RecordBatch testi - Sütunlu gösterim sözlük listesiyle birebir eşittir ve saklanan kayıtları dışarı sızdırmaz
+import json
+import pickle
+import sys
+
+import pytest
+
+import record_batch
+from record_batch import CONSTANT, OBJECTS, RecordBatch, plain_records, record_column
+
+
+def _records(count):
+    return [{
+        'data_id': f"ox_data_{i:06d}",
+        'patient_id': f"patient_{i % 3:03d}",
+        'data_type': 'OXIMETER',
+        'value': None,
+        'spo2_value': 85.0 + i / 10,
+        'bpm_value': 60 + i,
+        'is_processed': i % 2 == 0,
+        'note': 'kısa' if i % 2 else 'çok daha uzun bir açıklama metni ğüşıöç'
+    } for i in range(count)]
+
+
+def _copy(records):
+    return json.loads(json.dumps(records))
+
+
+def test_batch_equals_source_records():
+    """to_list, iterasyon, sütun erişimi ve karşılaştırma kaynak sözlük listesiyle aynıdır"""
+    records = _records(25)
+    batch = RecordBatch.from_records(_copy(records))
+    assert isinstance(batch, RecordBatch)
+    assert batch == records and records == batch
+    assert batch.to_list() == records and plain_records(batch) == records
+    assert [list(record) for record in batch] == [list(record) for record in records]
+    assert json.dumps(batch.to_list(), sort_keys=True) == json.dumps(records, sort_keys=True)
+    for key in records[0]:
+        assert record_column(batch, key) == [record[key] for record in records]
+    assert batch.column('yok') == [None] * 25
+    
+    assert batch != records[:-1]
+    assert batch != records[:-1] + [dict(records[-1], bpm_value=0)]
+
+
+def test_indexing_and_slicing():
+    """Tekil, negatif ve dilim erişimi listeyle aynı sonucu verir"""
+    records = _records(10)
+    batch = RecordBatch.from_records(_copy(records))
+    for index in range(-10, 10):
+        assert batch[index] == records[index]
+    for window in (slice(2, 5), slice(None, None, -1), slice(-3, None), slice(1, 9, 3), slice(20, 30)):
+        assert batch[window] == records[window]
+    for index in (10, -11):
+        with pytest.raises(IndexError):
+            batch[index]
+
+
+def test_returned_records_are_independent():
+    """Dönen sözlükler değiştirilse de saklanan kayıtlar ve sonraki erişimler etkilenmez"""
+    records = _records(4)
+    batch = RecordBatch.from_records(_copy(records))
+    record = batch[1]
+    record['spo2_value'] = 0.0
+    record['yeni'] = True
+    assert batch[1] == records[1]
+    
+    for record in batch:
+        record.clear()
+    listed = batch.to_list()
+    listed[0]['patient_id'] = 'değişti'
+    assert batch == records
+
+
+def test_nested_values_are_deep_copied():
+    """Liste/sözlük değerli sütunlar, tüm kayıtlarda aynı olsalar bile her erişimde yeniden kopyalanır"""
+    records = [{'source': 'oximeter', 'tags': ['gece', 'apne'], 'meta': {'device': {'id': i}}} for i in range(3)]
+    batch = RecordBatch.from_records(_copy(records))
+    # Tüm kayıtlarda aynı olan liste tek nesne olarak paylaşılmaz
+    assert batch._kinds == (CONSTANT, OBJECTS, OBJECTS)
+    
+    record = batch[0]
+    record['tags'].append('eklendi')
+    record['meta']['device']['id'] = 99
+    batch[1]['tags'].clear()
+    for record in batch:
+        record['meta']['device']['id'] = -1
+    batch.column('tags')[2].append('sütun')
+    batch.to_list()[2]['meta']['device'].clear()
+    assert batch == records
+    assert batch[0]['tags'] is not batch[0]['tags']
+
+
+def test_non_uniform_records_are_left_as_list():
+    """Farklı anahtarlı, sözlük olmayan ya da boş veri RecordBatch'e çevrilmez"""
+    for data in ([{'a': 1}, {'b': 2}], [{'a': 1, 'b': 2}, {'b': 2, 'a': 1}], [{'a': 1}, 'metin'], [],
+                 {'message': 'genesis'}):
+        assert RecordBatch.from_records(data) is data
+    assert RecordBatch.from_columns((), [], 3) == [{}, {}, {}]
+
+
+def test_row_cache_is_bounded(monkeypatch):
+    """İndeksle erişimde üretilen sözlük önbelleği sınırı aşmaz; çıkarılan kayıtlar yeniden üretilir"""
+    monkeypatch.setattr(record_batch, 'ROW_CACHE_RECORDS', 8)
+    records = _records(5)
+    batches = [RecordBatch.from_records(_copy(records)) for _ in range(4)]
+    for batch in batches:
+        for index in range(len(batch)):
+            assert batch[index] == records[index]
+            assert record_batch._row_cache_records <= 8
+    
+    # En eski parti önbellekten çıkarılmıştır; erişimler yine doğru sonuç verir
+    assert batches[0]._cache_key not in record_batch._row_cache
+    assert batches[0][4] == records[4]
+    assert record_batch._row_cache_records <= 8
+
+
+def test_row_cache_does_not_keep_batches_alive():
+    """Önbellek partiye başvurmaz; satırı önbellekte olan parti bırakılınca sütunları da bırakılır"""
+    batch = RecordBatch.from_records(_copy(_records(6)))
+    references = sys.getrefcount(batch)
+    columns = batch._columns
+    assert batch[2] == _records(6)[2]
+    assert sys.getrefcount(batch) == references
+    
+    column_references = sys.getrefcount(columns)
+    del batch
+    assert sys.getrefcount(columns) == column_references - 1
+
+
+def test_pickled_batch_gets_its_own_cache_key():
+    """Süreçler arası kopya önbellek anahtarını taşımaz; kopyanın satırları asıl partiyle karışmaz"""
+    records = _records(4)
+    batch = RecordBatch.from_records(_copy(records))
+    assert batch[1] == records[1]
+    copy = pickle.loads(pickle.dumps(batch))
+    assert copy._cache_key is None
+    assert copy == records and copy[1] == records[1]
+    assert copy._cache_key != batch._cache_key
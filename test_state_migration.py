@@ -0,0 +1,102 @@
+# Eski kayıt taşıma testi - Tek satırlık blockchain_state JSON'u blok satırlarına bir kez ve kayıpsız taşınır
+import hashlib
+import json
+import sqlite3
+
+from block import GenesisBlock
+from database import DatabaseManager
+
+LEGACY_DIFFICULTY = 2
+
+
+def _legacy_block(index, timestamp, data, previous_hash, nonce, block_hash):
+    """Değişiklik öncesi Block.to_dict biçimi"""
+    return {
+        'index': index,
+        'timestamp': timestamp,
+        'data': data,
+        'previous_hash': previous_hash,
+        'hash': block_hash,
+        'nonce': nonce,
+        'leading_zeros': len(block_hash) - len(block_hash.lstrip('0'))
+    }
+
+
+def _legacy_mine(index, timestamp, data, previous_hash):
+    """Eski formatta (sort_keys JSON, hex sıfır zorluğu) blok üretir"""
+    prefix = f"{index}{timestamp}{json.dumps(data, sort_keys=True)}{previous_hash}"
+    nonce = 0
+    while True:
+        block_hash = hashlib.sha256(f"{prefix}{nonce}".encode()).hexdigest()
+        if block_hash.startswith('0' * LEGACY_DIFFICULTY):
+            return _legacy_block(index, timestamp, data, previous_hash, nonce, block_hash)
+        nonce += 1
+
+
+def _legacy_chain():
+    genesis = GenesisBlock()
+    chain = [_legacy_block(0, genesis.timestamp, genesis.data, genesis.previous_hash, genesis.nonce, genesis.hash)]
+    payloads = [
+        [{'data_id': f"ox_{i}", 'patient_id': f"patient_{i % 2:03d}", 'spo2_value': 90.5 + i, 'bpm_value': 70,
+          'timestamp': f"2024-01-01T23:00:{i:02d}", 'is_processed': False} for i in range(3)],
+        [{'record_id': 'apnea_1', 'patient_id': 'patient_001', 'tags': ['gece'], 'value': None}],
+        [{'data_id': 'ox_9', 'patient_id': 'patient_000', 'spo2_value': 88.0}, {'note': 'farklı şema'}]
+    ]
+    for index, data in enumerate(payloads, start=1):
+        chain.append(_legacy_mine(index, f"2024-01-0{index}T10:00:00", data, chain[-1]['hash']))
+    return chain
+
+
+def test_legacy_state_is_migrated_to_block_rows(make_blockchain, database_uri, tmp_path):
+    """Eski JSON kaydı blok satırlarına taşınır; hash'ler, kayıtlar ve zorluk korunur, eski satır silinir"""
+    legacy = _legacy_chain()
+    database = DatabaseManager(database_uri)
+    assert database.save_blockchain_state(json.dumps({'chain': legacy, 'difficulty': LEGACY_DIFFICULTY}, indent=2),
+                                          LEGACY_DIFFICULTY)
+    
+    blockchain = make_blockchain(database_uri, None, boot_verification='full')
+    assert blockchain.boot_verification['valid']
+    assert [block.hash for block in blockchain.chain] == [block['hash'] for block in legacy]
+    assert [block.data for block in blockchain.chain] == [block['data'] for block in legacy]
+    assert blockchain.difficulty == LEGACY_DIFFICULTY and blockchain.hash_algorithm == 'sha256'
+    assert blockchain.total_transactions == 6
+    assert blockchain.get_block_by_hash(legacy[2]['hash']).data == legacy[2]['data']
+    
+    with sqlite3.connect(str(tmp_path / 'chain.db')) as conn:
+        assert conn.execute('SELECT COUNT(*) FROM blockchain_state').fetchone()[0] == 0
+        assert conn.execute('SELECT COUNT(*) FROM blocks').fetchone()[0] == len(legacy)
+        assert [row[0] for row in conn.execute('SELECT block_hash FROM blocks ORDER BY block_index')] == \
+            [block['hash'] for block in legacy]
+
+
+def test_migration_runs_once_and_chain_keeps_growing(make_blockchain, database_uri):
+    """Taşınan zincire yeni bloklar eklenir; sonraki açılışlarda taşıma tekrarlanmaz"""
+    legacy = _legacy_chain()
+    DatabaseManager(database_uri).save_blockchain_state(json.dumps({'chain': legacy, 'difficulty': 2}), 2)
+    
+    blockchain = make_blockchain(database_uri, boot_verification='full')
+    blockchain.add_pending_data({'record_id': 'yeni', 'patient_id': 'patient_001'})
+    assert blockchain.mine_pending_data()
+    assert DatabaseManager(database_uri).migrate_blockchain_state() == 0
+    
+    reopened = make_blockchain(database_uri, None, boot_verification='full')
+    assert reopened.boot_verification['valid']
+    assert [block.hash for block in reopened.chain] == [block.hash for block in blockchain.chain]
+    assert reopened.chain[-1].previous_hash == legacy[-1]['hash']
+    assert reopened.chain[-1].data == [{'record_id': 'yeni', 'patient_id': 'patient_001'}]
+    
+    # Blok tablosu doluyken sonradan yazılan eski kayıt zinciri değiştirmez
+    DatabaseManager(database_uri).save_blockchain_state(json.dumps({'chain': legacy[:2], 'difficulty': 2}), 2)
+    assert len(make_blockchain(database_uri, None).chain) == len(legacy) + 1
+
+
+def test_corrupt_legacy_state_is_left_untouched(database_uri):
+    """Çözülemeyen eski kayıt taşınmaz ve silinmez; yarım blok satırı kalmaz"""
+    database = DatabaseManager(database_uri)
+    broken = _legacy_chain()
+    del broken[2]['hash']
+    database.save_blockchain_state(json.dumps({'chain': broken, 'difficulty': 2}), 2)
+    
+    assert database.migrate_blockchain_state() == 0
+    assert database.load_block_headers() == []
+    assert database.get_blockchain_state() is not None